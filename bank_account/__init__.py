@@ -3,5 +3,6 @@ from .bank_account import BankAccount
 from .chequing_account import ChequingAccount
 from .investment_account import InvestmentAccount
 from .savings_account import SavingsAccount
+from .velocity_limit import VelocityLimit, set_velocity_limits
 
-__all__= ["BankAccount", "ChequingAccount", "InvestmentAccount", "SavingsAccount"]
\ No newline at end of file
+__all__= ["BankAccount", "ChequingAccount", "InvestmentAccount", "SavingsAccount", "VelocityLimit", "set_velocity_limits"]
\ No newline at end of file
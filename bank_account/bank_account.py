@@ -7,6 +7,11 @@ Author: Lovedeep Singh Sidhu
 from abc import ABC, abstractmethod
 from datetime import date
 from patterns.observer.subject import Subject
+from utility.clock import clock
+from bank_account.velocity_limit import VelocityCounters, get_velocity_limits
+from bank_account.low_balance_alert import low_balance_alerts
+from patterns.observer.notification import (Notification, LOW_BALANCE, LARGE_TRANSACTION,
+                                            FEE_CHARGED, OVERDRAFT)
 
 # Defining the BankAccount class
 class BankAccount(Subject, ABC):
@@ -32,10 +37,13 @@ class BankAccount(Subject, ABC):
             Returns the account creation date.
         update_balance(self, amount):
             Updates the balance by adding the specified amount.
+        charge_fee(self, amount):
+            Debits a service charge from the account.
         deposit(self, amount):
             Deposits a positive amount into the account.
         withdraw(self, amount):
-            Withdraws a positive amount from the account.
+            Withdraws a positive amount from the account, subject to the velocity limits
+            of the account type.
         get_service_charges(self) -> float:
             Abstract method for calculating service charges based on account type.
     """
@@ -74,12 +82,15 @@ class BankAccount(Subject, ABC):
             self.__balance = 0  # Default to zero if balance is invalid
             
         # Set account creation date
-        self._date_created = date_created if isinstance(date_created, date) else date.today()
+        self._date_created = date_created if isinstance(date_created, date) else clock.today()
 
         # Define balance thresholds
         self.LOW_BALANCE_LEVEL: float = 50.0    
         self.LARGE_TRANSACTION_THRESHOLD: float = 9999.99
 
+        # Sliding-window withdrawal counters, created on the first limited withdrawal
+        self.__velocity_counters = None
+
     # Property accessors
     @property
     def account_number(self) -> int:
@@ -96,6 +107,11 @@ class BankAccount(Subject, ABC):
         """Returns the current balance."""
         return self.__balance
 
+    @property
+    def date_created(self) -> date:
+        """Returns the account creation date."""
+        return self._date_created
+
     # Balance update method
     def update_balance(self, amount):
         """
@@ -109,17 +125,46 @@ class BankAccount(Subject, ABC):
         """
         try:
             amount = float(amount)
-            self.__balance += amount  # Adjust balance
-            if self.__balance < self.LOW_BALANCE_LEVEL:
-                message = f"Low balance warning ${self.__balance:.2f}: on account {self.__account_number}."
-                self.notify(message)
+        except (TypeError, ValueError):
+            raise ValueError(f"Amount must be numeric. Invalid value: {amount}")
 
-            if amount > self.LARGE_TRANSACTION_THRESHOLD:
-                message = f"Large transaction ${amount:.2f}: on account {self.__account_number}." 
-                self.notify(message)
+        previous_balance = self.__balance
+        self.__balance += amount  # Adjust balance
 
-        except:
-            raise ValueError(f"Amount must be numeric. Invalid value: {amount}")
+        # Accounts without observers skip all notification work
+        if self._observers:
+            self.__notify_balance_change(amount, previous_balance)
+
+        # A recovery re-arms the low balance alert even while nobody is subscribed
+        if previous_balance < self.LOW_BALANCE_LEVEL <= self.__balance:
+            low_balance_alerts.rearm(self.__account_number)
+
+    def charge_fee(self, amount: float):
+        """
+        Debits a service charge from the account and notifies the fee subscribers.
+
+        Args:
+            amount (float): The service charge.
+
+        Raises:
+            ValueError: If amount is not a numeric value.
+        """
+        self.update_balance(-amount)
+        if self._observers and self.has_subscribers(FEE_CHARGED):
+            self.notify(Notification(FEE_CHARGED, self.__account_number, float(amount), self.__balance))
+
+    def __notify_balance_change(self, amount: float, previous_balance: float):
+        """Notifies the subscribers of each topic a balance change triggers."""
+        if (self.__balance < 0 <= previous_balance) and self.has_subscribers(OVERDRAFT):
+            self.notify(Notification(OVERDRAFT, self.__account_number, amount, self.__balance))
+
+        # Repeated warnings are suppressed until the balance recovers or the cooldown expires
+        if self.__balance < self.LOW_BALANCE_LEVEL and self.has_subscribers(LOW_BALANCE) \
+                and low_balance_alerts.should_alert(self.__account_number, self.__balance, self.LOW_BALANCE_LEVEL):
+            self.notify(Notification(LOW_BALANCE, self.__account_number, amount, self.__balance))
+
+        if amount > self.LARGE_TRANSACTION_THRESHOLD and self.has_subscribers(LARGE_TRANSACTION):
+            self.notify(Notification(LARGE_TRANSACTION, self.__account_number, amount, self.__balance))
 
     # Deposit method
     def deposit(self, amount: float):
@@ -149,7 +194,8 @@ class BankAccount(Subject, ABC):
             amount (float): Amount to withdraw.
 
         Raises:
-            ValueError: If the amount is non-numeric, non-positive, or exceeds balance.
+            ValueError: If the amount is non-numeric, non-positive, exceeds balance,
+                or exceeds a velocity limit for the account type.
         """
         if not isinstance(amount, (int, float)):
             raise ValueError(f"Withdraw amount: {amount} must be numeric.")
@@ -159,10 +205,21 @@ class BankAccount(Subject, ABC):
         
         if amount > self.__balance:
             raise ValueError(f"Withdrawal amount: ${amount:,.2f} exceeds balance: ${self.__balance:,.2f}")
+
+        # Check the rolling withdrawal limits for this account type
+        limits = get_velocity_limits(type(self))
+        if limits:
+            now = clock.time()
+            if self.__velocity_counters is None:
+                self.__velocity_counters = VelocityCounters()
+            self.__velocity_counters.check(limits, amount, now)
     
         # Deduct amount
         self.update_balance(-amount)
 
+        if limits:
+            self.__velocity_counters.record(limits, amount, now)
+
         """
     @abstractmethod
     def get_service_charges(self) -> float:
@@ -4,7 +4,8 @@ Author: Lovedeep Singh Sidhu
 """
 from bank_account.bank_account import BankAccount 
 from datetime import date
-from patterns.strategy.overdraft_strategy import OverdraftStrategy
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.strategy_factory import strategy_factory
 
 class ChequingAccount(BankAccount):
     """
@@ -60,7 +61,7 @@ class ChequingAccount(BankAccount):
         else:
             self.__overdraft_rate = 0.05  # Default overdraft rate
 
-        self.__strategy = OverdraftStrategy(self.__overdraft_limit, self.__overdraft_rate)
+        self.__strategy = strategy_factory.overdraft(self.__overdraft_limit, self.__overdraft_rate)
 
     def __str__(self) -> str:
         """Provides a string representation of the ChequingAccount."""
@@ -70,6 +71,11 @@ class ChequingAccount(BankAccount):
                 f"Overdraft Rate: {self.__overdraft_rate * 100:.2f}% "
                 f"Account Type: Chequing")
 
+    @property
+    def service_charge_strategy(self) -> ServiceChargeStrategy:
+        """Returns the strategy used to calculate the service charges."""
+        return self.__strategy
+
     def get_service_charges(self) -> float:
         """Calculates the service charges for the ChequingAccount.
 
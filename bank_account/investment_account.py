@@ -4,16 +4,18 @@ Author: Lovedeep Singh Sidhu
 Date: 06/10/2024
 """
 
-from datetime import date, timedelta, datetime
+from datetime import date, datetime
 from bank_account.bank_account import BankAccount
-from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.strategy_factory import strategy_factory
+from utility.clock import clock, TEN_YEARS_IN_DAYS
 
 class InvestmentAccount(BankAccount):
     """
     A class that represents an Investment Account.
 
     Attributes:
-        TEN_YEARS_AGO (date): A constant representing the date 10 years ago.
+        TEN_YEARS_AGO (date): The date 10 years ago, taken from the shared clock.
         management_fee (float): The management fee associated with the investment account.
 
     Methods:
@@ -43,9 +45,6 @@ class InvestmentAccount(BankAccount):
         Raises:
             ValueError: If account_number or client_number are not integers, or if balance is not a valid float.
         """
-        # Define the date for 10 years ago
-        self.TEN_YEARS_AGO = date.today() - timedelta(days=10 * 365.25)
-
         super().__init__(account_number, client_number, balance, date_created)
 
         # Set the management fee
@@ -54,7 +53,12 @@ class InvestmentAccount(BankAccount):
         except ValueError:
             self.__management_fee = 2.55  # Default management fee
 
-        self.__strategy = ManagementFeeStrategy(self._date_created, self.__management_fee)
+        self.__strategy = strategy_factory.management_fee(self.__management_fee)
+
+    @property
+    def TEN_YEARS_AGO(self) -> date:
+        """Returns the date from 10 years ago, which moves with the current date."""
+        return clock.days_ago(TEN_YEARS_IN_DAYS)
 
     def __str__(self) -> str:
         """Provides a string representation of the InvestmentAccount."""
@@ -77,6 +81,11 @@ class InvestmentAccount(BankAccount):
                 f"Management Fee: {fee} "
                 f"Account Type: Investment")
 
+    @property
+    def service_charge_strategy(self) -> ServiceChargeStrategy:
+        """Returns the strategy used to calculate the service charges."""
+        return self.__strategy
+
     def get_service_charges(self) -> float:
         """Calculates service charges for the InvestmentAccount.
 
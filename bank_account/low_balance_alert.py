@@ -0,0 +1,94 @@
+"""
+Description: This module defines the low balance alert filter, which coalesces repeated low
+balance warnings so that an account hovering below the threshold alerts its client once.
+Author: Lovedeep Singh Sidhu
+"""
+
+from utility.clock import clock
+from bank_account.velocity_limit import ONE_DAY
+
+class LowBalanceAlertFilter:
+    """
+    A class to represent the low balance alert filter.
+
+    An alert fires when an account's balance is first below the low balance level.
+    Repeats are suppressed until the balance recovers to the level or the cooldown
+    expires, whichever comes first. Only accounts currently below the level hold
+    state: a cooldown expiry time keyed by account number.
+
+    Attributes:
+        cooldown_seconds (float): How long repeats are suppressed after an alert.
+
+    Methods:
+        should_alert(self, account_number, balance, level) -> bool:
+            Returns whether a low balance alert should be sent.
+        rearm(self, account_number):
+            Lets the next drop below the level alert again.
+        reset(self):
+            Forgets every suppressed account.
+    """
+
+    __slots__ = ("__cooldown_seconds", "__suppressed_until")
+
+    def __init__(self, cooldown_seconds: float = ONE_DAY):
+        """
+        Initializes the filter.
+
+        Args:
+            cooldown_seconds (float): How long repeats are suppressed after an alert.
+
+        Raises:
+            ValueError: If the cooldown is negative.
+        """
+        if cooldown_seconds < 0:
+            raise ValueError("Alert cooldown cannot be negative.")
+        self.__cooldown_seconds = cooldown_seconds
+        self.__suppressed_until = {}
+
+    @property
+    def cooldown_seconds(self) -> float:
+        """Returns how long repeats are suppressed after an alert."""
+        return self.__cooldown_seconds
+
+    def __len__(self) -> int:
+        """Returns the number of accounts whose alerts are suppressed."""
+        return len(self.__suppressed_until)
+
+    def should_alert(self, account_number: int, balance: float, level: float) -> bool:
+        """
+        Returns whether a low balance alert should be sent for a new balance.
+
+        Args:
+            account_number (int): The account whose balance changed.
+            balance (float): The new balance.
+            level (float): The low balance level of the account.
+
+        Returns:
+            bool: True when the alert should be sent.
+        """
+        if balance >= level:
+            self.rearm(account_number)
+            return False
+
+        now = clock.time()
+        suppressed_until = self.__suppressed_until.get(account_number)
+        if suppressed_until is not None and now < suppressed_until:
+            return False
+        self.__suppressed_until[account_number] = now + self.__cooldown_seconds
+        return True
+
+    def rearm(self, account_number: int) -> None:
+        """
+        Lets the next drop below the level alert again, after a balance has recovered.
+
+        Args:
+            account_number (int): The account whose balance recovered.
+        """
+        self.__suppressed_until.pop(account_number, None)
+
+    def reset(self) -> None:
+        """Forgets every suppressed account."""
+        self.__suppressed_until.clear()
+
+# The filter shared by all bank accounts
+low_balance_alerts = LowBalanceAlertFilter()
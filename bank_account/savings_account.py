@@ -6,7 +6,8 @@ Date: 06/10/2024
 
 from bank_account.bank_account import BankAccount
 from datetime import date
-from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.strategy_factory import strategy_factory
 
 class SavingsAccount(BankAccount):
     """
@@ -49,7 +50,7 @@ class SavingsAccount(BankAccount):
             self.__minimum_balance = 50.00  # Assign a default value if the conversion fails
 
         # Set up the strategy for managing minimum balance service charges
-        self.__strategy = MinimumBalanceStrategy(self.__minimum_balance)
+        self.__strategy = strategy_factory.minimum_balance(self.__minimum_balance)
 
     def __str__(self) -> str:
         """Returns a detailed string representation of the SavingsAccount."""
@@ -57,6 +58,11 @@ class SavingsAccount(BankAccount):
                 f"Minimum Balance: ${self.__minimum_balance:.2f} "
                 f"Account Type: Savings")
 
+    @property
+    def service_charge_strategy(self) -> ServiceChargeStrategy:
+        """Returns the strategy used to calculate the service charges."""
+        return self.__strategy
+
     def get_service_charges(self) -> float:
         """Calculates the service charges applicable to the SavingsAccount.
 
@@ -0,0 +1,236 @@
+"""
+Description: This module defines the withdrawal velocity limits for each account type and the
+sliding-window counters used to enforce them.
+Author: Lovedeep Singh Sidhu
+"""
+
+from collections import deque
+
+ONE_HOUR = 60 * 60
+ONE_DAY = 24 * ONE_HOUR
+
+class VelocityLimit:
+    """
+    A class to represent one withdrawal limit over a rolling time window.
+
+    Attributes:
+        window_seconds (int): Length of the rolling window in seconds.
+        max_amount (float): Largest total amount that may be withdrawn in the window, or None.
+        max_count (int): Largest number of withdrawals allowed in the window, or None.
+    """
+
+    __slots__ = ("__window_seconds", "__max_amount_cents", "__max_count")
+
+    def __init__(self, window_seconds: int, max_amount: float = None, max_count: int = None):
+        """
+        Initializes a VelocityLimit object.
+
+        Args:
+            window_seconds (int): Length of the rolling window in seconds.
+            max_amount (float): Largest total amount for the window.
+            max_count (int): Largest number of withdrawals for the window.
+
+        Raises:
+            ValueError: If the window is not positive or neither maximum is given.
+        """
+        if not isinstance(window_seconds, int) or window_seconds <= 0:
+            raise ValueError("Velocity limit window must be a positive number of seconds.")
+        if max_amount is None and max_count is None:
+            raise ValueError("Velocity limit needs a maximum amount or a maximum count.")
+
+        self.__window_seconds = window_seconds
+        self.__max_amount_cents = None if max_amount is None else round(float(max_amount) * 100)
+        self.__max_count = None if max_count is None else int(max_count)
+
+    @property
+    def window_seconds(self) -> int:
+        """Returns the length of the rolling window in seconds."""
+        return self.__window_seconds
+
+    @property
+    def max_amount(self) -> float:
+        """Returns the largest total amount for the window, or None."""
+        return None if self.__max_amount_cents is None else self.__max_amount_cents / 100
+
+    @property
+    def max_count(self) -> int:
+        """Returns the largest number of withdrawals for the window, or None."""
+        return self.__max_count
+
+    def check(self, counter: "SlidingWindowCounter", amount_cents: int) -> None:
+        """
+        Checks whether one more withdrawal fits within the limit.
+
+        Raises:
+            ValueError: If the withdrawal would exceed the limit.
+        """
+        period = _describe_window(self.__window_seconds)
+        if self.__max_amount_cents is not None and counter.total_cents + amount_cents > self.__max_amount_cents:
+            raise ValueError(f"Withdrawal amount: ${amount_cents / 100:,.2f} exceeds the limit of "
+                             f"${self.__max_amount_cents / 100:,.2f} per {period}.")
+        if self.__max_count is not None and counter.count + 1 > self.__max_count:
+            raise ValueError(f"Withdrawal exceeds the limit of {self.__max_count} withdrawals per {period}.")
+
+class SlidingWindowCounter:
+    """
+    A class to represent the withdrawals made within one rolling window.
+
+    Withdrawals are kept in time order with a running total and count. Entries that
+    fall out of the window are only removed when the counter is next used, so each
+    withdrawal is added and removed once (O(1) amortized).
+    """
+
+    __slots__ = ("__window_seconds", "__entries", "total_cents", "count")
+
+    def __init__(self, window_seconds: int):
+        """
+        Initializes an empty SlidingWindowCounter.
+
+        Args:
+            window_seconds (int): Length of the rolling window in seconds.
+        """
+        self.__window_seconds = window_seconds
+        self.__entries = deque()
+        self.total_cents = 0
+        self.count = 0
+
+    def expire(self, now: float) -> None:
+        """Removes the withdrawals that are older than the window."""
+        entries = self.__entries
+        cutoff = now - self.__window_seconds
+        while entries and entries[0][0] <= cutoff:
+            _, amount_cents = entries.popleft()
+            self.total_cents -= amount_cents
+            self.count -= 1
+
+    def add(self, now: float, amount_cents: int) -> None:
+        """Records a withdrawal."""
+        self.__entries.append((now, amount_cents))
+        self.total_cents += amount_cents
+        self.count += 1
+
+    def is_empty(self) -> bool:
+        """Returns True if the counter holds no withdrawals."""
+        return not self.__entries
+
+class VelocityCounters:
+    """
+    A class to represent the sliding-window counters of one account.
+
+    One counter is kept per window length, so an amount limit and a count limit over the
+    same window share a counter. Accounts only get counters once they withdraw, and the
+    counter of a window the limits no longer use is dropped once its withdrawals expire.
+
+    Methods:
+        check(self, limits, amount, now) -> None:
+            Raises ValueError if the withdrawal would exceed any limit.
+        record(self, limits, amount, now) -> None:
+            Records a withdrawal that has been applied.
+    """
+
+    __slots__ = ("__counters",)
+
+    def __init__(self):
+        """Initializes the VelocityCounters with no windows."""
+        self.__counters = {}
+
+    def __len__(self) -> int:
+        """Returns the number of windows with a counter."""
+        return len(self.__counters)
+
+    def check(self, limits: tuple, amount: float, now: float) -> None:
+        """
+        Checks a withdrawal against every limit.
+
+        Args:
+            limits (tuple): The VelocityLimit objects for the account type.
+            amount (float): The amount to be withdrawn.
+            now (float): The current time in seconds.
+
+        Raises:
+            ValueError: If the withdrawal would exceed a limit.
+        """
+        amount_cents = round(amount * 100)
+        for limit in limits:
+            counter = self.__counters.get(limit.window_seconds)
+            if counter is not None:
+                counter.expire(now)
+                limit.check(counter, amount_cents)
+            else:
+                limit.check(_EMPTY_COUNTER, amount_cents)
+
+    def record(self, limits: tuple, amount: float, now: float) -> None:
+        """
+        Records an applied withdrawal in every window used by the limits.
+
+        Args:
+            limits (tuple): The VelocityLimit objects for the account type.
+            amount (float): The amount that was withdrawn.
+            now (float): The current time in seconds.
+        """
+        amount_cents = round(amount * 100)
+        windows = {limit.window_seconds for limit in limits}
+        for window_seconds in windows:
+            counter = self.__counters.get(window_seconds)
+            if counter is None:
+                counter = self.__counters[window_seconds] = SlidingWindowCounter(window_seconds)
+            counter.expire(now)
+            counter.add(now, amount_cents)
+
+        # Drop windows that are no longer used once they hold no withdrawals
+        for window_seconds in [window for window in self.__counters if window not in windows]:
+            counter = self.__counters[window_seconds]
+            counter.expire(now)
+            if counter.is_empty():
+                del self.__counters[window_seconds]
+
+# Shared counter used when an account has not withdrawn within a window
+_EMPTY_COUNTER = SlidingWindowCounter(1)
+
+# Velocity limits for each account type, looked up by class name. No account type is
+# limited until its limits are configured with set_velocity_limits.
+VELOCITY_LIMITS = {}
+
+def get_velocity_limits(account_type: type) -> tuple:
+    """
+    Returns the velocity limits for an account type.
+
+    The limits of the closest class in the account type's hierarchy are used.
+
+    Args:
+        account_type (type): The class of the bank account.
+
+    Returns:
+        tuple: The VelocityLimit objects for the account type.
+    """
+    for cls in account_type.__mro__:
+        limits = VELOCITY_LIMITS.get(cls.__name__)
+        if limits is not None:
+            return limits
+    return ()
+
+def set_velocity_limits(account_type_name: str, limits) -> None:
+    """
+    Replaces the velocity limits for an account type.
+
+    Args:
+        account_type_name (str): Class name of the account type, e.g. 'ChequingAccount'.
+        limits: Iterable of VelocityLimit objects. An empty iterable removes all limits.
+
+    Raises:
+        ValueError: If any limit is not a VelocityLimit.
+    """
+    limits = tuple(limits)
+    if not all(isinstance(limit, VelocityLimit) for limit in limits):
+        raise ValueError("Velocity limits must be VelocityLimit objects.")
+    VELOCITY_LIMITS[account_type_name] = limits
+
+def _describe_window(window_seconds: int) -> str:
+    """Returns a readable name for a window length."""
+    if window_seconds % ONE_DAY == 0:
+        days = window_seconds // ONE_DAY
+        return "24 hours" if days == 1 else f"{days} days"
+    if window_seconds % ONE_HOUR == 0:
+        hours = window_seconds // ONE_HOUR
+        return "hour" if hours == 1 else f"{hours} hours"
+    return f"{window_seconds} seconds"
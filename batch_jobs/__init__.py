@@ -0,0 +1,8 @@
+# import batch_jobs package
+from .interest_accrual import accrue_interest, compute_interest
+from .service_charge_run import compute_service_charges, run_service_charges
+from .month_end_pipeline import run_month_end
+from .fee_simulation import simulate_fees
+
+__all__ = ["accrue_interest", "compute_interest", "compute_service_charges", "run_service_charges", "run_month_end",
+           "simulate_fees"]
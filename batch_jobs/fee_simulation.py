@@ -0,0 +1,155 @@
+"""
+Description: This file defines the what-if fee simulation, which evaluates the fee rules for the
+current account population under a set of parameter scenarios in one broadcast computation,
+without touching any balances, and reports the fee revenue distribution of each scenario.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE SIMULATION CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import csv
+import json
+import numpy as np
+from patterns.strategy.fee_rules import FeeRuleSet, RuleBasedStrategy, load_fee_rules
+from utility.clock import clock
+from user_interface.manage_data import load_data
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default location of the simulation report
+default_report_path = os.path.join(root_dir, 'output', 'fee_simulation_report.csv')
+
+# Name of the scenario that keeps every account's current parameters
+CURRENT_SCENARIO = "current"
+
+REPORT_FIELDS = ["scenario", "account_type", "accounts", "total", "mean", "p50", "p90", "p99", "max"]
+
+# Account properties used as rule parameters when an account has a built-in strategy
+_BUILT_IN_PARAMETERS = ("overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+
+def simulate_fees(accounts: dict, scenarios: list[dict], rule_set: FeeRuleSet = None) -> tuple:
+    """
+    Evaluates the fee rules for every account under every scenario.
+
+    A scenario is a dict with a 'name' and new values for any of the rule parameters,
+    e.g. {"name": "higher overdraft", "overdraft_rate": 0.05}. A parameter a scenario
+    does not set keeps each account's current value. The current scenario is always
+    included first. Balances are only read.
+
+    Args:
+        accounts (dict): Bank accounts keyed by account number.
+        scenarios (list[dict]): The parameter scenarios.
+        rule_set (FeeRuleSet): The fee rules to evaluate. Defaults to the fee rules file.
+
+    Returns:
+        tuple: (scenario_names, account_types, charges) where charges has one row per
+            scenario and one column per simulated account.
+
+    Raises:
+        ValueError: If there are no fee rules, a scenario has no name or a scenario
+            sets a value that is not a rule parameter.
+    """
+    rule_set = rule_set or load_fee_rules()
+    if rule_set is None:
+        raise ValueError("Fee simulation needs a fee rules file.")
+    if any("name" not in scenario for scenario in scenarios):
+        raise ValueError("Every scenario needs a name.")
+    known = {name for account_type in rule_set.account_types() for name in rule_set.parameter_names(account_type)}
+    for scenario in scenarios:
+        unknown = sorted(set(scenario) - known - {"name"})
+        if unknown:
+            raise ValueError(f"Scenario {scenario['name']} sets unknown parameters: {', '.join(unknown)}")
+
+    scenarios = [{"name": CURRENT_SCENARIO}] + list(scenarios)
+    scenario_names = [scenario["name"] for scenario in scenarios]
+
+    population = [account for account in accounts.values() if rule_set.covers(type(account).__name__)]
+    account_types = np.array([type(account).__name__ for account in population])
+    balances = np.fromiter((account.balance for account in population), dtype=np.float64, count=len(population))
+    today = clock.today().toordinal()
+    age_days = today - np.fromiter((account.date_created.toordinal() for account in population),
+                                   dtype=np.int64, count=len(population))
+
+    charges = np.zeros((len(scenarios), len(population)))
+    for account_type in np.unique(account_types):
+        columns = np.flatnonzero(account_types == account_type)
+        names = rule_set.parameter_names(account_type)
+        current = [np.array([_parameter(population[index], name) for index in columns]) for name in names]
+
+        # Broadcast (scenarios x accounts) parameter grids; NaN keeps the current value
+        grids = []
+        for position, name in enumerate(names):
+            overrides = np.array([scenario.get(name, np.nan) for scenario in scenarios], dtype=np.float64)
+            grids.append(np.where(np.isnan(overrides)[:, None], current[position][None, :], overrides[:, None]))
+
+        shape = (len(scenarios), len(columns))
+        result = rule_set.evaluate_bulk(account_type,
+                                        np.broadcast_to(balances[columns], shape).ravel(),
+                                        np.broadcast_to(age_days[columns], shape).ravel(),
+                                        [grid.ravel() for grid in grids])
+        charges[:, columns] = np.asarray(result).reshape(shape)
+
+    return scenario_names, account_types, charges
+
+def summarize(scenario_names: list, account_types: np.ndarray, charges: np.ndarray) -> list[dict]:
+    """
+    Summarizes the fee distribution of each scenario, per account type and overall.
+
+    Returns:
+        list[dict]: One row per scenario and account type (and 'All'), keyed by REPORT_FIELDS.
+    """
+    rows = []
+    groups = [(account_type, account_types == account_type) for account_type in np.unique(account_types)]
+    groups.append(("All", np.ones(len(account_types), dtype=bool)))
+
+    for account_type, mask in groups:
+        if not mask.any():
+            continue
+        group = charges[:, mask]
+        percentiles = np.percentile(group, [50, 90, 99], axis=1)
+        totals = group.sum(axis=1)
+        for row_index, name in enumerate(scenario_names):
+            rows.append({"scenario": name, "account_type": account_type, "accounts": int(mask.sum()),
+                         "total": round(float(totals[row_index]), 2),
+                         "mean": round(float(totals[row_index] / mask.sum()), 2),
+                         "p50": round(float(percentiles[0, row_index]), 2),
+                         "p90": round(float(percentiles[1, row_index]), 2),
+                         "p99": round(float(percentiles[2, row_index]), 2),
+                         "max": round(float(group[row_index].max()), 2)})
+    return sorted(rows, key=lambda row: (scenario_names.index(row["scenario"]), row["account_type"] == "All"))
+
+def write_simulation_report(rows: list[dict], report_path: str = default_report_path) -> None:
+    """Writes the summary rows to the simulation report."""
+    os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+    with open(report_path, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def _parameter(account, name: str) -> float:
+    """Returns the current value of a rule parameter for an account."""
+    strategy = account.service_charge_strategy
+    if isinstance(strategy, RuleBasedStrategy):
+        return strategy.parameters[strategy.rule_set.parameter_names(strategy.account_type).index(name)]
+    if name in _BUILT_IN_PARAMETERS and hasattr(strategy, name):
+        return getattr(strategy, name)
+    raise ValueError(f"Account Number: {account.account_number} has no parameter {name}.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python batch_jobs/fee_simulation.py <scenarios.json>")
+        sys.exit(1)
+
+    with open(sys.argv[1]) as file:
+        scenarios = json.load(file)
+
+    clients, accounts = load_data()
+    rows = summarize(*simulate_fees(accounts, scenarios))
+    write_simulation_report(rows)
+    for row in rows:
+        print(f"{row['scenario']:<24} {row['account_type']:<18} total ${row['total']:>12,.2f} "
+              f"mean ${row['mean']:>8,.2f} p90 ${row['p90']:>8,.2f}")
@@ -0,0 +1,120 @@
+"""
+Description: This file defines the batch interest accrual job, which computes interest for every
+eligible bank account in one vectorized pass, posts it, and writes an accrual report.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE JOB CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import csv
+import numpy as np
+from user_interface.manage_data import load_data, update_data_batch
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default location of the accrual report
+default_report_path = os.path.join(root_dir, 'output', 'interest_accrual_report.csv')
+
+# Annual interest rate tiers per account type: (lowest balance of the tier, annual rate).
+# The whole balance earns the rate of the highest tier it reaches.
+INTEREST_RATE_TIERS = {
+    "SavingsAccount": ((0.00, 0.0100), (5000.00, 0.0150), (25000.00, 0.0200)),
+    "InvestmentAccount": ((0.00, 0.0200), (10000.00, 0.0300), (100000.00, 0.0350)),
+}
+
+# Number of accrual periods in a year
+PERIODS_PER_YEAR = {"daily": 365, "monthly": 12}
+
+REPORT_FIELDS = ["account_number", "client_number", "account_type", "opening_balance",
+                 "annual_rate", "interest", "closing_balance"]
+
+def compute_interest(balances: np.ndarray, account_types: np.ndarray, period: str = "monthly") -> tuple:
+    """
+    Computes the interest for many accounts at once.
+
+    Args:
+        balances (np.ndarray): The balance of each account.
+        account_types (np.ndarray): The class name of each account.
+        period (str): 'daily' or 'monthly'.
+
+    Returns:
+        tuple: (annual_rates, interest) arrays. Accounts without a rate, or with a balance
+            that is not positive, get a rate and interest of zero. Interest is rounded to cents.
+
+    Raises:
+        ValueError: If the period is unknown.
+    """
+    if period not in PERIODS_PER_YEAR:
+        raise ValueError(f"Not a valid accrual period: {period}")
+
+    balances = np.asarray(balances, dtype=np.float64)
+    account_types = np.asarray(account_types)
+    annual_rates = np.zeros(len(balances))
+
+    for account_type, tiers in INTEREST_RATE_TIERS.items():
+        in_type = (account_types == account_type) & (balances > 0)
+        thresholds = np.array([threshold for threshold, _ in tiers])
+        rates = np.array([rate for _, rate in tiers])
+        tier = np.searchsorted(thresholds, balances[in_type], side='right') - 1
+        annual_rates[in_type] = rates[np.maximum(tier, 0)]
+
+    interest = np.round(balances * annual_rates / PERIODS_PER_YEAR[period], 2)
+    return annual_rates, interest
+
+def accrue_interest(accounts: dict, period: str = "monthly", report_path: str = default_report_path,
+                    persist: bool = True) -> float:
+    """
+    Accrues interest on every eligible account, posts it and writes the accrual report.
+
+    Args:
+        accounts (dict): Bank accounts keyed by account number.
+        period (str): 'daily' or 'monthly'.
+        report_path (str): Where to write the accrual report, or None for no report.
+        persist (bool): Whether to write the new balances to accounts.csv.
+
+    Returns:
+        float: The total interest posted.
+    """
+    eligible = [account for account in accounts.values()
+                if type(account).__name__ in INTEREST_RATE_TIERS]
+
+    balances = np.fromiter((account.balance for account in eligible), dtype=np.float64, count=len(eligible))
+    account_types = np.array([type(account).__name__ for account in eligible])
+    annual_rates, interest = compute_interest(balances, account_types, period)
+
+    # Post the interest to the accounts that earned any
+    credited = []
+    for index in np.flatnonzero(interest > 0):
+        account = eligible[index]
+        account.update_balance(float(interest[index]))
+        credited.append(account)
+
+    if persist and credited:
+        update_data_batch(credited)
+
+    if report_path:
+        _write_report(report_path, eligible, balances, annual_rates, interest)
+
+    return float(interest.sum())
+
+def _write_report(report_path: str, eligible: list, balances: np.ndarray,
+                  annual_rates: np.ndarray, interest: np.ndarray) -> None:
+    """Writes one row per eligible account to the accrual report."""
+    os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+    with open(report_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(REPORT_FIELDS)
+        for index, account in enumerate(eligible):
+            writer.writerow([account.account_number, account.client_number, type(account).__name__,
+                             f"{balances[index]:.2f}", f"{annual_rates[index]:.4f}",
+                             f"{interest[index]:.2f}", f"{account.balance:.2f}"])
+
+
+if __name__ == "__main__":
+    period = sys.argv[1] if len(sys.argv) > 1 else "monthly"
+    clients, accounts = load_data()
+    total = accrue_interest(accounts, period)
+    print(f"Posted ${total:,.2f} of {period} interest. Report: {default_report_path}")
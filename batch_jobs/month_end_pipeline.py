@@ -0,0 +1,228 @@
+"""
+Description: This file defines the multi-process month-end fee pipeline. Accounts are split into
+shards that are charged in a process pool, and the partial results are merged into accounts.csv
+and a single report. A failed run can be resumed without recomputing finished shards.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE PIPELINE CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from user_interface.manage_data import load_data, update_data_batch
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default directory holding the working files of each run
+default_work_root = os.path.join(root_dir, 'output', 'month_end')
+
+PARTIAL_FIELDS = ["account_number", "client_number", "account_type",
+                  "opening_balance", "service_charge", "closing_balance"]
+MANIFEST_FIELDS = ["shard", "account_number"]
+SHARD_KEYS = ("client", "account")
+
+def plan_shards(accounts: dict, shard_count: int, shard_by: str = "client") -> list[tuple]:
+    """
+    Splits the accounts into contiguous key ranges of roughly equal size.
+
+    Args:
+        accounts (dict): Bank accounts keyed by account number.
+        shard_count (int): The number of shards wanted.
+        shard_by (str): 'client' to keep each client's accounts together, or 'account'.
+
+    Returns:
+        list[tuple]: One (first_key, last_key) range per non-empty shard.
+
+    Raises:
+        ValueError: If the shard key or count is invalid.
+    """
+    if shard_by not in SHARD_KEYS:
+        raise ValueError(f"Not a valid shard key: {shard_by}")
+    if not isinstance(shard_count, int) or shard_count < 1:
+        raise ValueError("Shard count must be a positive integer.")
+
+    keys = np.unique(np.fromiter((_shard_key(account, shard_by) for account in accounts.values()),
+                                 dtype=np.int64, count=len(accounts)))
+    return [(int(chunk[0]), int(chunk[-1])) for chunk in np.array_split(keys, shard_count) if len(chunk)]
+
+def run_month_end(accounts: dict, run_id: str, shard_count: int = None, shard_by: str = "client",
+                  work_root: str = default_work_root, persist: bool = True, max_workers: int = None) -> float:
+    """
+    Runs the month-end fee posting across a process pool and merges the results.
+
+    The shard of each account is saved the first time the run starts. Shards with a
+    partial result file are skipped on later attempts, so a failed run is resumed
+    by calling this function again with the same run_id. Accounts opened since the
+    first attempt are charged in a shard of their own.
+
+    Args:
+        accounts (dict): Bank accounts keyed by account number.
+        run_id (str): Name of the run, e.g. '2024-06'.
+        shard_count (int): Number of shards. Defaults to the number of CPUs.
+        shard_by (str): 'client' or 'account'.
+        work_root (str): Directory in which the run's working files are kept.
+        persist (bool): Whether to write the new balances to accounts.csv.
+        max_workers (int): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        float: The total of the service charges posted.
+
+    Raises:
+        RuntimeError: If any shard failed. Finished shards are kept for the next attempt.
+    """
+    work_dir = os.path.join(work_root, run_id)
+    os.makedirs(work_dir, exist_ok=True)
+    report_path = os.path.join(work_dir, 'service_charge_report.csv')
+
+    # A merged run is complete; running it again must not charge anyone twice
+    if os.path.exists(os.path.join(work_dir, 'merged')):
+        return _report_total(report_path)
+
+    assignment = _load_or_save_manifest(work_dir, accounts, shard_count or os.cpu_count() or 1, shard_by)
+    total_shards = max(assignment.values(), default=-1) + 1
+    pending = [index for index in range(total_shards) if not os.path.exists(_partial_path(work_dir, index))]
+
+    failures = []
+    if pending:
+        shard_accounts = _assign_accounts(accounts, assignment, total_shards)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(process_shard, shard_accounts[index], _partial_path(work_dir, index)): index
+                       for index in pending}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures.append(f"shard {futures[future]}: {e}")
+
+    if failures:
+        raise RuntimeError(f"Month-end run {run_id} failed for {len(failures)} shards: " + "; ".join(failures))
+
+    return _merge(work_dir, accounts, total_shards, report_path, persist)
+
+def process_shard(shard_accounts: list, partial_path: str) -> int:
+    """
+    Computes and applies the service charges of one shard and writes its partial result file.
+
+    Runs in a worker process, so the balances changed here are the worker's copies.
+    The parent applies the results when the shards are merged.
+
+    Args:
+        shard_accounts (list): The bank accounts of the shard.
+        partial_path (str): Where to write the partial result file.
+
+    Returns:
+        int: The number of accounts processed.
+    """
+    rows = []
+    for account in shard_accounts:
+        opening_balance = account.balance
+        service_charge = account.get_service_charges()
+        account.charge_fee(service_charge)
+        rows.append([account.account_number, account.client_number, type(account).__name__,
+                     repr(opening_balance), repr(service_charge), repr(account.balance)])
+
+    # The partial file only appears once it is complete
+    with open(partial_path + '.tmp', mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(PARTIAL_FIELDS)
+        writer.writerows(rows)
+    os.replace(partial_path + '.tmp', partial_path)
+    return len(rows)
+
+def _merge(work_dir: str, accounts: dict, shard_count: int, report_path: str, persist: bool) -> float:
+    """Applies every partial result to the accounts, accounts.csv and the report."""
+    rows = []
+    for index in range(shard_count):
+        with open(_partial_path(work_dir, index), newline='') as file:
+            rows.extend(csv.DictReader(file))
+
+    # Closing balances are absolute, so applying them again after a crash is harmless
+    changed = []
+    total = 0.0
+    for row in rows:
+        account = accounts.get(int(row['account_number']))
+        total += float(row['service_charge'])
+        if account is None:
+            continue
+        adjustment = float(row['closing_balance']) - account.balance
+        if adjustment:
+            account.charge_fee(-adjustment)
+        changed.append(account)
+
+    temp_report_path = report_path + '.tmp'
+    with open(temp_report_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(PARTIAL_FIELDS)
+        for row in rows:
+            writer.writerow([row['account_number'], row['client_number'], row['account_type'],
+                             f"{float(row['opening_balance']):.2f}", f"{float(row['service_charge']):.2f}",
+                             f"{float(row['closing_balance']):.2f}"])
+
+    if persist and changed:
+        update_data_batch(changed)
+    os.replace(temp_report_path, report_path)
+    with open(os.path.join(work_dir, 'merged'), mode='w') as file:
+        file.write(f"{len(rows)}\n")
+
+    return total
+
+def _load_or_save_manifest(work_dir: str, accounts: dict, shard_count: int, shard_by: str) -> dict:
+    """
+    Returns the shard of each account number, planning and saving it on the first attempt.
+
+    Accounts missing from a saved manifest were opened after the first attempt and may
+    fall in a finished shard's key range, so they are placed in a new shard instead,
+    which is added to the manifest.
+    """
+    manifest_path = os.path.join(work_dir, f'manifest_{shard_by}.csv')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, newline='') as file:
+            assignment = {int(row['account_number']): int(row['shard']) for row in csv.DictReader(file)}
+        new_accounts = [number for number in accounts if number not in assignment]
+        if not new_accounts:
+            return assignment
+        new_shard = max(assignment.values(), default=-1) + 1
+        assignment.update((number, new_shard) for number in new_accounts)
+    else:
+        shards = plan_shards(accounts, shard_count, shard_by)
+        first_keys = np.array([first for first, _ in shards], dtype=np.int64)
+        assignment = {number: max(int(np.searchsorted(first_keys, _shard_key(account, shard_by), side='right')) - 1, 0)
+                      for number, account in accounts.items()}
+
+    with open(manifest_path + '.tmp', mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(MANIFEST_FIELDS)
+        writer.writerows((shard, number) for number, shard in assignment.items())
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return assignment
+
+def _assign_accounts(accounts: dict, assignment: dict, total_shards: int) -> list[list]:
+    """Places each account in its shard from the manifest."""
+    shard_accounts = [[] for _ in range(total_shards)]
+    for number, account in accounts.items():
+        shard_accounts[assignment[number]].append(account)
+    return shard_accounts
+
+def _shard_key(account, shard_by: str) -> int:
+    """Returns the value an account is sharded on."""
+    return account.client_number if shard_by == "client" else account.account_number
+
+def _partial_path(work_dir: str, index: int) -> str:
+    """Returns the path of a shard's partial result file."""
+    return os.path.join(work_dir, f'shard_{index:04d}.csv')
+
+def _report_total(report_path: str) -> float:
+    """Returns the total service charge of a finished run's report."""
+    with open(report_path, newline='') as file:
+        return sum(float(row['service_charge']) for row in csv.DictReader(file))
+
+
+if __name__ == "__main__":
+    run_id = sys.argv[1] if len(sys.argv) > 1 else "month_end"
+    clients, accounts = load_data()
+    total = run_month_end(accounts, run_id)
+    print(f"Posted ${total:,.2f} of service charges for run {run_id}.")
@@ -0,0 +1,105 @@
+"""
+Description: This file defines the month-end service charge run, which evaluates the service
+charges of all bank accounts in bulk, debits them, and writes a charge report.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE JOB CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import csv
+import numpy as np
+from user_interface.manage_data import load_data, update_data_batch
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default location of the charge report
+default_report_path = os.path.join(root_dir, 'output', 'service_charge_report.csv')
+
+REPORT_FIELDS = ["account_number", "client_number", "account_type", "strategy",
+                 "opening_balance", "service_charge", "closing_balance"]
+
+def compute_service_charges(accounts: list) -> np.ndarray:
+    """
+    Computes the service charges of many accounts in bulk.
+
+    Accounts are grouped by the type of their service charge strategy and each group
+    is evaluated by the strategy's vectorized formula over arrays of balances and
+    parameters. The result is the same as calling get_service_charges() on each account.
+
+    Args:
+        accounts (list): The bank accounts.
+
+    Returns:
+        np.ndarray: The service charge of each account, in the order given.
+    """
+    balances = np.fromiter((account.balance for account in accounts), dtype=np.float64, count=len(accounts))
+    charges = np.zeros(len(accounts))
+
+    groups = {}
+    for index, account in enumerate(accounts):
+        strategy = account.service_charge_strategy
+        group = groups.get(type(strategy))
+        if group is None:
+            group = groups[type(strategy)] = ([], [])
+        group[0].append(index)
+        group[1].append(strategy)
+
+    for strategy_type, (indexes, strategies) in groups.items():
+        indexes = np.array(indexes, dtype=np.int64)
+        charges[indexes] = strategy_type.calculate_service_charges_bulk(
+            strategies, [accounts[index] for index in indexes], balances[indexes])
+
+    return charges
+
+def run_service_charges(accounts: dict, report_path: str = default_report_path, persist: bool = True) -> float:
+    """
+    Debits the month-end service charges of every account and writes the charge report.
+
+    Args:
+        accounts (dict): Bank accounts keyed by account number.
+        report_path (str): Where to write the charge report, or None for no report.
+        persist (bool): Whether to write the new balances to accounts.csv.
+
+    Returns:
+        float: The total of the service charges debited.
+    """
+    charged_accounts = list(accounts.values())
+    opening_balances = [account.balance for account in charged_accounts]
+    charges = compute_service_charges(charged_accounts)
+
+    # Debit the charges in memory, then persist every changed balance in one pass
+    debited = []
+    for index in np.flatnonzero(charges):
+        account = charged_accounts[index]
+        account.charge_fee(float(charges[index]))
+        debited.append(account)
+
+    if persist and debited:
+        update_data_batch(debited)
+
+    if report_path:
+        _write_report(report_path, charged_accounts, opening_balances, charges)
+
+    return float(charges.sum())
+
+def _write_report(report_path: str, accounts: list, opening_balances: list, charges: np.ndarray) -> None:
+    """Writes one row per account to the charge report."""
+    os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+    with open(report_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(REPORT_FIELDS)
+        for index, account in enumerate(accounts):
+            writer.writerow([account.account_number, account.client_number, type(account).__name__,
+                             type(account.service_charge_strategy).__name__,
+                             f"{opening_balances[index]:.2f}", f"{charges[index]:.2f}",
+                             f"{account.balance:.2f}"])
+
+
+if __name__ == "__main__":
+    clients, accounts = load_data()
+    total = run_service_charges(accounts)
+    print(f"Debited ${total:,.2f} of service charges from {len(accounts)} accounts. "
+          f"Report: {default_report_path}")
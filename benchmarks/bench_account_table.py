@@ -0,0 +1,94 @@
+"""
+Description: Benchmark of the time to first paint of a client's account table, comparing the
+former QTableWidget rows built item by item with the QTableView over AccountTableModel, and of
+filtering and sorting through AccountFilterProxyModel.
+Author: Lovedeep Singh Sidhu
+Usage: python benchmarks/bench_account_table.py [account_count]
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE BENCHMARK CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+# Render without a display, so the benchmark also runs on build machines
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import time
+from datetime import date
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem, QTableView
+from bank_account import ChequingAccount
+from PySide6.QtCore import Qt
+from user_interface.account_table_model import AccountTableModel, COLUMN_HEADERS
+from user_interface.account_filter_proxy_model import AccountFilterProxyModel
+
+def make_accounts(count: int) -> list:
+    """Returns the accounts of one large client."""
+    return [ChequingAccount(100000 + number, 1001, 250.00 + number, date(2023, 1, 10), -100.00, 0.05)
+            for number in range(count)]
+
+def first_paint(app: QApplication, table) -> float:
+    """Shows a table and returns the seconds until its first paint has been processed."""
+    start = time.perf_counter()
+    table.resize(600, 400)
+    table.show()
+    table.repaint()
+    app.processEvents()
+    return time.perf_counter() - start
+
+def bench_table_widget(app: QApplication, accounts: list) -> float:
+    """Returns the seconds to fill and first paint a QTableWidget the way the lookup window used to."""
+    start = time.perf_counter()
+    table = QTableWidget()
+    table.setColumnCount(len(COLUMN_HEADERS))
+    table.setHorizontalHeaderLabels(COLUMN_HEADERS)
+    for account in accounts:
+        row_position = table.rowCount()
+        table.insertRow(row_position)
+        table.setItem(row_position, 0, QTableWidgetItem(str(account.account_number)))
+        table.setItem(row_position, 1, QTableWidgetItem(f"${account.balance:,.2f}"))
+        table.setItem(row_position, 2, QTableWidgetItem(str(account.date_created)))
+        table.setItem(row_position, 3, QTableWidgetItem(account.__class__.__name__))
+    table.resizeColumnsToContents()
+    elapsed = time.perf_counter() - start + first_paint(app, table)
+    table.close()
+    return elapsed
+
+def bench_table_model(app: QApplication, accounts: list) -> float:
+    """Returns the seconds to fill and first paint a QTableView over AccountTableModel."""
+    start = time.perf_counter()
+    table = QTableView()
+    table.horizontalHeader().setResizeContentsPrecision(100)
+    model = AccountTableModel(table)
+    table.setModel(model)
+    model.set_accounts(accounts)
+    table.resizeColumnsToContents()
+    elapsed = time.perf_counter() - start + first_paint(app, table)
+    table.close()
+    return elapsed
+
+def bench_filter_and_sort(accounts: list) -> list[tuple]:
+    """Returns the milliseconds of each filter and sort step through the proxy model."""
+    model = AccountTableModel()
+    proxy = AccountFilterProxyModel()
+    proxy.setSourceModel(model)
+    model.set_accounts(accounts)
+    steps = [("first filter (builds keys)", lambda: proxy.set_filter(0, "7")),
+             ("filter balance", lambda: proxy.set_filter(1, "1,2")),
+             ("sort balance descending", lambda: proxy.sort(1, Qt.DescendingOrder)),
+             ("clear filter", lambda: proxy.set_filter(0, "")),
+             ("sort account type", lambda: proxy.sort(3, Qt.AscendingOrder))]
+    timings = []
+    for name, step in steps:
+        start = time.perf_counter()
+        step()
+        timings.append((name, (time.perf_counter() - start) * 1000))
+    return timings
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    app = QApplication(sys.argv)
+    accounts = make_accounts(count)
+    for name, bench in (("QTableWidget", bench_table_widget), ("AccountTableModel", bench_table_model)):
+        print(f"{name:<20} {bench(app, accounts) * 1000:>10,.1f} ms to first paint of {count:,} accounts")
+    for name, milliseconds in bench_filter_and_sort(accounts):
+        print(f"{name:<28} {milliseconds:>10,.1f} ms")
@@ -0,0 +1,47 @@
+"""
+Description: Benchmark comparing the buffered EmailOutbox with simulate_send_email, which opens
+the outbox file for every message. Both write to a temporary directory.
+Author: Lovedeep Singh Sidhu
+Usage: python benchmarks/bench_email_outbox.py [message_count]
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE BENCHMARK CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import tempfile
+import time
+from utility.email_outbox import EmailOutbox
+from utility.file_utils import simulate_send_email
+
+SUBJECT = "ALERT: Unusual Activity: 2024-06-01T12:00"
+MESSAGE = "Notification for 1313: Lovedeep Sidhu: Large transaction $12000.00: on account 555555."
+
+def bench_simulate_send_email(count: int) -> float:
+    """Returns the messages per second of simulate_send_email."""
+    start = time.perf_counter()
+    for number in range(count):
+        simulate_send_email(f"client{number}@example.com", SUBJECT, MESSAGE)
+    return count / (time.perf_counter() - start)
+
+def bench_outbox(count: int) -> float:
+    """Returns the messages per second of EmailOutbox, including the final flush."""
+    outbox = EmailOutbox(os.path.join("output", "observer_emails.txt"))
+    start = time.perf_counter()
+    for number in range(count):
+        outbox.send(f"client{number}@example.com", SUBJECT, MESSAGE)
+    outbox.close()
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    working_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # simulate_send_email always writes to output/ under the working directory
+        os.chdir(directory)
+        try:
+            for name, bench in (("simulate_send_email", bench_simulate_send_email), ("EmailOutbox", bench_outbox)):
+                print(f"{name:<20} {bench(count):>12,.0f} messages/s")
+        finally:
+            os.chdir(working_dir)
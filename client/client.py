@@ -5,10 +5,10 @@ Date: 13-09-2024
 """
 
 # Importing necessary modules
-from email_validator import validate_email, EmailNotValidError
+from client.email_validation import email_validation
 from patterns.observer.observer import Observer
-from utility.file_utils import simulate_send_email
-from datetime import datetime
+from utility.email_backend import get_email_backend
+from utility.clock import clock
 
 # Defining the Client class
 class Client(Observer):
@@ -20,6 +20,8 @@ class Client(Observer):
         first_name (str): The first name of the client.
         last_name (str): The last name of the client.
         email_address (str): The client's email address.
+        digest (NotificationDigest): The digest collecting the client's alerts, or None
+            to send each alert separately.
     """
 
     def __init__(self, client_number: int, first_name: str, last_name: str, email_address: str):
@@ -36,7 +38,6 @@ class Client(Observer):
 
         Raises:
             ValueError: If the client_number is not an integer, or if the first or last name is empty.
-            EmailNotValidError: If the provided email address is not valid.
         """
         # Ensure client_number is an integer
         if not isinstance(client_number, int):
@@ -53,13 +54,13 @@ class Client(Observer):
             raise ValueError("Last name cannot be blank.")
         self.__last_name = last_name.strip()
 
-        # Validate the email address and normalize it
-        try:
-            validated_email = validate_email(email_address)
-            self.__email_address = validated_email.normalized
-        except EmailNotValidError:
-            # Assign a default email if the provided one is invalid
-            self.__email_address = "email@gmail.com"
+        # Validate the email address by syntax and normalize it, reusing earlier results
+        normalized_email = email_validation.validate(email_address)
+        # Assign a default email if the provided one is invalid
+        self.__email_address = normalized_email if normalized_email is not None else "email@gmail.com"
+
+        # Alerts are sent one by one until a digest is set
+        self.__digest = None
 
     @property
     def client_number(self) -> int:
@@ -101,6 +102,25 @@ class Client(Observer):
         """
         return self.__email_address
 
+    @property
+    def digest(self):
+        """
+        Getter for the digest attribute.
+
+        Returns:
+            NotificationDigest: The digest collecting the client's alerts, or None.
+        """
+        return self.__digest
+
+    def use_digest(self, digest) -> None:
+        """
+        Sets the digest that collects the client's alerts.
+
+        Args:
+            digest (NotificationDigest): The digest, or None to send each alert separately.
+        """
+        self.__digest = digest
+
     def __str__(self) -> str:
         """
         Returns a formatted string representation of the Client instance.
@@ -118,13 +138,18 @@ class Client(Observer):
 
         This method is called when the subject informs its observers of a state change.
         It prepares the subject and message for an email and sends it to the client's email address.
+        In digest mode the alert is added to the client's digest instead.
 
         Args:
             message (str): The content of the notification message.
         """
+        if self.__digest is not None:
+            self.__digest.add(self, message)
+            return
+
         # Create the subject and format the message
-        subject = f"ALERT: Unusual Activity: {datetime.now().isoformat(timespec='minutes')}"
+        subject = f"ALERT: Unusual Activity: {clock.now().isoformat(timespec='minutes')}"
         message = f"Notification for {self.client_number}: {self.first_name} {self.last_name}: {message}"
         
-        # Simulate sending the email
-        simulate_send_email(self.__email_address, subject, message)
+        # Send the email through the configured backend, the file outbox by default
+        get_email_backend().send(self.__email_address, subject, message)
@@ -0,0 +1,225 @@
+"""
+Description: This file defines the ClientSearchIndex class, an in-memory index over Client objects
+that answers prefix searches by last name, first name, email address and client number, and
+exact searches by full name.
+Author: Lovedeep Singh Sidhu
+"""
+
+import unicodedata
+from bisect import bisect_left
+from client.client import Client
+
+# Fields with a sorted prefix array
+FIELDS = ("last_name", "first_name", "email_address", "client_number")
+
+# Sorts after every character that appears in a normalized key
+_PREFIX_END = "\U0010ffff"
+
+def normalize(text) -> str:
+    """
+    Returns the form of a name or address used as a search key: accents removed,
+    case folded and surrounding and repeated spaces collapsed.
+
+    Args:
+        text: The text to normalize.
+
+    Returns:
+        str: The search key.
+    """
+    text = str(text)
+    if text.isascii():
+        return " ".join(text.lower().split())
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(character for character in decomposed if not unicodedata.combining(character))
+    return " ".join(stripped.casefold().split())
+
+class ClientSearchIndex:
+    """
+    A class to represent the client search index.
+
+    Each field has a sorted array of (key, client_number) pairs, so a prefix query
+    is two binary searches and a slice. Clients added since a field was last queried
+    are kept in a pending list and merged into its array by the next query, so
+    building the index while clients are loaded costs one append per field and
+    client. A map from normalized full name ("first last" and "last first") to
+    client numbers answers exact name searches. Adding a client whose number is already indexed replaces it.
+
+    Attributes:
+        clients (dict): The indexed clients keyed by client number.
+
+    Methods:
+        add(self, client):
+            Adds or replaces a client.
+        remove(self, client_number):
+            Removes a client.
+        retain(self, client_numbers):
+            Removes every client not in client_numbers.
+        by_number(self, client_number) -> Client:
+            Returns the client with a number, or None.
+        by_prefix(self, field, prefix, limit) -> list[Client]:
+            Returns the clients whose field starts with a prefix.
+        by_name(self, name) -> list[Client]:
+            Returns the clients with a full name.
+        search(self, text, limit) -> list[Client]:
+            Returns the clients matching text by number, name or email prefix.
+    """
+
+    def __init__(self, clients=()):
+        """
+        Initializes the index with any number of clients.
+
+        Args:
+            clients (iterable): The clients to index.
+        """
+        self.__clients = {}
+        self.__keys = {}
+        self.__sorted = {field: [] for field in FIELDS}
+        self.__pending = {field: [] for field in FIELDS}
+        self.__names = {}
+        self.__stale = set()
+        for client in clients:
+            self.add(client)
+
+    @property
+    def clients(self) -> dict:
+        """Returns the indexed clients keyed by client number."""
+        return self.__clients
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def __contains__(self, client_number: int) -> bool:
+        return client_number in self.__clients
+
+    def add(self, client: Client) -> None:
+        """
+        Adds a client to the index, replacing any client with the same number.
+
+        Args:
+            client (Client): The client to index.
+        """
+        number = client.client_number
+        if number in self.__clients:
+            self.remove(number)
+
+        keys = (normalize(client.last_name), normalize(client.first_name),
+                normalize(client.email_address), str(number))
+        self.__clients[number] = client
+        self.__keys[number] = keys
+        for field, key in zip(FIELDS, keys):
+            self.__pending[field].append((key, number))
+        # A client whose first and last names are equal has one full name, listed once
+        for name in {f"{keys[1]} {keys[0]}", f"{keys[0]} {keys[1]}"}:
+            self.__names.setdefault(name, []).append(number)
+
+    def remove(self, client_number: int) -> None:
+        """
+        Removes a client from the index. Its array entries are dropped at the next merge.
+
+        Args:
+            client_number (int): The number of the client to remove.
+        """
+        keys = self.__keys.pop(client_number, None)
+        if keys is None:
+            return
+        del self.__clients[client_number]
+        for name in {f"{keys[1]} {keys[0]}", f"{keys[0]} {keys[1]}"}:
+            numbers = self.__names[name]
+            numbers.remove(client_number)
+            if not numbers:
+                del self.__names[name]
+        self.__stale.update(FIELDS)
+
+    def retain(self, client_numbers) -> None:
+        """
+        Removes every client whose number is not in client_numbers, e.g. after a reload.
+
+        Args:
+            client_numbers (iterable): The numbers of the clients to keep.
+        """
+        keep = set(client_numbers)
+        for number in [number for number in self.__clients if number not in keep]:
+            self.remove(number)
+
+    def by_number(self, client_number: int) -> Client | None:
+        """Returns the client with a number, or None."""
+        return self.__clients.get(client_number)
+
+    def by_prefix(self, field: str, prefix: str, limit: int = None) -> list[Client]:
+        """
+        Returns the clients whose field starts with a prefix, in key order.
+
+        Args:
+            field (str): One of FIELDS.
+            prefix (str): The start of the value; it is normalized before matching.
+            limit (int): The most clients returned, or None for all.
+
+        Raises:
+            ValueError: If the field is not indexed.
+        """
+        if field not in self.__sorted:
+            raise ValueError(f"Not a searchable field: {field}")
+        self.__merge(field)
+        entries = self.__sorted[field]
+        prefix = normalize(prefix)
+        start = bisect_left(entries, (prefix,))
+        end = bisect_left(entries, (prefix + _PREFIX_END,), start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [self.__clients[number] for _, number in entries[start:end]]
+
+    def by_name(self, name: str) -> list[Client]:
+        """Returns the clients whose full name, first then last or last then first, is name."""
+        key = normalize(name.replace(",", " "))
+        return [self.__clients[number] for number in self.__names.get(key, ())]
+
+    def search(self, text: str, limit: int = 20) -> list[Client]:
+        """
+        Returns the clients matching what a teller typed: an exact full name, then
+        prefixes of the client number, last name, first name and email address.
+
+        Args:
+            text (str): The search text.
+            limit (int): The most clients returned.
+
+        Returns:
+            list[Client]: Matching clients without duplicates, best matches first.
+        """
+        text = text.strip()
+        if not text:
+            return []
+
+        results = {}
+        candidates = [self.by_name(text)]
+        if text.isdigit():
+            candidates.append(self.by_prefix("client_number", text, limit))
+        else:
+            candidates.extend(self.by_prefix(field, text, limit) for field in FIELDS[:3])
+        for group in candidates:
+            for client in group:
+                results.setdefault(client.client_number, client)
+                if len(results) >= limit:
+                    return list(results.values())
+        return list(results.values())
+
+    def __merge(self, field: str) -> None:
+        """Merges a field's pending entries into its sorted array and drops removed or replaced ones."""
+        pending = self.__pending[field]
+        if not pending and field not in self.__stale:
+            return
+        entries = self.__sorted[field]
+        pending.sort()
+        # Two sorted runs; the sort merges them in linear time
+        entries.extend(pending)
+        entries.sort()
+        if field in self.__stale:
+            position = FIELDS.index(field)
+            current = []
+            for entry in entries:
+                keys = self.__keys.get(entry[1])
+                if keys is not None and keys[position] == entry[0] and (not current or current[-1] != entry):
+                    current.append(entry)
+            entries = current
+            self.__stale.discard(field)
+        self.__sorted[field] = entries
+        self.__pending[field] = []
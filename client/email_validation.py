@@ -0,0 +1,143 @@
+"""
+Description: This file defines the EmailValidationCache class, which validates client email
+addresses by syntax only and remembers every result, in memory and in a cache file, so that
+loading clients makes no network lookups and validates each address once.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import csv
+import atexit
+import threading
+from email_validator import validate_email, EmailNotValidError
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default location of the validation cache
+default_cache_path = os.path.join(root_dir, 'output', 'email_validation_cache.csv')
+
+CACHE_FIELDS = ["email_address", "mode", "normalized"]
+
+# Validation modes, recorded with each cached result
+SYNTAX = "syntax"
+DELIVERABILITY = "deliverability"
+
+class EmailValidationCache:
+    """
+    A class to represent the memoized email validation results.
+
+    Addresses are validated with email_validator. By default only the syntax is
+    checked, so validation never waits on DNS. Results are kept in a dict keyed by
+    the address as given, with an empty string for invalid addresses, and new
+    results are appended to the cache file by save(), which also runs at exit.
+    Each row of the cache file records the validation mode, and only results of
+    this cache's mode are read, so an address that passed the syntax check is
+    still checked with DNS by a cache with check_deliverability set. The cache
+    file is read on first use.
+
+    Attributes:
+        path (str): The cache file, or None to keep results in memory only.
+        check_deliverability (bool): Whether addresses are also checked with DNS.
+
+    Methods:
+        validate(self, email_address) -> str:
+            Returns the normalized address, or None if it is invalid.
+        save(self):
+            Appends the results not yet in the cache file.
+    """
+
+    def __init__(self, path: str = default_cache_path, check_deliverability: bool = False):
+        """
+        Initializes the cache.
+
+        Args:
+            path (str): The cache file, or None to keep results in memory only.
+            check_deliverability (bool): Whether addresses are also checked with DNS.
+        """
+        self.__path = path
+        self.__check_deliverability = check_deliverability
+        self.__mode = DELIVERABILITY if check_deliverability else SYNTAX
+        self.__results = None
+        self.__unsaved = []
+        self.__lock = threading.Lock()
+        atexit.register(self.save)
+
+    @property
+    def path(self) -> str:
+        """Returns the cache file, or None when results are kept in memory only."""
+        return self.__path
+
+    @property
+    def check_deliverability(self) -> bool:
+        """Returns whether addresses are also checked with DNS."""
+        return self.__check_deliverability
+
+    def __len__(self) -> int:
+        """Returns the number of addresses with a known result."""
+        with self.__lock:
+            return len(self.__load())
+
+    def validate(self, email_address: str) -> str | None:
+        """
+        Returns the normalized form of an email address, validating it on first sight.
+
+        Args:
+            email_address (str): The address to validate.
+
+        Returns:
+            str: The normalized address, or None if it is not valid.
+        """
+        with self.__lock:
+            results = self.__load()
+            normalized = results.get(email_address)
+            if normalized is None:
+                try:
+                    normalized = validate_email(email_address,
+                                                check_deliverability=self.__check_deliverability).normalized
+                except EmailNotValidError:
+                    normalized = ""
+                results[email_address] = normalized
+                self.__unsaved.append((email_address, normalized))
+        return normalized or None
+
+    def save(self) -> None:
+        """Appends the results not yet in the cache file."""
+        with self.__lock:
+            if self.__path is None or not self.__unsaved:
+                return
+            os.makedirs(os.path.dirname(self.__path) or ".", exist_ok=True)
+            rows = [(email_address, self.__mode, normalized) for email_address, normalized in self.__unsaved]
+            if os.path.exists(self.__path) and self.__read_header() != CACHE_FIELDS:
+                # A cache file without the mode column holds syntax-only results
+                with open(self.__path, newline='') as file:
+                    rows = [(row["email_address"], SYNTAX, row["normalized"])
+                            for row in csv.DictReader(file)] + rows
+                os.remove(self.__path)
+
+            new_file = not os.path.exists(self.__path)
+            with open(self.__path, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                if new_file:
+                    writer.writerow(CACHE_FIELDS)
+                writer.writerows(rows)
+            self.__unsaved.clear()
+
+    def __load(self) -> dict:
+        """Returns the results, reading the cache file on first use. Called with the lock held."""
+        if self.__results is None:
+            self.__results = {}
+            if self.__path is not None and os.path.exists(self.__path):
+                with open(self.__path, newline='') as file:
+                    for row in csv.DictReader(file):
+                        if (row.get("mode") or SYNTAX) == self.__mode:
+                            self.__results[row["email_address"]] = row["normalized"]
+        return self.__results
+
+    def __read_header(self) -> list:
+        """Returns the column names of the cache file."""
+        with open(self.__path, newline='') as file:
+            return next(csv.reader(file), [])
+
+# The cache shared by all clients
+email_validation = EmailValidationCache()
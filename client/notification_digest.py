@@ -0,0 +1,176 @@
+"""
+Description: This file defines the NotificationDigest class, which collects a client's alerts over
+a time window and sends them as one combined message per client per window.
+Author: Lovedeep Singh Sidhu
+"""
+
+import atexit
+import threading
+from collections import OrderedDict
+from utility.clock import clock
+from utility.email_backend import get_email_backend
+
+class _DigestWindow:
+    """The alerts collected for one client since its window opened."""
+
+    __slots__ = ("opened", "email_address", "header", "messages", "omitted")
+
+    def __init__(self, opened: float, email_address: str, header: str):
+        self.opened = opened
+        self.email_address = email_address
+        self.header = header
+        self.messages = []
+        self.omitted = 0
+
+class NotificationDigest:
+    """
+    A class to represent the notification digest.
+
+    A client's first alert opens a window of window_seconds. Alerts that arrive while
+    the window is open are collected, and when it closes the client receives one
+    email listing them. Memory is bounded: a window keeps at most max_messages
+    alerts and counts the rest, and when more than max_clients windows are open the
+    oldest is sent early. Windows are kept in the order they opened, so expired
+    windows are always at the front. Closed windows are taken out under the lock
+    and sent after it is released, so a slow email backend never blocks add().
+
+    Attributes:
+        window_seconds (float): How long alerts are collected before they are sent.
+        max_messages (int): The most alerts listed in one digest.
+        max_clients (int): The most clients with an open window.
+
+    Methods:
+        add(self, client, message):
+            Adds an alert to the client's digest.
+        flush_expired(self):
+            Sends the digests whose window has closed.
+        flush(self):
+            Sends every digest now.
+    """
+
+    def __init__(self, window_seconds: float = 15 * 60, max_messages: int = 20, max_clients: int = 100000,
+                 outbox=None):
+        """
+        Initializes the digest.
+
+        Args:
+            window_seconds (float): How long alerts are collected before they are sent.
+            max_messages (int): The most alerts listed in one digest.
+            max_clients (int): The most clients with an open window.
+            outbox (EmailBackend): Where the digests are sent. Defaults to the configured backend.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if window_seconds <= 0 or max_messages < 1 or max_clients < 1:
+            raise ValueError("Digest window and limits must be positive.")
+
+        self.__window_seconds = window_seconds
+        self.__max_messages = max_messages
+        self.__max_clients = max_clients
+        self.__outbox = outbox
+        self.__windows = OrderedDict()
+        self.__timer = None
+        self.__lock = threading.Lock()
+        atexit.register(self.flush)
+
+    @property
+    def window_seconds(self) -> float:
+        """Returns how long alerts are collected before they are sent."""
+        return self.__window_seconds
+
+    @property
+    def max_messages(self) -> int:
+        """Returns the most alerts listed in one digest."""
+        return self.__max_messages
+
+    @property
+    def max_clients(self) -> int:
+        """Returns the most clients with an open window."""
+        return self.__max_clients
+
+    def __len__(self) -> int:
+        """Returns the number of clients with an open window."""
+        return len(self.__windows)
+
+    def add(self, client, message) -> None:
+        """
+        Adds an alert to the client's digest, opening a window if none is open.
+
+        Args:
+            client (Client): The client being notified.
+            message (Notification | str): The alert.
+        """
+        now = clock.time()
+        with self.__lock:
+            closed = self.__pop_expired(now)
+
+            window = self.__windows.get(client.client_number)
+            if window is None:
+                if len(self.__windows) >= self.__max_clients:
+                    closed.append(self.__windows.popitem(last=False)[1])
+                header = f"Notification for {client.client_number}: {client.first_name} {client.last_name}:"
+                window = _DigestWindow(now, client.email_address, header)
+                self.__windows[client.client_number] = window
+                self.__schedule()
+
+            if len(window.messages) < self.__max_messages:
+                window.messages.append(str(message))
+            else:
+                window.omitted += 1
+        self.__send_all(closed)
+
+    def flush_expired(self) -> None:
+        """Sends the digests whose window has closed."""
+        with self.__lock:
+            closed = self.__pop_expired(clock.time())
+        self.__send_all(closed)
+
+    def flush(self) -> None:
+        """Sends every digest now."""
+        with self.__lock:
+            closed = list(self.__windows.values())
+            self.__windows.clear()
+        self.__send_all(closed)
+
+    def __on_timer(self) -> None:
+        """Sends the expired digests when the oldest window's timer fires."""
+        with self.__lock:
+            self.__timer = None
+            closed = self.__pop_expired(clock.time())
+            self.__schedule()
+        self.__send_all(closed)
+
+    def __pop_expired(self, now: float) -> list:
+        """Removes and returns the windows that have closed. Called with the lock held."""
+        closed = []
+        while self.__windows:
+            window = next(iter(self.__windows.values()))
+            if window.opened + self.__window_seconds > now:
+                break
+            closed.append(self.__windows.popitem(last=False)[1])
+        return closed
+
+    def __send_all(self, windows: list) -> None:
+        """Sends closed windows in the order they opened. Called without the lock."""
+        for window in windows:
+            self.__send(window)
+
+    def __send(self, window: _DigestWindow) -> None:
+        """Sends one digest through the outbox or the configured backend."""
+        count = len(window.messages) + window.omitted
+        lines = [f"{window.header} {count} alerts"] + [f"  {message}" for message in window.messages]
+        if window.omitted:
+            lines.append(f"  ...and {window.omitted} more")
+        subject = f"ALERT: Unusual Activity Digest: {clock.now().isoformat(timespec='minutes')}"
+        (self.__outbox or get_email_backend()).send(window.email_address, subject, "\n".join(lines))
+
+    def __schedule(self) -> None:
+        """Starts a timer for the oldest open window if none is running. Called with the lock held."""
+        if self.__timer is not None or not self.__windows:
+            return
+        oldest = next(iter(self.__windows.values()))
+        delay = max(oldest.opened + self.__window_seconds - clock.time(), 0)
+        self.__timer = threading.Timer(delay, self.__on_timer)
+        self.__timer.daemon = True
+        self.__timer.start()
@@ -0,0 +1,6 @@
+# import event_sourcing package
+from .account_event import AccountEvent, OPENED, DEPOSITED, WITHDREW, FEE_CHARGED
+from .balance_time_index import BalanceTimeIndex
+from .event_store import EventStore
+
+__all__ = ["AccountEvent", "BalanceTimeIndex", "EventStore", "OPENED", "DEPOSITED", "WITHDREW", "FEE_CHARGED"]
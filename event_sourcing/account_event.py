@@ -0,0 +1,124 @@
+"""
+Description: This module defines the AccountEvent class, a single entry in the ordered
+log of account events used by the event-sourced account store.
+Author: Lovedeep Singh Sidhu
+"""
+
+from datetime import datetime
+
+# Event types recorded in the account event log
+OPENED = "opened"
+DEPOSITED = "deposited"
+WITHDREW = "withdrew"
+FEE_CHARGED = "fee_charged"
+
+EVENT_TYPES = (OPENED, DEPOSITED, WITHDREW, FEE_CHARGED)
+
+class AccountEvent:
+    """
+    A class to represent one immutable event in the account event log.
+
+    Attributes:
+        sequence (int): Position of the event in the log (starting at 1).
+        timestamp (datetime): When the event happened.
+        account_number (int): The account the event applies to.
+        event_type (str): One of OPENED, DEPOSITED, WITHDREW or FEE_CHARGED.
+        amount (float): The positive amount of the event (opening balance for OPENED).
+
+    Methods:
+        balance_change(self) -> float:
+            Returns the signed change the event makes to the account balance.
+        to_row(self) -> list:
+            Returns the event as a row for the event log file.
+        from_row(row) -> AccountEvent:
+            Creates an event from a row of the event log file.
+    """
+
+    __slots__ = ("__sequence", "__timestamp", "__account_number", "__event_type", "__amount")
+
+    def __init__(self, sequence: int, timestamp: datetime, account_number: int, event_type: str, amount: float):
+        """
+        Initializes an AccountEvent object.
+
+        Args:
+            sequence (int): Position of the event in the log.
+            timestamp (datetime): When the event happened.
+            account_number (int): The account the event applies to.
+            event_type (str): The type of event.
+            amount (float): The amount of the event.
+
+        Raises:
+            ValueError: If the event type is unknown or the amount is invalid.
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Not a valid event type: {event_type}")
+
+        amount = float(amount)
+        if event_type != OPENED and amount < 0:
+            raise ValueError(f"Event amount: ${amount:,.2f} must not be negative.")
+
+        self.__sequence = int(sequence)
+        self.__timestamp = timestamp
+        self.__account_number = int(account_number)
+        self.__event_type = event_type
+        self.__amount = amount
+
+    @property
+    def sequence(self) -> int:
+        """Returns the position of the event in the log."""
+        return self.__sequence
+
+    @property
+    def timestamp(self) -> datetime:
+        """Returns when the event happened."""
+        return self.__timestamp
+
+    @property
+    def account_number(self) -> int:
+        """Returns the account number the event applies to."""
+        return self.__account_number
+
+    @property
+    def event_type(self) -> str:
+        """Returns the type of the event."""
+        return self.__event_type
+
+    @property
+    def amount(self) -> float:
+        """Returns the amount of the event."""
+        return self.__amount
+
+    def balance_change(self) -> float:
+        """
+        Returns the signed change the event makes to the account balance.
+
+        An OPENED event sets the opening balance, so its change is the full amount.
+        """
+        if self.__event_type in (WITHDREW, FEE_CHARGED):
+            return -self.__amount
+        return self.__amount
+
+    def to_row(self) -> list:
+        """Returns the event as a row for the event log file."""
+        return [self.__sequence, self.__timestamp.isoformat(), self.__account_number,
+                self.__event_type, self.__amount]
+
+    @staticmethod
+    def from_row(row: list) -> "AccountEvent":
+        """
+        Creates an event from a row of the event log file.
+
+        Args:
+            row (list): The sequence, timestamp, account number, event type and amount.
+
+        Returns:
+            AccountEvent: The event stored in the row.
+        """
+        sequence, timestamp, account_number, event_type, amount = row
+        return AccountEvent(int(sequence), datetime.fromisoformat(timestamp),
+                            int(account_number), event_type, float(amount))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the event."""
+        return (f"#{self.__sequence} {self.__timestamp.isoformat()} "
+                f"Account Number: {self.__account_number} {self.__event_type} ${self.__amount:,.2f}")
@@ -0,0 +1,230 @@
+"""
+Description: This module defines the BalanceTimeIndex class, a per-account time index over the
+account event log that answers point-in-time ("as of") balance queries.
+Author: Lovedeep Singh Sidhu
+"""
+
+from datetime import date, datetime, timedelta
+import numpy as np
+
+class BalanceTimeIndex:
+    """
+    A class to represent a time index of account balances.
+
+    Events are stored sorted by account number and then by timestamp, together with the
+    balance of the account after each event. Each account therefore owns one contiguous,
+    time-sorted segment, and the balance as of a moment is found with one binary search.
+
+    Attributes:
+        last_sequence (int): Sequence number of the last event covered by the index.
+
+    Methods:
+        from_events(events) -> BalanceTimeIndex:
+            Builds the index from account events.
+        extended(self, events) -> BalanceTimeIndex:
+            Returns an index that also covers events appended to the log later.
+        balance_as_of(self, account_number, when) -> float | None:
+            Returns the balance of one account at the end of a date or at a moment.
+        balances_as_of(self, account_numbers, when) -> np.ndarray:
+            Returns the balances of many accounts in one vectorized pass.
+        save(self, path) / load(path):
+            Stores and restores the index.
+    """
+
+    def __init__(self, account_numbers: np.ndarray, timestamps: np.ndarray,
+                 balances: np.ndarray, last_sequence: int = 0):
+        """
+        Initializes the BalanceTimeIndex from arrays already sorted by account and time.
+
+        Args:
+            account_numbers (np.ndarray): Account number of each event.
+            timestamps (np.ndarray): Timestamp of each event as datetime64[us].
+            balances (np.ndarray): Balance of the account after each event.
+            last_sequence (int): Sequence number of the last event covered.
+        """
+        self.__account_numbers = np.asarray(account_numbers, dtype=np.int64)
+        self.__timestamps = np.asarray(timestamps, dtype='datetime64[us]')
+        self.__balances = np.asarray(balances, dtype=np.float64)
+        self.__last_sequence = last_sequence
+
+        # One segment per account: unique account numbers and where their events start
+        self.__accounts, self.__starts = np.unique(self.__account_numbers, return_index=True)
+        self.__ends = np.append(self.__starts[1:], len(self.__account_numbers))
+        self.__segments = {int(account): (int(start), int(end))
+                           for account, start, end in zip(self.__accounts, self.__starts, self.__ends)}
+
+        # Composite keys (segment, time rank) for the vectorized bulk search
+        self.__distinct_times = np.unique(self.__timestamps)
+        segment_of_event = np.repeat(np.arange(len(self.__accounts), dtype=np.int64),
+                                     self.__ends - self.__starts)
+        self.__key_stride = len(self.__distinct_times) + 1
+        self.__keys = (segment_of_event * self.__key_stride +
+                       np.searchsorted(self.__distinct_times, self.__timestamps, side='right'))
+
+    @staticmethod
+    def from_events(events) -> "BalanceTimeIndex":
+        """
+        Builds the index from account events.
+
+        Args:
+            events: Iterable of AccountEvent objects in log order.
+
+        Returns:
+            BalanceTimeIndex: The index over the events.
+        """
+        account_numbers, timestamps, sequences, changes = [], [], [], []
+        for event in events:
+            account_numbers.append(event.account_number)
+            timestamps.append(event.timestamp)
+            sequences.append(event.sequence)
+            changes.append(event.balance_change())
+
+        account_numbers = np.array(account_numbers, dtype=np.int64)
+        timestamps = np.array(timestamps, dtype='datetime64[us]')
+        sequences = np.array(sequences, dtype=np.int64)
+        order = np.lexsort((sequences, timestamps, account_numbers))
+
+        # Fold each account in time order so the balances match a replay of the log
+        balances = np.empty(len(order), dtype=np.float64)
+        running_account, running_balance = None, 0.0
+        for position, event_position in enumerate(order):
+            account = account_numbers[event_position]
+            if account != running_account:
+                running_account, running_balance = account, 0.0
+            running_balance += changes[event_position]
+            balances[position] = running_balance
+
+        last_sequence = int(sequences.max()) if len(sequences) else 0
+        return BalanceTimeIndex(account_numbers[order], timestamps[order], balances, last_sequence)
+
+    def extended(self, events) -> "BalanceTimeIndex":
+        """
+        Returns an index that also covers events appended to the log after this one was built.
+
+        The new events are merged into the sorted arrays and only the accounts they
+        touch are folded again, from their first new event on. Events appended in
+        time order therefore leave every existing balance as it is.
+
+        Args:
+            events: Iterable of AccountEvent objects in log order.
+
+        Returns:
+            BalanceTimeIndex: The index over the old and new events.
+        """
+        events = list(events)
+        if not events:
+            return self
+
+        count = len(self.__account_numbers)
+        changes = [event.balance_change() for event in events]
+        account_numbers = np.concatenate((self.__account_numbers,
+                                          np.array([event.account_number for event in events], dtype=np.int64)))
+        timestamps = np.concatenate((self.__timestamps,
+                                     np.array([event.timestamp for event in events], dtype='datetime64[us]')))
+        # Old events come before new ones at the same time, as they do in the log
+        order = np.lexsort((np.arange(len(account_numbers)), timestamps, account_numbers))
+        account_numbers, timestamps = account_numbers[order], timestamps[order]
+        balances = np.concatenate((self.__balances, np.zeros(len(events))))[order]
+
+        first_new = {}
+        for position in np.flatnonzero(order >= count):
+            first_new.setdefault(int(account_numbers[position]), int(position))
+
+        for account, start in first_new.items():
+            end = int(np.searchsorted(account_numbers, account, side='right'))
+            running = balances[start - 1] if start > 0 and account_numbers[start - 1] == account else 0.0
+            previous_old = running
+            for position in range(start, end):
+                source = order[position]
+                if source >= count:
+                    running += changes[source - count]
+                else:
+                    # An old event after a backdated new one keeps its own change
+                    running += self.__balances[source] - previous_old
+                    previous_old = self.__balances[source]
+                balances[position] = running
+
+        last_sequence = max(self.__last_sequence, max(event.sequence for event in events))
+        return BalanceTimeIndex(account_numbers, timestamps, balances, last_sequence)
+
+    @property
+    def last_sequence(self) -> int:
+        """Returns the sequence number of the last event covered by the index."""
+        return self.__last_sequence
+
+    def balance_as_of(self, account_number: int, when) -> float | None:
+        """
+        Returns the balance of one account as of a date or moment.
+
+        Args:
+            account_number (int): The account to look up.
+            when (date | datetime): A date means the end of that day.
+
+        Returns:
+            float | None: The balance, or None if the account was not open yet.
+        """
+        segment = self.__segments.get(account_number)
+        if segment is None:
+            return None
+
+        start, end = segment
+        count = np.searchsorted(self.__timestamps[start:end], _upper_bound(when), side='left')
+        if count == 0:
+            return None
+        return float(self.__balances[start + count - 1])
+
+    def balances_as_of(self, account_numbers, when) -> np.ndarray:
+        """
+        Returns the balances of many accounts in one vectorized pass.
+
+        Args:
+            account_numbers: Sequence of account numbers.
+            when: A single date/datetime for all accounts, or one per account.
+
+        Returns:
+            np.ndarray: Balances in query order; NaN where an account is unknown or not open yet.
+        """
+        queries = np.asarray(account_numbers, dtype=np.int64)
+        if isinstance(when, (date, datetime, np.datetime64)):
+            bounds = np.full(len(queries), _upper_bound(when), dtype='datetime64[us]')
+        else:
+            bounds = np.array([_upper_bound(moment) for moment in when], dtype='datetime64[us]')
+
+        result = np.full(len(queries), np.nan)
+        if len(self.__accounts) == 0 or len(queries) == 0:
+            return result
+
+        # Locate each queried account's segment
+        segment = np.searchsorted(self.__accounts, queries)
+        segment = np.minimum(segment, len(self.__accounts) - 1)
+        known = self.__accounts[segment] == queries
+
+        # Events strictly before the bound have a time rank below the bound's rank
+        ranks = np.searchsorted(self.__distinct_times, bounds, side='left')
+        positions = np.searchsorted(self.__keys, segment * self.__key_stride + ranks, side='right') - 1
+
+        found = known & (positions >= self.__starts[segment])
+        result[found] = self.__balances[positions[found]]
+        return result
+
+    def save(self, path: str) -> None:
+        """Stores the index in a NumPy .npz file."""
+        np.savez(path, account_numbers=self.__account_numbers, timestamps=self.__timestamps,
+                 balances=self.__balances, last_sequence=np.int64(self.__last_sequence))
+
+    @staticmethod
+    def load(path: str) -> "BalanceTimeIndex":
+        """Restores an index stored with save()."""
+        with np.load(path) as stored:
+            return BalanceTimeIndex(stored['account_numbers'], stored['timestamps'],
+                                    stored['balances'], int(stored['last_sequence']))
+
+def _upper_bound(when) -> np.datetime64:
+    """Returns the exclusive upper time bound for an as-of query."""
+    if isinstance(when, np.datetime64):
+        return when.astype('datetime64[us]') + np.timedelta64(1, 'us')
+    if isinstance(when, datetime):
+        return np.datetime64(when, 'us') + np.timedelta64(1, 'us')
+    if isinstance(when, date):
+        return np.datetime64(datetime.combine(when + timedelta(days=1), datetime.min.time()), 'us')
+    raise ValueError(f"As-of value: {when} must be a date or datetime.")
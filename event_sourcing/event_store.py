@@ -0,0 +1,342 @@
+"""
+Description: This module defines the EventStore class, which keeps account balances as an
+ordered, append-only log of account events with periodic balance snapshots.
+Author: Lovedeep Singh Sidhu
+"""
+
+import copy
+import csv
+import io
+import os
+from datetime import datetime
+from bank_account.bank_account import BankAccount
+from utility.clock import clock
+from event_sourcing.account_event import AccountEvent, OPENED, DEPOSITED, WITHDREW, FEE_CHARGED
+from event_sourcing.balance_time_index import BalanceTimeIndex
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(__file__))
+
+# Default locations of the event log and its snapshots
+default_log_path = os.path.join(root_dir, 'data', 'account_events.csv')
+default_snapshot_dir = os.path.join(root_dir, 'data', 'snapshots')
+
+LOG_FIELDS = ["sequence", "timestamp", "account_number", "event_type", "amount"]
+SNAPSHOT_INDEX_FIELDS = ["sequence", "log_offset", "snapshot_file"]
+
+class EventStore:
+    """
+    A class to represent the event-sourced store of account balances.
+
+    The event log is the source of truth. Balances are rebuilt by loading the latest
+    snapshot and folding only the events written after it, so the rebuild time depends
+    on the snapshot interval rather than on the length of the log.
+
+    Attributes:
+        log_path (str): Path to the event log file.
+        snapshot_dir (str): Directory holding the snapshot files and their index.
+        snapshot_interval (int): Number of events between snapshots (0 disables snapshots).
+
+    Methods:
+        append(self, account_number, event_type, amount, timestamp=None) -> AccountEvent:
+            Appends an event to the log and applies it to the current balances.
+        open_account(self, account) -> AccountEvent:
+            Records the opening balance of an account.
+        deposit(self, account, amount) -> AccountEvent:
+            Deposits into the account and records the event.
+        withdraw(self, account, amount) -> AccountEvent:
+            Withdraws from the account and records the event.
+        charge_fee(self, account, amount) -> AccountEvent:
+            Charges a fee to the account and records the event.
+        events(self, from_offset=0):
+            Yields the events stored in the log.
+        rebuild_balances(self) -> dict:
+            Rebuilds the balances from the latest snapshot and the events after it.
+        take_snapshot(self) -> None:
+            Writes a snapshot of the current balances.
+        time_index(self) -> BalanceTimeIndex:
+            Returns the per-account time index used for as-of balance queries.
+    """
+
+    def __init__(self, log_path: str = default_log_path, snapshot_dir: str = default_snapshot_dir,
+                 snapshot_interval: int = 1000):
+        """
+        Initializes the EventStore and rebuilds the current balances from disk.
+
+        Args:
+            log_path (str): Path to the event log file.
+            snapshot_dir (str): Directory holding the snapshot files.
+            snapshot_interval (int): Number of events between snapshots.
+
+        Raises:
+            ValueError: If the snapshot interval is negative.
+        """
+        if not isinstance(snapshot_interval, int) or snapshot_interval < 0:
+            raise ValueError("Snapshot interval must be a non-negative integer.")
+
+        self.__log_path = log_path
+        self.__snapshot_dir = snapshot_dir
+        self.__snapshot_interval = snapshot_interval
+        self.__snapshot_index_path = os.path.join(snapshot_dir, 'snapshot_index.csv')
+        self.__time_index_path = os.path.splitext(log_path)[0] + '_time_index.npz'
+        self.__time_index = None
+        self.__unindexed = []
+
+        self.__balances = {}
+        self.__last_sequence = 0
+        self.__events_since_snapshot = 0
+        self.rebuild_balances()
+
+    @property
+    def log_path(self) -> str:
+        """Returns the path to the event log file."""
+        return self.__log_path
+
+    @property
+    def snapshot_interval(self) -> int:
+        """Returns the number of events between snapshots."""
+        return self.__snapshot_interval
+
+    @property
+    def last_sequence(self) -> int:
+        """Returns the sequence number of the last event in the log."""
+        return self.__last_sequence
+
+    @property
+    def balances(self) -> dict:
+        """Returns a copy of the current balances keyed by account number."""
+        return dict(self.__balances)
+
+    def balance(self, account_number: int) -> float:
+        """
+        Returns the current balance of an account.
+
+        Raises:
+            KeyError: If the account has never been opened in the log.
+        """
+        return self.__balances[account_number]
+
+    # Writing events
+    def append(self, account_number: int, event_type: str, amount: float,
+               timestamp: datetime = None) -> AccountEvent:
+        """
+        Appends an event to the log and applies it to the current balances.
+
+        Args:
+            account_number (int): The account the event applies to.
+            event_type (str): The type of event.
+            amount (float): The amount of the event.
+            timestamp (datetime): When the event happened. Defaults to now.
+
+        Returns:
+            AccountEvent: The event that was written.
+
+        Raises:
+            ValueError: If the event is invalid or the account has not been opened.
+        """
+        if event_type != OPENED and account_number not in self.__balances:
+            raise ValueError(f"Account Number: {account_number} has not been opened.")
+        if event_type == OPENED and account_number in self.__balances:
+            raise ValueError(f"Account Number: {account_number} has already been opened.")
+
+        event = AccountEvent(self.__last_sequence + 1, timestamp or clock.now(),
+                             account_number, event_type, amount)
+
+        os.makedirs(os.path.dirname(self.__log_path) or ".", exist_ok=True)
+        write_header = not os.path.exists(self.__log_path) or os.path.getsize(self.__log_path) == 0
+        with open(self.__log_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            if write_header:
+                writer.writerow(LOG_FIELDS)
+            writer.writerow(event.to_row())
+
+        self.__apply(event)
+        if self.__time_index is not None:
+            self.__unindexed.append(event)
+
+        if self.__snapshot_interval and self.__events_since_snapshot >= self.__snapshot_interval:
+            self.take_snapshot()
+
+        return event
+
+    def open_account(self, account: BankAccount) -> AccountEvent:
+        """Records the opening balance of an account."""
+        return self.append(account.account_number, OPENED, account.balance)
+
+    def deposit(self, account: BankAccount, amount: float) -> AccountEvent:
+        """
+        Records the event and then deposits into the account.
+
+        Raises:
+            ValueError: If the deposit is rejected by the account.
+        """
+        self.__check(account, "deposit", amount)
+        event = self.append(account.account_number, DEPOSITED, amount)
+        account.deposit(amount)
+        return event
+
+    def withdraw(self, account: BankAccount, amount: float) -> AccountEvent:
+        """
+        Records the event and then withdraws from the account.
+
+        Raises:
+            ValueError: If the withdrawal is rejected by the account.
+        """
+        self.__check(account, "withdraw", amount)
+        event = self.append(account.account_number, WITHDREW, amount)
+        account.withdraw(amount)
+        return event
+
+    def charge_fee(self, account: BankAccount, amount: float) -> AccountEvent:
+        """
+        Records the event and then charges a fee to the account.
+
+        Raises:
+            ValueError: If the fee is not numeric.
+        """
+        self.__check(account, "charge_fee", amount)
+        event = self.append(account.account_number, FEE_CHARGED, amount)
+        account.charge_fee(amount)
+        return event
+
+    # Reading events
+    def events(self, from_offset: int = 0):
+        """
+        Yields the events stored in the log.
+
+        Args:
+            from_offset (int): Byte offset in the log to start reading from.
+
+        Yields:
+            AccountEvent: Each event in log order.
+        """
+        if not os.path.exists(self.__log_path):
+            return
+
+        with open(self.__log_path, mode='rb') as binary_file:
+            binary_file.seek(from_offset)
+            reader = csv.reader(io.TextIOWrapper(binary_file, encoding='utf-8', newline=''))
+            for row in reader:
+                if not row or row[0] == LOG_FIELDS[0]:
+                    continue
+                yield AccountEvent.from_row(row)
+
+    def rebuild_balances(self) -> dict:
+        """
+        Rebuilds the balances from the latest snapshot and the events written after it.
+
+        Returns:
+            dict: The rebuilt balances keyed by account number.
+        """
+        self.__balances = {}
+        self.__last_sequence = 0
+        self.__events_since_snapshot = 0
+        self.__unindexed = []
+
+        log_offset = 0
+        latest = self.__latest_snapshot()
+        if latest is not None:
+            sequence, log_offset, snapshot_file = latest
+            with open(os.path.join(self.__snapshot_dir, snapshot_file), newline='') as file:
+                for row in csv.DictReader(file):
+                    self.__balances[int(row['account_number'])] = float(row['balance'])
+            self.__last_sequence = sequence
+
+        for event in self.events(log_offset):
+            self.__apply(event)
+
+        return dict(self.__balances)
+
+    # Snapshots
+    def take_snapshot(self) -> None:
+        """Writes a snapshot of the current balances and records it in the snapshot index."""
+        os.makedirs(self.__snapshot_dir, exist_ok=True)
+        snapshot_file = f"snapshot_{self.__last_sequence:012d}.csv"
+        log_offset = os.path.getsize(self.__log_path) if os.path.exists(self.__log_path) else 0
+
+        # Write to a temporary file first so a partial snapshot is never picked up
+        snapshot_path = os.path.join(self.__snapshot_dir, snapshot_file)
+        with open(snapshot_path + ".tmp", mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["account_number", "balance"])
+            writer.writerows(self.__balances.items())
+        os.replace(snapshot_path + ".tmp", snapshot_path)
+
+        write_header = not os.path.exists(self.__snapshot_index_path)
+        with open(self.__snapshot_index_path, mode='a', newline='') as file:
+            writer = csv.writer(file)
+            if write_header:
+                writer.writerow(SNAPSHOT_INDEX_FIELDS)
+            writer.writerow([self.__last_sequence, log_offset, snapshot_file])
+
+        self.__events_since_snapshot = 0
+
+    # Time index
+    def time_index(self) -> BalanceTimeIndex:
+        """
+        Returns the per-account time index used for as-of balance queries.
+
+        The index is stored next to the event log. Events appended since it was
+        built are folded into it; it is only rebuilt from the log when it is missing
+        or out of date on disk.
+
+        Returns:
+            BalanceTimeIndex: An index covering every event in the log.
+        """
+        if self.__time_index is not None and self.__unindexed:
+            self.__time_index = self.__time_index.extended(self.__unindexed)
+            self.__unindexed = []
+            if self.__time_index.last_sequence == self.__last_sequence:
+                self.__time_index.save(self.__time_index_path)
+
+        if self.__time_index is not None and self.__time_index.last_sequence == self.__last_sequence:
+            return self.__time_index
+
+        if os.path.exists(self.__time_index_path):
+            stored = BalanceTimeIndex.load(self.__time_index_path)
+            if stored.last_sequence == self.__last_sequence:
+                self.__time_index = stored
+                return stored
+
+        self.__time_index = BalanceTimeIndex.from_events(self.events())
+        if self.__last_sequence:
+            self.__time_index.save(self.__time_index_path)
+        return self.__time_index
+
+    def balance_as_of(self, account_number: int, when) -> float | None:
+        """Returns the balance of an account at the end of a date or at a moment."""
+        return self.time_index().balance_as_of(account_number, when)
+
+    def balances_as_of(self, account_numbers, when):
+        """Returns the balances of many accounts as of a date or moment (NaN if not open)."""
+        return self.time_index().balances_as_of(account_numbers, when)
+
+    def __check(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Runs an operation on a copy of the account, so a rejected one raises before its
+        event is written. The deep copy has no observers and its own withdrawal counters.
+        """
+        getattr(copy.deepcopy(account), operation)(amount)
+
+    def __latest_snapshot(self):
+        """Returns the sequence, log offset and file of the latest snapshot, or None."""
+        if not os.path.exists(self.__snapshot_index_path):
+            return None
+
+        latest = None
+        with open(self.__snapshot_index_path, newline='') as file:
+            for row in csv.DictReader(file):
+                snapshot_file = row['snapshot_file']
+                if os.path.exists(os.path.join(self.__snapshot_dir, snapshot_file)):
+                    latest = (int(row['sequence']), int(row['log_offset']), snapshot_file)
+        return latest
+
+    def __apply(self, event: AccountEvent) -> None:
+        """Folds a single event into the current balances."""
+        if event.event_type == OPENED:
+            self.__balances[event.account_number] = event.amount
+        else:
+            self.__balances[event.account_number] = (
+                self.__balances.get(event.account_number, 0.0) + event.balance_change())
+        self.__last_sequence = event.sequence
+        self.__events_since_snapshot += 1
@@ -0,0 +1,74 @@
+"""
+Description: This file defines functions to seed the event log from the current account data
+and to check that replaying the event log matches the balances in accounts.csv.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import sys
+# THIS LINE IS NEEDED SO THAT THE TOOL CAN RUN FROM THIS DIRECTORY.
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from event_sourcing.event_store import EventStore
+
+def seed_event_store(store: EventStore, accounts: dict) -> int:
+    """
+    Records an 'opened' event for every account that is not yet in the event log.
+
+    Args:
+        store (EventStore): The event store to seed.
+        accounts (dict): Bank accounts keyed by account number.
+
+    Returns:
+        int: The number of accounts that were opened in the log.
+    """
+    balances = store.balances
+    opened = 0
+    for account in accounts.values():
+        if account.account_number not in balances:
+            store.open_account(account)
+            opened += 1
+    return opened
+
+def verify_replay(store: EventStore, accounts: dict, tolerance: float = 0.005) -> list[tuple]:
+    """
+    Replays the event log and compares the result with the given account balances.
+
+    Args:
+        store (EventStore): The event store to replay.
+        accounts (dict): Bank accounts keyed by account number, normally from load_data().
+        tolerance (float): Largest difference accepted as a match.
+
+    Returns:
+        list[tuple]: One (account_number, csv_balance, replayed_balance) entry per mismatch.
+            A balance of None means the account is missing from that side.
+    """
+    replayed = store.rebuild_balances()
+    mismatches = []
+
+    for account_number, account in accounts.items():
+        replayed_balance = replayed.get(account_number)
+        if replayed_balance is None or abs(replayed_balance - account.balance) > tolerance:
+            mismatches.append((account_number, account.balance, replayed_balance))
+
+    for account_number, replayed_balance in replayed.items():
+        if account_number not in accounts:
+            mismatches.append((account_number, None, replayed_balance))
+
+    return sorted(mismatches, key=lambda mismatch: mismatch[0])
+
+
+if __name__ == "__main__":
+    from user_interface.manage_data import load_data
+
+    clients, accounts = load_data()
+    store = EventStore()
+
+    if "--seed" in sys.argv:
+        print(f"Opened {seed_event_store(store, accounts)} accounts in the event log.")
+
+    mismatches = verify_replay(store, accounts)
+    print(f"Replayed {store.last_sequence} events for {len(accounts)} accounts.")
+    for account_number, csv_balance, replayed_balance in mismatches:
+        print(f"Account Number: {account_number} CSV: {csv_balance} Replayed: {replayed_balance}")
+    print("Replay matches accounts.csv." if not mismatches else f"{len(mismatches)} mismatches found.")
+    sys.exit(1 if mismatches else 0)
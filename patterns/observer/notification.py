@@ -0,0 +1,95 @@
+"""
+Description: This module defines the notification topics observers can subscribe to and the
+Notification class, a structured account event whose message text is rendered on first use.
+Author: Lovedeep Singh Sidhu
+"""
+
+# Notification topics
+LOW_BALANCE = "low_balance"
+LARGE_TRANSACTION = "large_transaction"
+FEE_CHARGED = "fee_charged"
+OVERDRAFT = "overdraft"
+TOPICS = (LOW_BALANCE, LARGE_TRANSACTION, FEE_CHARGED, OVERDRAFT)
+
+# Message text of each topic
+_TEMPLATES = {
+    LOW_BALANCE: "Low balance warning ${balance:.2f}: on account {account_number}.",
+    LARGE_TRANSACTION: "Large transaction ${amount:.2f}: on account {account_number}.",
+    FEE_CHARGED: "Service charge ${amount:.2f}: on account {account_number}.",
+    OVERDRAFT: "Overdraft: balance ${balance:.2f}: on account {account_number}.",
+}
+
+class Notification:
+    """
+    A class to represent a notification about an account.
+
+    The message text is only built the first time it is needed, so creating a
+    notification that no observer renders costs no string formatting. str() of a
+    notification is its message, so observers written for plain text messages
+    keep working.
+
+    Attributes:
+        topic (str): One of TOPICS.
+        account_number (int): The account the notification is about.
+        amount (float): The transaction or fee amount.
+        balance (float): The account balance after the change.
+        message (str): The rendered message text.
+    """
+
+    __slots__ = ("__topic", "__account_number", "__amount", "__balance", "__message")
+
+    def __init__(self, topic: str, account_number: int, amount: float, balance: float):
+        """
+        Initializes a Notification object.
+
+        Args:
+            topic (str): One of TOPICS.
+            account_number (int): The account the notification is about.
+            amount (float): The transaction or fee amount.
+            balance (float): The account balance after the change.
+
+        Raises:
+            ValueError: If the topic is unknown.
+        """
+        if topic not in _TEMPLATES:
+            raise ValueError(f"Not a valid notification topic: {topic}")
+        self.__topic = topic
+        self.__account_number = account_number
+        self.__amount = amount
+        self.__balance = balance
+        self.__message = None
+
+    @property
+    def topic(self) -> str:
+        """Returns the topic of the notification."""
+        return self.__topic
+
+    @property
+    def account_number(self) -> int:
+        """Returns the account the notification is about."""
+        return self.__account_number
+
+    @property
+    def amount(self) -> float:
+        """Returns the transaction or fee amount."""
+        return self.__amount
+
+    @property
+    def balance(self) -> float:
+        """Returns the account balance after the change."""
+        return self.__balance
+
+    @property
+    def message(self) -> str:
+        """Returns the message text, rendering it on first use."""
+        if self.__message is None:
+            self.__message = _TEMPLATES[self.__topic].format(account_number=self.__account_number,
+                                                             amount=self.__amount, balance=self.__balance)
+        return self.__message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return (f"Notification({self.__topic!r}, {self.__account_number}, "
+                f"amount={self.__amount}, balance={self.__balance})")
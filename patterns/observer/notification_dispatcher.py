@@ -0,0 +1,269 @@
+"""
+Description: This module contains the NotificationDispatcher class, which delivers observer
+notifications from a bounded queue on a background thread so that a transaction does not
+wait for its notifications to be sent.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import atexit
+import itertools
+import logging
+import pickle
+import threading
+from collections import deque
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# Default directory of the files that hold notifications spilled from a full queue
+default_spill_dir = os.path.join(root_dir, 'output')
+
+# Numbers the default spill files of the dispatchers in this process
+_spill_numbers = itertools.count(1)
+
+# What to do with a new notification when the queue is full
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+SPILL = "spill"
+POLICIES = (BLOCK, DROP_OLDEST, SPILL)
+
+class NotificationDispatcher:
+    """
+    Delivers notifications to observers on a background worker thread.
+
+    Subjects submit (observer, message) pairs, which are queued and passed to
+    observer.update() by the worker in the order they were submitted. The queue is
+    bounded; when it is full the backpressure policy decides what happens:
+
+        block: the submitting thread waits for room in the queue. An observer that
+            notifies again runs on the worker, which is the only thread that can make
+            room, so its notifications are queued past the capacity instead.
+        drop_oldest: the oldest queued notification is discarded.
+        spill: the notification is appended to a spill file and delivered once
+            the queue has drained. Each dispatcher has its own spill file, which is
+            emptied when the dispatcher is created; spilled messages are pickled so
+            observers receive the original objects.
+
+    Attributes:
+        capacity (int): The maximum number of queued notifications.
+        policy (str): The backpressure policy.
+        spill_path (str): The spill file used by the spill policy.
+        dropped (int): The number of notifications discarded by drop_oldest.
+        spilled (int): The number of notifications written to the spill file.
+        failed (int): The number of notifications whose observer raised an error.
+
+    Methods:
+        submit(observer, message): Queues a notification for delivery.
+        flush(timeout): Waits until every submitted notification has been delivered.
+        close(): Delivers the remaining notifications and stops the worker.
+    """
+
+    def __init__(self, capacity: int = 1000, policy: str = BLOCK, spill_path: str = None):
+        """
+        Initializes the dispatcher. The worker thread starts with the first notification.
+
+        Args:
+            capacity (int): The maximum number of queued notifications.
+            policy (str): 'block', 'drop_oldest' or 'spill'.
+            spill_path (str): The spill file used by the spill policy. Defaults to a file
+                in the output directory named after the process and the dispatcher.
+
+        Raises:
+            ValueError: If the capacity or policy is invalid.
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+        if policy not in POLICIES:
+            raise ValueError(f"Not a valid backpressure policy: {policy}")
+
+        self.__capacity = capacity
+        self.__policy = policy
+        self.__spill_path = spill_path or os.path.join(
+            default_spill_dir, f"notification_spill_{os.getpid()}_{next(_spill_numbers)}.pickle")
+        self.__queue = deque()
+        self.__condition = threading.Condition()
+        self.__worker = None
+        self.__closed = False
+        self.__in_flight = 0
+
+        # Spilled observers are kept here; only their messages go to disk
+        self.__spilled_observers = {}
+        self.__spill_count = 0
+        self.__spill_offset = 0
+
+        # Notifications left in the file by an earlier run belong to observers that are gone
+        if os.path.exists(self.__spill_path):
+            os.remove(self.__spill_path)
+
+        self.__dropped = 0
+        self.__spilled = 0
+        self.__failed = 0
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of queued notifications."""
+        return self.__capacity
+
+    @property
+    def policy(self) -> str:
+        """Returns the backpressure policy."""
+        return self.__policy
+
+    @property
+    def spill_path(self) -> str:
+        """Returns the spill file used by the spill policy."""
+        return self.__spill_path
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of notifications discarded by drop_oldest."""
+        return self.__dropped
+
+    @property
+    def spilled(self) -> int:
+        """Returns the number of notifications written to the spill file."""
+        return self.__spilled
+
+    @property
+    def failed(self) -> int:
+        """Returns the number of notifications whose observer raised an error."""
+        return self.__failed
+
+    def submit(self, observer, message) -> None:
+        """
+        Queues a notification for delivery to an observer.
+
+        Args:
+            observer: The observer to notify.
+            message: The message passed to observer.update().
+
+        Raises:
+            ValueError: If the dispatcher has been closed.
+        """
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("Notification dispatcher is closed.")
+            self.__start_worker()
+
+            if len(self.__queue) >= self.__capacity or self.__spill_count:
+                if self.__policy == BLOCK:
+                    if threading.current_thread() is not self.__worker:
+                        self.__condition.wait_for(lambda: len(self.__queue) < self.__capacity)
+                elif self.__policy == DROP_OLDEST:
+                    self.__queue.popleft()
+                    self.__dropped += 1
+                else:
+                    # Once anything has spilled, later notifications follow it to keep the order
+                    self.__spill(observer, message)
+                    return
+
+            self.__queue.append((observer, message))
+            self.__condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until every submitted notification has been delivered.
+
+        Args:
+            timeout (float): The longest time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            bool: True if everything was delivered.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: not self.__queue and not self.__spill_count and not self.__in_flight, timeout)
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Delivers the remaining notifications and stops the worker thread.
+
+        Args:
+            timeout (float): The longest time to wait for delivery in seconds.
+        """
+        self.flush(timeout)
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        if self.__worker is not None:
+            self.__worker.join(timeout)
+
+    def __start_worker(self) -> None:
+        """Starts the worker thread. Called with the condition held."""
+        if self.__worker is None:
+            self.__worker = threading.Thread(target=self.__run, name="notification-dispatcher", daemon=True)
+            self.__worker.start()
+            atexit.register(self.close)
+
+    def __run(self) -> None:
+        """Delivers queued notifications until the dispatcher is closed."""
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__queue or self.__spill_count or self.__closed)
+                if not self.__queue and self.__spill_count:
+                    try:
+                        self.__reload_spill()
+                    except Exception as e:
+                        # An unreadable spill file must not stop delivery of new notifications
+                        logging.error(f"Unable to reload spilled notifications: {e}")
+                        self.__discard_spill()
+                if not self.__queue:
+                    if self.__closed:
+                        return
+                    continue
+                observer, message = self.__queue.popleft()
+                self.__in_flight += 1
+                self.__condition.notify_all()
+
+            try:
+                observer.update(message)
+            except Exception as e:
+                self.__failed += 1
+                logging.error(f"Notification to {observer} failed: {e}")
+
+            with self.__condition:
+                self.__in_flight -= 1
+                self.__condition.notify_all()
+
+    def __spill(self, observer, message) -> None:
+        """Appends a notification to the spill file. Called with the condition held."""
+        try:
+            record = pickle.dumps((id(observer), message))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logging.warning(f"Spilling the text of a notification that cannot be pickled: {e}")
+            record = pickle.dumps((id(observer), str(message)))
+
+        os.makedirs(os.path.dirname(self.__spill_path) or ".", exist_ok=True)
+        self.__spilled_observers[id(observer)] = observer
+        with open(self.__spill_path, "ab") as file:
+            file.write(record)
+        self.__spill_count += 1
+        self.__spilled += 1
+        self.__condition.notify_all()
+
+    def __reload_spill(self) -> None:
+        """Moves up to a queue's worth of spilled notifications back into the queue. Called with the condition held."""
+        with open(self.__spill_path, "rb") as file:
+            file.seek(self.__spill_offset)
+            for _ in range(min(self.__capacity, self.__spill_count)):
+                key, message = pickle.load(file)
+                self.__spill_count -= 1
+                observer = self.__spilled_observers.get(key)
+                if observer is None:
+                    logging.warning(f"Skipping a spilled notification for an unknown observer: {message}")
+                    continue
+                self.__queue.append((observer, message))
+            self.__spill_offset = file.tell()
+
+        if not self.__spill_count:
+            self.__discard_spill()
+
+    def __discard_spill(self) -> None:
+        """Removes the spill file and forgets the spilled observers. Called with the condition held."""
+        if os.path.exists(self.__spill_path):
+            os.remove(self.__spill_path)
+        self.__spilled_observers.clear()
+        self.__spill_count = 0
+        self.__spill_offset = 0
+        self.__condition.notify_all()
@@ -14,12 +14,13 @@ class Observer(ABC):
     """
 
     @abstractmethod
-    def update(self, message: str):
+    def update(self, message):
         """
         This method gets called to notify the observer when the subject changes.
         
         Args:
-            message (str): A brief description of the change that occurred.
+            message (Notification | str): The change that occurred. str() of a
+                Notification is its message text.
         
         Raises:
             NotImplementedError: This exception is raised if the update method 
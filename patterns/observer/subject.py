@@ -4,33 +4,91 @@ the list of observers that need to be notified of changes.
 Author: Lovedeep Singh Sidhu
 """
 
+import weakref
+
 class Subject:
     """
     The base Subject class that keeps track of observers and notifies them
     whenever there are changes in state.
-    
+
+    Observers are held by weak reference in an insertion-ordered registry keyed by
+    object identity, so attach and detach take constant time, observers are notified
+    in the order they were attached, and an observer that is no longer used anywhere
+    else is removed automatically when it is garbage-collected.
+
+    An observer can subscribe to a subset of the notification topics. Subjects check
+    has_subscribers(topic) before building a notification, so a change nobody is
+    listening for costs no notification work.
+
     Attributes:
-        _observers (list): A protected list containing all the observers to be notified.
-    
+        _observers (dict): A protected registry of the observers' subscriptions, keyed by id.
+
     Methods:
-        attach(observer): Adds an observer to the notification list if it isn't already present.
+        attach(observer, topics): Adds an observer to the notification list if it isn't already present.
         detach(observer): Removes an observer from the notification list if it exists.
-        notify(message): Sends a notification message to all attached observers.
+        has_subscribers(topic): Returns whether any live observer wants a topic.
+        notify(message): Sends a notification message to the attached observers that want it.
+        observers: Returns the attached observers that are still alive, in order.
+        use_dispatcher(dispatcher): Delivers the notifications of every subject through a dispatcher.
     """
-    
+
+    # When set, notifications are queued on this dispatcher instead of delivered inline
+    _dispatcher = None
+
     def __init__(self):
-        """Initializes the Subject with an empty list of observers."""
-        self._observers = []
+        """Initializes the Subject with an empty observer registry."""
+        self._observers = {}
 
-    def attach(self, observer):
+    def __copy__(self):
+        """
+        Returns a shallow copy with its own observer registry.
+
+        The copy is notified to the same observers, but attaching or detaching
+        on the copy does not change the original.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._observers = {}
+        for subscription in tuple(self._observers.values()):
+            observer = subscription.reference()
+            if observer is not None:
+                clone.attach(observer, subscription.topics)
+        return clone
+
+    def __getstate__(self):
+        """
+        Returns the state to pickle, without the observers.
+
+        Weak references cannot be pickled, and an unpickled copy, such as an account
+        sent to a worker process, must not notify the original's observers.
+        """
+        state = self.__dict__.copy()
+        state["_observers"] = {}
+        return state
+
+    @property
+    def observers(self) -> list:
+        """Returns the attached observers that are still alive, in the order they were attached."""
+        return [observer for observer in (subscription.reference() for subscription in tuple(self._observers.values()))
+                if observer is not None]
+
+    def attach(self, observer, topics=None):
         """
         Adds an observer to the list of observers.
 
+        Attaching an observer again replaces its topics but keeps its place in the order.
+
         Args:
             observer: The observer instance that needs to be added.
+            topics (iterable): The notification topics the observer wants, or None for all.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        topics = None if topics is None else frozenset(topics)
+        key = id(observer)
+        subscription = self._observers.get(key)
+        if subscription is not None and subscription.reference() is observer:
+            subscription.topics = topics
+            return
+        self._observers[key] = _Subscription(_reference(observer, key, self._observers), topics)
 
     def detach(self, observer):
         """
@@ -39,15 +97,84 @@ class Subject:
         Args:
             observer: The observer instance that needs to be removed.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        key = id(observer)
+        subscription = self._observers.get(key)
+        if subscription is not None and subscription.reference() is observer:
+            del self._observers[key]
 
-    def notify(self, message: str):
+    def has_subscribers(self, topic: str) -> bool:
         """
-        Notifies all observers about a state change.
+        Returns whether any live observer wants notifications about a topic.
 
         Args:
-            message (str): The message to be sent to each observer.
+            topic (str): The notification topic.
+        """
+        for subscription in tuple(self._observers.values()):
+            if subscription.wants(topic) and subscription.reference() is not None:
+                return True
+        return False
+
+    def notify(self, message, topic: str = None):
         """
-        for observer in self._observers:
-            observer.update(message)
+        Notifies the observers that want a message about a state change.
+
+        The topic of a Notification is taken from the notification itself. Messages
+        without a topic go to the observers subscribed to all topics.
+
+        When a notification dispatcher is in use the notifications are queued and
+        delivered on its worker thread; otherwise each observer is updated inline.
+
+        Args:
+            message (Notification | str): The message to be sent to each observer.
+            topic (str): The topic of a plain text message.
+        """
+        topic = getattr(message, "topic", topic)
+        dispatcher = Subject._dispatcher
+        for subscription in tuple(self._observers.values()):
+            observer = subscription.reference()
+            if observer is None or not subscription.wants(topic):
+                continue
+            if dispatcher is None:
+                observer.update(message)
+            else:
+                dispatcher.submit(observer, message)
+
+    @staticmethod
+    def use_dispatcher(dispatcher):
+        """
+        Sets the notification dispatcher used by every subject.
+
+        Args:
+            dispatcher (NotificationDispatcher): The dispatcher, or None to notify inline.
+        """
+        Subject._dispatcher = dispatcher
+
+class _Subscription:
+    """An observer's weak reference and the topics it wants (None for all topics)."""
+
+    __slots__ = ("reference", "topics")
+
+    def __init__(self, reference, topics: frozenset):
+        self.reference = reference
+        self.topics = topics
+
+    def wants(self, topic: str) -> bool:
+        """Returns whether the observer wants a topic. Messages without a topic only go to observers of all topics."""
+        return self.topics is None or (topic is not None and topic in self.topics)
+
+def _reference(observer, key: int, registry: dict):
+    """
+    Returns a weak reference to an observer that removes itself from the registry
+    when the observer is garbage-collected. Observers that cannot be weakly
+    referenced are held strongly.
+    """
+    def prune(reference):
+        # The id may already belong to a newer observer
+        subscription = registry.get(key)
+        if subscription is not None and subscription.reference is reference:
+            del registry[key]
+
+    try:
+        return weakref.ref(observer, prune)
+    except TypeError:
+        return lambda: observer
@@ -0,0 +1,356 @@
+"""
+Description: This module loads table-driven fee rules from a data file and compiles them into
+fast evaluators for the per-account and bulk service charge paths.
+Author: Lovedeep Singh Sidhu
+"""
+
+import ast
+import copy
+import json
+import os
+from datetime import datetime
+import numpy as np
+from bank_account.bank_account import BankAccount
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from utility.clock import clock
+
+# Absolute path to root of directory
+root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# Default location of the fee rules
+default_fee_rules_path = os.path.join(root_dir, 'data', 'fee_rules.json')
+
+# Variables every rule may use, in addition to the constants and the account type's parameters
+RULE_VARIABLES = ("balance", "age_days")
+
+# Expression elements allowed in conditions and formulas
+_ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.Call,
+                  ast.Name, ast.Load, ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div,
+                  ast.USub, ast.UAdd, ast.Not, ast.And, ast.Or, ast.Lt, ast.LtE, ast.Gt,
+                  ast.GtE, ast.Eq, ast.NotEq)
+_ALLOWED_FUNCTIONS = ("min", "max")
+
+class FeeRuleSet:
+    """
+    A class to represent a compiled set of fee rules.
+
+    Rules are grouped by account type and checked in file order; the first rule whose
+    condition holds gives the charge, and an empty condition always holds. For each
+    account type the rules are compiled into two Python functions: a scalar one with
+    the same cost as a hand-written strategy, and a NumPy one for the bulk path.
+
+    Methods:
+        load(path) -> FeeRuleSet:
+            Loads and compiles the rules in a JSON file.
+        account_types(self) -> tuple:
+            Returns the account types the rules cover.
+        parameter_names(self, account_type) -> tuple:
+            Returns the account parameters used by the rules of an account type.
+        evaluate(self, account_type, balance, age_days, parameters) -> float:
+            Returns the charge of one account.
+        evaluate_bulk(self, account_type, balances, age_days, parameters) -> np.ndarray:
+            Returns the charges of many accounts of one type.
+    """
+
+    def __init__(self, definition: dict):
+        """
+        Compiles a rule definition.
+
+        Args:
+            definition (dict): 'constants', 'parameters' (per account type) and 'rules'.
+
+        Raises:
+            ValueError: If a rule is malformed or uses an unknown name or operation.
+        """
+        self.__definition = definition
+        constants = {name: float(value) for name, value in definition.get("constants", {}).items()}
+        parameters = {account_type: tuple(names) for account_type, names in definition.get("parameters", {}).items()}
+
+        rules_by_type = {}
+        for rule in definition.get("rules", []):
+            try:
+                account_type = rule["account_type"]
+                condition = rule.get("condition", "").strip()
+                formula = rule["formula"].strip()
+            except (KeyError, AttributeError) as e:
+                raise ValueError(f"Fee rule is missing a field: {e}")
+            rules_by_type.setdefault(account_type, []).append((condition, formula))
+
+        self.__parameters = {}
+        self.__uses_age = {}
+        self.__scalar = {}
+        self.__vector = {}
+        for account_type, rules in rules_by_type.items():
+            names = parameters.get(account_type, ())
+            allowed = set(RULE_VARIABLES) | set(names) | set(constants)
+            self.__parameters[account_type] = names
+            self.__uses_age[account_type] = any("age_days" in condition or "age_days" in formula
+                                                for condition, formula in rules)
+            self.__scalar[account_type], self.__vector[account_type] = _compile(
+                account_type, rules, RULE_VARIABLES + names, allowed, constants)
+
+    @staticmethod
+    def load(path: str = default_fee_rules_path) -> "FeeRuleSet":
+        """
+        Loads and compiles the rules in a JSON file.
+
+        Raises:
+            ValueError: If the file is not valid JSON or holds an invalid rule.
+        """
+        with open(path) as file:
+            try:
+                return FeeRuleSet(json.load(file))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Fee rules file is not valid: {e}")
+
+    def __reduce__(self):
+        """Pickles the rule definition; the evaluators are compiled again when unpickled."""
+        return (FeeRuleSet, (self.__definition,))
+
+    def account_types(self) -> tuple:
+        """Returns the account types the rules cover."""
+        return tuple(self.__scalar)
+
+    def covers(self, account_type: str) -> bool:
+        """Returns True if the rules cover the account type."""
+        return account_type in self.__scalar
+
+    def parameter_names(self, account_type: str) -> tuple:
+        """Returns the account parameters used by the rules of an account type."""
+        return self.__parameters[account_type]
+
+    def uses_age(self, account_type: str) -> bool:
+        """Returns True if the rules of an account type depend on the account age."""
+        return self.__uses_age[account_type]
+
+    def scalar_evaluator(self, account_type: str):
+        """Returns the compiled scalar function (balance, age_days, *parameters) of an account type."""
+        return self.__scalar[account_type]
+
+    def evaluate(self, account_type: str, balance: float, age_days: int, parameters: tuple) -> float:
+        """
+        Returns the charge of one account.
+
+        Args:
+            account_type (str): The class name of the account.
+            balance (float): The account balance.
+            age_days (int): Days since the account was created.
+            parameters (tuple): The values of parameter_names(account_type).
+
+        Returns:
+            float: The charge given by the first matching rule, or 0.0 if none match.
+        """
+        return self.__scalar[account_type](balance, age_days, *parameters)
+
+    def evaluate_bulk(self, account_type: str, balances: np.ndarray, age_days: np.ndarray,
+                      parameters: list) -> np.ndarray:
+        """
+        Returns the charges of many accounts of one type.
+
+        Args:
+            account_type (str): The class name of the accounts.
+            balances (np.ndarray): The account balances.
+            age_days (np.ndarray): Days since each account was created.
+            parameters (list): One array per name in parameter_names(account_type).
+
+        Returns:
+            np.ndarray: The charge of each account.
+        """
+        with np.errstate(all='ignore'):
+            return self.__vector[account_type](balances, age_days, *parameters)
+
+class RuleBasedStrategy(ServiceChargeStrategy):
+    """
+    A service charge strategy that evaluates the fee rules for an account type.
+
+    Like the other strategies it is immutable and shared between accounts with the
+    same parameters; the balance and creation date are read from the account.
+
+    Attributes:
+        rule_set (FeeRuleSet): The compiled fee rules.
+        account_type (str): The account type whose rules apply.
+        parameters (tuple): The account parameter values, in rule set order.
+    """
+
+    __slots__ = ("__rule_set", "__account_type", "__parameters", "__evaluator", "__uses_age")
+
+    def __init__(self, rule_set: FeeRuleSet, account_type: str, parameters: tuple):
+        """
+        Initializes the RuleBasedStrategy object.
+
+        Args:
+            rule_set (FeeRuleSet): The compiled fee rules.
+            account_type (str): The account type whose rules apply.
+            parameters (tuple): The account parameter values, in rule set order.
+        """
+        self.__rule_set = rule_set
+        self.__account_type = account_type
+        self.__parameters = tuple(parameters)
+
+        # Keep the compiled function at hand so a charge costs one call
+        self.__evaluator = rule_set.scalar_evaluator(account_type)
+        self.__uses_age = rule_set.uses_age(account_type)
+
+    def __reduce__(self):
+        """Pickles the strategy by its rule set, account type and parameters."""
+        return (RuleBasedStrategy, (self.__rule_set, self.__account_type, self.__parameters))
+
+    @property
+    def rule_set(self) -> FeeRuleSet:
+        """Returns the compiled fee rules."""
+        return self.__rule_set
+
+    @property
+    def account_type(self) -> str:
+        """Returns the account type whose rules apply."""
+        return self.__account_type
+
+    @property
+    def parameters(self) -> tuple:
+        """Returns the account parameter values."""
+        return self.__parameters
+
+    def calculate_service_charges(self, account: BankAccount) -> float:
+        """
+        Calculates the service charges for the account from the fee rules.
+
+        Args:
+            account (BankAccount): The bank account instance for which to calculate service charges.
+
+        Returns:
+            float: The computed service charge.
+        """
+        age_days = _age_days(account.date_created) if self.__uses_age else 0
+        return self.__evaluator(account.balance, age_days, *self.__parameters)
+
+    @classmethod
+    def calculate_service_charges_bulk(cls, strategies: list, accounts: list, balances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the service charges of many accounts with the compiled bulk evaluators.
+
+        Args:
+            strategies (list): The RuleBasedStrategy of each account.
+            accounts (list): The bank accounts.
+            balances (np.ndarray): The balance of each account.
+
+        Returns:
+            np.ndarray: The service charge of each account.
+        """
+        today = clock.today().toordinal()
+        age_days = today - np.fromiter((account.date_created.toordinal() for account in accounts),
+                                       dtype=np.int64, count=len(accounts))
+        charges = np.zeros(len(accounts))
+
+        groups = {}
+        for index, strategy in enumerate(strategies):
+            groups.setdefault((strategy.rule_set, strategy.account_type), []).append(index)
+
+        for (rule_set, account_type), indexes in groups.items():
+            indexes = np.array(indexes, dtype=np.int64)
+            columns = [np.array([strategies[index].parameters[position] for index in indexes], dtype=np.float64)
+                       for position in range(len(rule_set.parameter_names(account_type)))]
+            charges[indexes] = rule_set.evaluate_bulk(account_type, balances[indexes], age_days[indexes], columns)
+
+        return charges
+
+def load_fee_rules(path: str = default_fee_rules_path) -> FeeRuleSet | None:
+    """
+    Loads the fee rules file if it exists.
+
+    Returns:
+        FeeRuleSet | None: The compiled rules, or None if there is no rules file.
+    """
+    if not os.path.exists(path):
+        return None
+    return FeeRuleSet.load(path)
+
+def _age_days(date_created) -> int:
+    """Returns the whole days between the creation date and today."""
+    if isinstance(date_created, datetime):
+        date_created = date_created.date()
+    return (clock.today() - date_created).days
+
+def _compile(account_type: str, rules: list, arguments: tuple, allowed: set, constants: dict) -> tuple:
+    """Builds the scalar and vectorized evaluator functions for one account type."""
+    scalar_lines = [f"def scalar_rule({', '.join(arguments)}):"]
+    vector_conditions, vector_choices = [], []
+
+    for condition, formula in rules:
+        formula_tree = _parse(formula, allowed, account_type)
+        vector_choices.append(ast.unparse(_Vectorize().visit(copy.deepcopy(formula_tree))))
+        if condition:
+            condition_tree = _parse(condition, allowed, account_type)
+            scalar_lines.append(f"    if {ast.unparse(condition_tree)}:")
+            scalar_lines.append(f"        return {ast.unparse(formula_tree)}")
+            vector_conditions.append(ast.unparse(_Vectorize().visit(copy.deepcopy(condition_tree))))
+        else:
+            scalar_lines.append(f"    return {ast.unparse(formula_tree)}")
+            vector_conditions.append("_always(balance)")
+            break
+    scalar_lines.append("    return 0.0")
+
+    vector_source = (f"def vector_rule({', '.join(arguments)}):\n"
+                     f"    return _select([{', '.join(vector_conditions)}], "
+                     f"[{', '.join(vector_choices)}], 0.0)")
+
+    scalar_globals = {"__builtins__": {}, "_min": min, "_max": max, **constants}
+    vector_globals = {"__builtins__": {}, "_min": np.minimum, "_max": np.maximum,
+                      "_select": _select, "_always": _always, **constants}
+    exec(compile("\n".join(scalar_lines), f"<fee rules: {account_type}>", "exec"), scalar_globals)
+    exec(compile(vector_source, f"<bulk fee rules: {account_type}>", "exec"), vector_globals)
+    return scalar_globals["scalar_rule"], vector_globals["vector_rule"]
+
+def _parse(expression: str, allowed: set, account_type: str) -> ast.Expression:
+    """Parses a rule expression and checks it only uses permitted names and operations."""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Fee rule for {account_type} is not a valid expression: {expression} ({e.msg})")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Fee rule for {account_type} uses an unsupported operation: {expression}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _ALLOWED_FUNCTIONS or node.keywords:
+                raise ValueError(f"Fee rule for {account_type} calls an unsupported function: {expression}")
+            node.func.id = "_" + node.func.id
+        elif isinstance(node, ast.Name) and not node.id.startswith("_") and node.id not in allowed:
+            raise ValueError(f"Fee rule for {account_type} uses an unknown name '{node.id}': {expression}")
+        elif isinstance(node, ast.Name) and node.id.startswith("_") and node.id[1:] not in _ALLOWED_FUNCTIONS:
+            raise ValueError(f"Fee rule for {account_type} uses an unknown name '{node.id}': {expression}")
+    return tree
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrites boolean logic so a rule expression works element-wise on NumPy arrays."""
+
+    def visit_BoolOp(self, node):
+        values = [self.visit(value) for value in node.values]
+        operator = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        result = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(left=result, op=operator, right=value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        node = self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        node = self.generic_visit(node)
+        operands = [node.left] + node.comparators
+        pairs = [ast.Compare(left=operands[index], ops=[operator], comparators=[operands[index + 1]])
+                 for index, operator in enumerate(node.ops)]
+        result = pairs[0]
+        for pair in pairs[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=pair)
+        return result
+
+def _select(conditions: list, choices: list, default: float) -> np.ndarray:
+    """Returns, element-wise, the choice of the first condition that holds."""
+    return np.select(conditions, choices, default)
+
+def _always(balance: np.ndarray) -> np.ndarray:
+    """Returns a condition that holds for every element."""
+    return np.ones(np.shape(balance), dtype=bool)
@@ -3,9 +3,11 @@ Description: This module implements a strategy for managing fees in investment a
 Author: Lovedeep Singh Sidhu
 """
 
+import numpy as np
 from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
-from datetime import date, timedelta
+from datetime import date, datetime
 from bank_account.bank_account import BankAccount
+from utility.clock import clock, TEN_YEARS_IN_DAYS
 
 class ManagementFeeStrategy(ServiceChargeStrategy):
     """
@@ -13,28 +15,40 @@ class ManagementFeeStrategy(ServiceChargeStrategy):
 
     Attributes:
         management_fee (float): The fee charged for managing the investment account.
-        TEN_YEARS_AGO (date): A constant representing the date that marks 10 years ago.
+        TEN_YEARS_AGO (date): The date that marks 10 years ago, taken from the shared clock.
 
     Methods:
-        __init__(self, date_created: date, management_fee: float):
-            Initializes the strategy with the account creation date and management fee.
+        __init__(self, management_fee: float):
+            Initializes the strategy with the management fee.
         calculate_service_charges(self, account: BankAccount) -> float:
             Computes the service charges based on the age of the account and the management fee.
+        calculate_service_charges_bulk(cls, strategies, accounts, balances) -> np.ndarray:
+            Computes the management fee service charges of many accounts at once.
     """
 
-    # Constant that determines the date from 10 years ago
-    TEN_YEARS_AGO = date.today() - timedelta(days=10 * 365.25)
+    __slots__ = ("__management_fee",)
 
-    def __init__(self, date_created: date, management_fee: float):
+    def __init__(self, management_fee: float):
         """
         Sets up the ManagementFeeStrategy with necessary parameters.
 
+        The strategy is shared by every account with the same fee, so the account
+        creation date is read from the account when the charges are calculated.
+
         Args:
-            date_created (date): The date the account was created.
             management_fee (float): The fee for managing the investment account.
         """
         self.__management_fee = management_fee
-        self.__date_created = date_created  
+
+    @property
+    def TEN_YEARS_AGO(self) -> date:
+        """Returns the date from 10 years ago, which moves with the current date."""
+        return clock.days_ago(TEN_YEARS_IN_DAYS)
+
+    @property
+    def management_fee(self) -> float:
+        """Returns the management fee."""
+        return self.__management_fee
 
     def calculate_service_charges(self, account: BankAccount) -> float:
         """Calculates the service charges for the investment account.
@@ -47,7 +61,29 @@ class ManagementFeeStrategy(ServiceChargeStrategy):
         Returns:
             float: The total service charge applicable.
         """
-        if self.__date_created < self.TEN_YEARS_AGO:
+        # Compare by calendar day, even when the account was loaded with a datetime
+        date_created = account.date_created
+        if isinstance(date_created, datetime):
+            date_created = date_created.date()
+
+        if date_created < self.TEN_YEARS_AGO:
             return self.BASE_SERVICE_CHARGE
         else:
             return self.BASE_SERVICE_CHARGE + self.__management_fee
+
+    @classmethod
+    def calculate_service_charges_bulk(cls, strategies: list, accounts: list, balances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the management fee service charges of many accounts at once.
+
+        Args:
+            strategies (list): The ManagementFeeStrategy of each account.
+            accounts (list): The bank accounts.
+            balances (np.ndarray): The balance of each account.
+
+        Returns:
+            np.ndarray: The service charge of each account.
+        """
+        created = np.fromiter((account.date_created.toordinal() for account in accounts), dtype=np.int64, count=len(accounts))
+        fees = np.fromiter((strategy.management_fee for strategy in strategies), dtype=np.float64, count=len(strategies))
+        return np.where(created < clock.days_ago(TEN_YEARS_IN_DAYS).toordinal(), cls.BASE_SERVICE_CHARGE, cls.BASE_SERVICE_CHARGE + fees)
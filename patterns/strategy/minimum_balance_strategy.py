@@ -5,6 +5,7 @@ Author: Lovedeep Singh Sidhu
 """
 
 # Import necessary modules
+import numpy as np
 from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
 from bank_account.bank_account import BankAccount
 
@@ -20,6 +21,11 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
         SERVICE_CHARGE_PREMIUM (float): A constant multiplier for service charges if the balance is below the minimum.
     """
         
+    # Multiplier for service charge if below minimum
+    SERVICE_CHARGE_PREMIUM: float = 2.0
+
+    __slots__ = ("__minimum_balance",)
+
     def __init__(self, minimum_balance: float):
         """
         Initializes the MinimumBalanceStrategy object.
@@ -28,7 +34,11 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
             minimum_balance (float): The minimum balance that must be maintained in the account.
         """
         self.__minimum_balance = minimum_balance
-        self.SERVICE_CHARGE_PREMIUM: float = 2.0  # Multiplier for service charge if below minimum
+
+    @property
+    def minimum_balance(self) -> float:
+        """Returns the minimum balance."""
+        return self.__minimum_balance
 
     def calculate_service_charges(self, account: BankAccount) -> float:
         """
@@ -44,3 +54,20 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
         if account.balance < self.__minimum_balance:
             return self.BASE_SERVICE_CHARGE * self.SERVICE_CHARGE_PREMIUM
         return self.BASE_SERVICE_CHARGE
+
+    @classmethod
+    def calculate_service_charges_bulk(cls, strategies: list, accounts: list, balances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the minimum balance service charges of many accounts at once.
+
+        Args:
+            strategies (list): The MinimumBalanceStrategy of each account.
+            accounts (list): The bank accounts.
+            balances (np.ndarray): The balance of each account.
+
+        Returns:
+            np.ndarray: The service charge of each account.
+        """
+        minimums = np.fromiter((strategy.minimum_balance for strategy in strategies), dtype=np.float64, count=len(strategies))
+        return np.where(balances < minimums, cls.BASE_SERVICE_CHARGE * cls.SERVICE_CHARGE_PREMIUM,
+                        cls.BASE_SERVICE_CHARGE)
@@ -4,6 +4,7 @@ related to overdraft.
 Author: Lovedeep Singh Sidhu
 """
 
+import numpy as np
 from bank_account.bank_account import BankAccount
 from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
 
@@ -20,8 +21,12 @@ class OverdraftStrategy(ServiceChargeStrategy):
             Sets up the overdraft strategy with a defined limit and rate.
         calculate_service_charges(self, account: BankAccount) -> float:
             Computes service charges based on the account's overdraft status.
+        calculate_service_charges_bulk(cls, strategies, accounts, balances) -> np.ndarray:
+            Computes the overdraft service charges of many accounts at once.
     """
 
+    __slots__ = ("__overdraft_limit", "__overdraft_rate")
+
     def __init__(self, overdraft_limit: float, overdraft_rate: float):
         """
         Initializes the OverdraftStrategy object.
@@ -33,6 +38,16 @@ class OverdraftStrategy(ServiceChargeStrategy):
         self.__overdraft_limit = overdraft_limit
         self.__overdraft_rate = overdraft_rate
 
+    @property
+    def overdraft_limit(self) -> float:
+        """Returns the overdraft limit."""
+        return self.__overdraft_limit
+
+    @property
+    def overdraft_rate(self) -> float:
+        """Returns the overdraft rate."""
+        return self.__overdraft_rate
+
     def calculate_service_charges(self, account: BankAccount) -> float:
         """
         Calculates the service charges based on the current overdraft status of the account.
@@ -53,3 +68,24 @@ class OverdraftStrategy(ServiceChargeStrategy):
             # Calculate the charge incurred due to the overdraft
             return (base_service_charge +
                     (self.__overdraft_limit - account.balance) * self.__overdraft_rate)
+
+    @classmethod
+    def calculate_service_charges_bulk(cls, strategies: list, accounts: list, balances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the overdraft service charges of many accounts at once.
+
+        The formula is the same as calculate_service_charges, applied to arrays.
+
+        Args:
+            strategies (list): The OverdraftStrategy of each account.
+            accounts (list): The bank accounts.
+            balances (np.ndarray): The balance of each account.
+
+        Returns:
+            np.ndarray: The service charge of each account.
+        """
+        limits = np.fromiter((strategy.overdraft_limit for strategy in strategies), dtype=np.float64, count=len(strategies))
+        rates = np.fromiter((strategy.overdraft_rate for strategy in strategies), dtype=np.float64, count=len(strategies))
+        base_service_charge = cls.BASE_SERVICE_CHARGE
+        return np.where(balances >= limits, base_service_charge,
+                        base_service_charge + (limits - balances) * rates)
@@ -4,6 +4,7 @@ Author: Lovedeep Singh Sidhu
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 from bank_account.bank_account import BankAccount
 
 class ServiceChargeStrategy(ABC):
@@ -16,11 +17,16 @@ class ServiceChargeStrategy(ABC):
     Methods:
         calculate_service_charges(self, account: BankAccount) -> float:
             Abstract method to compute service charges based on the specific strategy.
+        calculate_service_charges_bulk(cls, strategies, accounts, balances) -> np.ndarray:
+            Computes the service charges of many accounts that use this strategy type.
     """
 
     # Constant representing the base service charge
     BASE_SERVICE_CHARGE = 10.00  
 
+    # Strategies are shared between accounts, so instances hold no per-instance dictionary
+    __slots__ = ()
+
     @abstractmethod
     def calculate_service_charges(self, account: BankAccount) -> float:
         """
@@ -33,3 +39,23 @@ class ServiceChargeStrategy(ABC):
             float: The computed service charge.
         """
         pass
+
+    @classmethod
+    def calculate_service_charges_bulk(cls, strategies: list, accounts: list, balances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the service charges of many accounts that use this type of strategy.
+
+        Subclasses override this with a vectorized formula. This default evaluates
+        each account through its own strategy.
+
+        Args:
+            strategies (list): The strategy of each account.
+            accounts (list): The bank accounts.
+            balances (np.ndarray): The balance of each account.
+
+        Returns:
+            np.ndarray: The service charge of each account.
+        """
+        return np.fromiter((strategy.calculate_service_charges(account)
+                            for strategy, account in zip(strategies, accounts)),
+                           dtype=np.float64, count=len(accounts))
@@ -0,0 +1,115 @@
+"""
+Description: This module defines the ServiceChargeStrategyFactory class, which shares one
+immutable service charge strategy between all accounts with the same parameters (Flyweight).
+When fee rules are configured, accounts of the types they cover get rule-based strategies.
+Author: Lovedeep Singh Sidhu
+"""
+
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.overdraft_strategy import OverdraftStrategy
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+from patterns.strategy.fee_rules import FeeRuleSet, RuleBasedStrategy, load_fee_rules
+
+class ServiceChargeStrategyFactory:
+    """
+    A factory that interns service charge strategies by their type and parameters.
+
+    Strategies hold no per-account data, so thousands of accounts with the same
+    parameters (for example an overdraft limit of -50 at 0.035) share one object.
+
+    Methods:
+        get_strategy(self, strategy_type, *parameters) -> ServiceChargeStrategy:
+            Returns the shared strategy for the type and parameters.
+        overdraft(self, overdraft_limit, overdraft_rate) -> ServiceChargeStrategy:
+            Returns the shared chequing account strategy (OverdraftStrategy by default).
+        minimum_balance(self, minimum_balance) -> ServiceChargeStrategy:
+            Returns the shared savings account strategy (MinimumBalanceStrategy by default).
+        management_fee(self, management_fee) -> ServiceChargeStrategy:
+            Returns the shared investment account strategy (ManagementFeeStrategy by default).
+        use_fee_rules(self, rule_set) -> None:
+            Makes the factory hand out strategies driven by the fee rules.
+        clear(self) -> None:
+            Forgets every shared strategy.
+    """
+
+    def __init__(self):
+        """Initializes the factory with no shared strategies."""
+        self.__strategies = {}
+        self.__fee_rules = None
+
+    @property
+    def fee_rules(self) -> FeeRuleSet:
+        """Returns the fee rules in use, or None when the built-in strategies are used."""
+        return self.__fee_rules
+
+    def use_fee_rules(self, rule_set: FeeRuleSet) -> None:
+        """
+        Makes the factory hand out strategies driven by the fee rules.
+
+        Account types the rules do not cover keep the built-in strategies. Accounts
+        created earlier keep the strategy they already have.
+
+        Args:
+            rule_set (FeeRuleSet): The compiled fee rules, or None for the built-in strategies.
+        """
+        self.__fee_rules = rule_set
+
+    def __len__(self) -> int:
+        """Returns the number of distinct strategies created."""
+        return len(self.__strategies)
+
+    def get_strategy(self, strategy_type: type, *parameters) -> ServiceChargeStrategy:
+        """
+        Returns the shared strategy for the type and parameters, creating it if needed.
+
+        Args:
+            strategy_type (type): A ServiceChargeStrategy subclass.
+            *parameters: The constructor arguments of the strategy.
+
+        Returns:
+            ServiceChargeStrategy: The shared strategy.
+        """
+        key = (strategy_type, parameters)
+        strategy = self.__strategies.get(key)
+        if strategy is None:
+            strategy = self.__strategies[key] = strategy_type(*parameters)
+        return strategy
+
+    def overdraft(self, overdraft_limit: float, overdraft_rate: float) -> ServiceChargeStrategy:
+        """Returns the shared chequing account strategy for the limit and rate."""
+        return self.__for_account("ChequingAccount", OverdraftStrategy,
+                                  overdraft_limit=overdraft_limit, overdraft_rate=overdraft_rate)
+
+    def minimum_balance(self, minimum_balance: float) -> ServiceChargeStrategy:
+        """Returns the shared savings account strategy for the minimum balance."""
+        return self.__for_account("SavingsAccount", MinimumBalanceStrategy, minimum_balance=minimum_balance)
+
+    def management_fee(self, management_fee: float) -> ServiceChargeStrategy:
+        """Returns the shared investment account strategy for the management fee."""
+        return self.__for_account("InvestmentAccount", ManagementFeeStrategy, management_fee=management_fee)
+
+    def clear(self) -> None:
+        """Forgets every shared strategy."""
+        self.__strategies.clear()
+
+    def __for_account(self, account_type: str, strategy_type: type, **parameters) -> ServiceChargeStrategy:
+        """
+        Returns the shared strategy for an account type, from the fee rules if they cover it.
+
+        Raises:
+            ValueError: If the fee rules use a parameter the account type does not have.
+        """
+        rule_set = self.__fee_rules
+        if rule_set is None or not rule_set.covers(account_type):
+            return self.get_strategy(strategy_type, *parameters.values())
+
+        try:
+            values = tuple(parameters[name] for name in rule_set.parameter_names(account_type))
+        except KeyError as e:
+            raise ValueError(f"Fee rules for {account_type} use an unknown parameter: {e}")
+        return self.get_strategy(RuleBasedStrategy, rule_set, account_type, values)
+
+# Factory shared by all bank accounts, using the fee rules file when there is one
+strategy_factory = ServiceChargeStrategyFactory()
+strategy_factory.use_fee_rules(load_fee_rules())
@@ -0,0 +1,24 @@
+"""
+Description: Test doubles shared by the observer, notification and dispatcher unit tests.
+Author: Lovedeep Singh Sidhu
+"""
+
+import threading
+from patterns.observer.observer import Observer
+
+class RecordingObserver(Observer):
+    """An observer that records its messages, optionally waiting on a gate first."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.messages = []
+        self.gate = gate
+        self.started = threading.Event()
+
+    def update(self, message):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(message)
+
+    def topics(self) -> list:
+        return [getattr(message, "topic", None) for message in self.messages]
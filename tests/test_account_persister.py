@@ -0,0 +1,123 @@
+"""
+Description: Unit tests for the account persister. Skipped when PySide6 is not installed.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_persister.py
+"""
+
+import csv
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest.mock import patch
+from bank_account import SavingsAccount
+from user_interface import manage_data
+
+try:
+    from PySide6.QtCore import Qt
+    from user_interface.account_persister import AccountPersister
+except ImportError:
+    AccountPersister = None
+
+@unittest.skipIf(AccountPersister is None, "PySide6 is not installed")
+class TestAccountPersister(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.accounts_path = os.path.join(self.directory.name, "accounts.csv")
+        with open(self.accounts_path, "w") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+                       "20001,1001,100.0,2023-01-10,SavingsAccount,Null,Null,50,Null\n"
+                       "20002,1001,200.0,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        self.patcher = patch.object(manage_data, "accounts_csv_path", self.accounts_path)
+        self.patcher.start()
+        self.persister = AccountPersister(retries=2, retry_delay=0)
+
+    def tearDown(self):
+        self.persister.close()
+        self.patcher.stop()
+        self.directory.cleanup()
+
+    def balances(self) -> dict:
+        with open(self.accounts_path, newline="") as file:
+            return {row["account_number"]: float(row["balance"]) for row in csv.DictReader(file)}
+
+    def account(self, number: int, balance: float) -> SavingsAccount:
+        return SavingsAccount(number, 1001, balance, date(2023, 1, 10), 50.0)
+
+    def test_latest_balance_of_each_account_is_written(self):
+        saved = []
+        # The signals are emitted on the persister's thread; a direct connection records them there
+        self.persister.saved.connect(lambda accounts: saved.extend(accounts), Qt.DirectConnection)
+        for balance in (150.0, 175.0, 125.0):
+            self.persister.save(self.account(20001, balance))
+        self.persister.save(self.account(20002, 250.0))
+        self.persister.close()
+
+        self.assertEqual(self.balances(), {"20001": 125.0, "20002": 250.0})
+        self.assertEqual(self.persister.pending_count, 0)
+        self.assertEqual([account.balance for account in saved if account.account_number == 20001][-1], 125.0)
+
+    def test_failed_write_is_reported_after_retries(self):
+        """A write that keeps failing is retried, then reported once."""
+        failures = []
+        self.persister.failed.connect(lambda accounts, reason: failures.append(len(accounts)), Qt.DirectConnection)
+        with patch("user_interface.account_persister.update_data_batch", side_effect=OSError("disk full")) as write:
+            with self.assertLogs(level="ERROR"):
+                self.persister.save(self.account(20001, 150.0))
+                self.persister.close()
+        self.assertEqual(write.call_count, 3)
+        self.assertEqual(failures, [1])
+        self.assertEqual(self.persister.pending_count, 0)
+
+    def test_failed_write_is_retried(self):
+        """The accounts of a failed write are written by a later pass, unless a newer save replaced them."""
+        failures = []
+        self.persister.failed.connect(lambda accounts, reason: failures.append(len(accounts)), Qt.DirectConnection)
+        write = manage_data.update_data_batch
+        attempts = []
+        writing = threading.Event()
+        resume = threading.Event()
+
+        def fail_first_write(accounts):
+            attempts.append(sorted(account.balance for account in accounts))
+            if len(attempts) == 1:
+                writing.set()
+                resume.wait(5)
+                raise OSError("file locked")
+            write(accounts)
+
+        with patch("user_interface.account_persister.update_data_batch", side_effect=fail_first_write):
+            with self.assertLogs(level="WARNING"):
+                self.persister.save(self.account(20001, 150.0))
+                self.persister.save(self.account(20002, 250.0))
+                writing.wait(5)
+                # A newer save arrives while the failed write is in progress
+                self.persister.save(self.account(20001, 175.0))
+                resume.set()
+                self.persister.close()
+
+        self.assertEqual(failures, [])
+        self.assertEqual(attempts[-1], [175.0, 250.0])
+        self.assertEqual(self.balances(), {"20001": 175.0, "20002": 250.0})
+
+    def test_pending_changed_is_emitted_without_a_count(self):
+        """Receivers read pending_count, which is zero once everything is written."""
+        counts = []
+        self.persister.pending_changed.connect(lambda: counts.append(self.persister.pending_count),
+                                               Qt.DirectConnection)
+        self.persister.save(self.account(20001, 150.0))
+        self.persister.close()
+        self.assertEqual(counts[-1], 0)
+
+    def test_save_after_close_is_rejected(self):
+        self.persister.close()
+        with self.assertRaises(ValueError):
+            self.persister.save(self.account(20001, 150.0))
+
+if __name__ == "__main__":
+    unittest.main()
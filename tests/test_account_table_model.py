@@ -0,0 +1,125 @@
+"""
+Description: Unit tests for the account table and filter proxy models. Skipped when PySide6 is not installed.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_table_model.py
+"""
+
+import copy
+import unittest
+from datetime import date
+from bank_account import ChequingAccount, SavingsAccount
+
+try:
+    from PySide6.QtCore import Qt
+    from user_interface.account_table_model import AccountTableModel, ACCOUNT_ROLE
+    from user_interface.account_filter_proxy_model import AccountFilterProxyModel
+except ImportError:
+    AccountTableModel = None
+
+@unittest.skipIf(AccountTableModel is None, "PySide6 is not installed")
+class TestAccountTableModel(unittest.TestCase):
+
+    def setUp(self):
+        self.accounts = [ChequingAccount(20019, 1001, 1234.5, date(2023, 1, 10), -100.00, 0.05),
+                         SavingsAccount(20020, 1001, 50.0, date(2023, 1, 15), 50.00)]
+        self.model = AccountTableModel()
+        self.model.set_accounts(self.accounts)
+
+    def test_cells_render_account_fields(self):
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (2, 4))
+        self.assertEqual([self.model.data(self.model.index(0, column)) for column in range(4)],
+                         ["20019", "$1,234.50", "2023-01-10", "ChequingAccount"])
+        self.assertIs(self.model.data(self.model.index(1, 0), ACCOUNT_ROLE), self.accounts[1])
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), "Balance")
+
+    def test_update_account_replaces_row(self):
+        """An updated copy replaces the shown account and repaints its row."""
+        changed = []
+        self.model.dataChanged.connect(lambda first, last: changed.append((first.row(), last.column())))
+        updated = copy.copy(self.accounts[1])
+        updated.deposit(25.00)
+        self.assertTrue(self.model.update_account(updated))
+        self.assertEqual(self.model.data(self.model.index(1, 1)), "$75.00")
+        self.assertEqual(changed, [(1, 3)])
+        self.assertFalse(self.model.update_account(ChequingAccount(1, 1001, 0.0, date(2023, 1, 1), 0.0, 0.0)))
+
+    def test_clear(self):
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+@unittest.skipIf(AccountTableModel is None, "PySide6 is not installed")
+class TestAccountFilterProxyModel(unittest.TestCase):
+
+    def setUp(self):
+        self.accounts = [ChequingAccount(20019, 1001, 1234.5, date(2023, 1, 10), -100.00, 0.05),
+                         SavingsAccount(20020, 1001, 50.0, date(2022, 5, 15), 50.00),
+                         ChequingAccount(20021, 1001, -20.0, date(2024, 3, 1), -100.00, 0.05)]
+        self.model = AccountTableModel()
+        self.model.set_accounts(self.accounts)
+        self.proxy = AccountFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+
+    def shown(self) -> list:
+        return [self.proxy.account_at(row).account_number for row in range(self.proxy.rowCount())]
+
+    def test_filter_by_column(self):
+        """Only rows whose column contains the text are shown, ignoring case."""
+        self.proxy.set_filter(3, "chequing")
+        self.assertEqual(self.shown(), [20019, 20021])
+        self.proxy.set_filter(1, "1,234")
+        self.assertEqual(self.shown(), [20019])
+        self.assertEqual(self.proxy.filter_description, "Data is Currently Filtered By: Balance contains '1,234'")
+        self.proxy.set_filter(1, "")
+        self.assertEqual(self.shown(), [20019, 20020, 20021])
+        self.assertEqual(self.proxy.filter_description, "Data is Not Currently Filtered")
+
+    def test_sort_by_precomputed_keys(self):
+        """Rows sort by value, not by cell text."""
+        self.proxy.sort(1, Qt.AscendingOrder)
+        self.assertEqual(self.shown(), [20021, 20020, 20019])
+        self.proxy.sort(2, Qt.DescendingOrder)
+        self.assertEqual(self.shown(), [20021, 20019, 20020])
+        self.assertEqual(self.proxy.data(self.proxy.index(0, 1)), "$-20.00")
+
+    def test_updated_balance_is_resorted(self):
+        """Rows sorted by balance are put back in order when a balance changes."""
+        self.proxy.sort(1, Qt.AscendingOrder)
+        updated = copy.copy(self.accounts[0])
+        updated.update_balance(-2000.00)
+        self.model.update_account(updated)
+        self.assertEqual(self.shown(), [20019, 20021, 20020])
+        self.assertEqual(self.proxy.data(self.proxy.index(0, 1)), "$-765.50")
+
+    def test_updated_balance_is_filtered_again(self):
+        """A row whose new balance no longer matches the filter is hidden, and one that now matches is shown."""
+        self.proxy.set_filter(1, "50.00")
+        self.assertEqual(self.shown(), [20020])
+        updated = copy.copy(self.accounts[1])
+        updated.deposit(25.00)
+        self.model.update_account(updated)
+        self.assertEqual(self.shown(), [])
+        updated = copy.copy(self.accounts[2])
+        updated.deposit(70.00)
+        self.model.update_account(updated)
+        self.assertEqual(self.shown(), [20021])
+
+    def test_updated_row_repainted_in_place(self):
+        """Without a balance filter or sort, a changed row is repainted where it is shown."""
+        self.proxy.sort(0, Qt.DescendingOrder)
+        changed = []
+        self.proxy.dataChanged.connect(lambda first, last: changed.append(first.row()))
+        updated = copy.copy(self.accounts[0])
+        updated.deposit(25.00)
+        self.model.update_account(updated)
+        self.assertEqual(changed, [2])
+        self.assertEqual(self.proxy.data(self.proxy.index(2, 1)), "$1,259.50")
+
+    def test_new_client_clears_keys(self):
+        self.proxy.sort(0, Qt.DescendingOrder)
+        self.model.set_accounts(self.accounts[:1])
+        self.assertEqual(self.shown(), [20019])
+
+if __name__ == "__main__":
+    unittest.main()
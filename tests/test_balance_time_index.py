@@ -0,0 +1,88 @@
+"""
+Description: Unit tests for the BalanceTimeIndex class.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_balance_time_index.py
+"""
+
+import math
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+import numpy as np
+from event_sourcing.account_event import AccountEvent, OPENED, DEPOSITED, WITHDREW
+from event_sourcing.balance_time_index import BalanceTimeIndex
+
+class TestBalanceTimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Build an index over two accounts with interleaved events."""
+        self.events = [
+            AccountEvent(1, datetime(2024, 1, 1, 9), 20001, OPENED, 100.00),
+            AccountEvent(2, datetime(2024, 1, 2, 9), 20002, OPENED, 50.00),
+            AccountEvent(3, datetime(2024, 1, 3, 9), 20001, DEPOSITED, 25.00),
+            AccountEvent(4, datetime(2024, 1, 5, 9), 20002, WITHDREW, 20.00),
+            AccountEvent(5, datetime(2024, 1, 5, 17), 20001, WITHDREW, 5.00),
+        ]
+        self.index = BalanceTimeIndex.from_events(self.events)
+
+    def test_extended_matches_rebuild(self):
+        """Folding appended events, including a backdated one, gives the same balances as a rebuild."""
+        appended = [AccountEvent(6, datetime(2024, 1, 6, 9), 20001, DEPOSITED, 30.00),
+                    AccountEvent(7, datetime(2024, 1, 4, 9), 20002, DEPOSITED, 10.00),
+                    AccountEvent(8, datetime(2024, 1, 6, 9), 20003, OPENED, 75.00)]
+        extended = self.index.extended(appended)
+        rebuilt = BalanceTimeIndex.from_events(self.events + appended)
+        self.assertEqual(extended.last_sequence, 8)
+        for day in range(1, 8):
+            np.testing.assert_array_equal(extended.balances_as_of([20001, 20002, 20003], date(2024, 1, day)),
+                                          rebuilt.balances_as_of([20001, 20002, 20003], date(2024, 1, day)))
+
+    def test_balance_as_of_date_uses_end_of_day(self):
+        """A date query includes every event on that day."""
+        self.assertEqual(self.index.balance_as_of(20001, date(2024, 1, 3)), 125.00)
+        self.assertEqual(self.index.balance_as_of(20001, date(2024, 1, 5)), 120.00)
+
+    def test_balance_as_of_moment(self):
+        """A datetime query includes events up to and including that moment."""
+        self.assertEqual(self.index.balance_as_of(20001, datetime(2024, 1, 5, 9)), 125.00)
+        self.assertEqual(self.index.balance_as_of(20001, datetime(2024, 1, 5, 17)), 120.00)
+
+    def test_balance_before_opening_returns_none(self):
+        """Accounts that were not open yet, or are unknown, have no balance."""
+        self.assertIsNone(self.index.balance_as_of(20002, date(2024, 1, 1)))
+        self.assertIsNone(self.index.balance_as_of(99999, date(2024, 1, 1)))
+
+    def test_bulk_query_matches_single_queries(self):
+        """The vectorized query returns the same balances as one query per account."""
+        accounts = [20002, 20001, 99999, 20001, 20002]
+        moments = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 9),
+                   datetime(2024, 1, 3, 8), date(2024, 1, 9)]
+        actual = self.index.balances_as_of(accounts, moments)
+
+        for value, account, moment in zip(actual, accounts, moments):
+            expected = self.index.balance_as_of(account, moment)
+            if expected is None:
+                self.assertTrue(math.isnan(value))
+            else:
+                self.assertEqual(value, expected)
+
+    def test_bulk_query_with_single_date(self):
+        """One as-of date can be applied to every account."""
+        actual = self.index.balances_as_of([20001, 20002], date(2024, 1, 5))
+        self.assertEqual(list(actual), [120.00, 30.00])
+
+    def test_save_and_load(self):
+        """A stored index answers the same queries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "index.npz")
+            self.index.save(path)
+            loaded = BalanceTimeIndex.load(path)
+
+        self.assertEqual(loaded.last_sequence, 5)
+        self.assertEqual(loaded.balance_as_of(20002, date(2024, 1, 5)), 30.00)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Description: Unit tests for the client completion model. Skipped when PySide6 is not installed.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_client_completion_model.py
+"""
+
+import unittest
+from client.client import Client
+from client.client_search_index import ClientSearchIndex
+
+try:
+    from PySide6.QtCore import Qt
+    from user_interface.client_completion_model import ClientCompletionModel, PAGE_SIZE
+except ImportError:
+    ClientCompletionModel = None
+
+@unittest.skipIf(ClientCompletionModel is None, "PySide6 is not installed")
+class TestClientCompletionModel(unittest.TestCase):
+
+    def setUp(self):
+        clients = [Client(1000 + number, "Lovedeep", f"Sidhu{number:03d}", f"ls{number}@pixell-river.com")
+                   for number in range(PAGE_SIZE * 2 + 5)]
+        clients.append(Client(2001, "Jordan", "Lee", "jlee@example.com"))
+        self.model = ClientCompletionModel(ClientSearchIndex(clients))
+
+    def test_rows_show_client_and_complete_to_number(self):
+        self.model.set_text("lee")
+        self.assertEqual(self.model.rowCount(), 1)
+        index = self.model.index(0)
+        self.assertEqual(self.model.data(index), "2001  Jordan Lee  <jlee@example.com>")
+        self.assertEqual(self.model.data(index, Qt.EditRole), "2001")
+
+    def test_matches_are_fetched_a_page_at_a_time(self):
+        self.model.set_text("sidhu")
+        self.assertEqual(self.model.rowCount(), PAGE_SIZE)
+        self.assertTrue(self.model.canFetchMore())
+        self.model.fetchMore()
+        self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), PAGE_SIZE * 2 + 5)
+        self.assertFalse(self.model.canFetchMore())
+        self.assertEqual([self.model.client_at(row).client_number for row in range(3)], [1000, 1001, 1002])
+
+    def test_empty_text_or_missing_index_shows_nothing(self):
+        self.model.set_text("  ")
+        self.assertEqual(self.model.rowCount(), 0)
+        model = ClientCompletionModel()
+        model.set_text("sidhu")
+        self.assertEqual(model.rowCount(), 0)
+        self.assertFalse(model.canFetchMore())
+
+if __name__ == "__main__":
+    unittest.main()
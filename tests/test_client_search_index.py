@@ -0,0 +1,90 @@
+"""
+Description: Unit tests for the client search index.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_client_search_index.py
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from client.client import Client
+from client.client_search_index import ClientSearchIndex, normalize
+from user_interface import manage_data
+
+class TestClientSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.clients = [Client(1001, "Lovedeep", "Sidhu", "lovedeep@pixell-river.com"),
+                        Client(1002, "Amélie", "Sidwell", "amelie@example.com"),
+                        Client(2001, "Sid", "Marsh", "smarsh@example.com"),
+                        Client(3003, "Jordan", "Lee", "jlee@example.com")]
+        self.index = ClientSearchIndex(self.clients)
+
+    def numbers(self, clients) -> list:
+        return [client.client_number for client in clients]
+
+    def test_prefix_by_field(self):
+        """Prefix queries are case- and accent-insensitive and ordered by key."""
+        self.assertEqual(self.numbers(self.index.by_prefix("last_name", "SID")), [1001, 1002])
+        self.assertEqual(self.numbers(self.index.by_prefix("first_name", "ame")), [1002])
+        self.assertEqual(self.numbers(self.index.by_prefix("email_address", "jl")), [3003])
+        self.assertEqual(self.numbers(self.index.by_prefix("client_number", "100")), [1001, 1002])
+        self.assertEqual(self.index.by_prefix("last_name", "zz"), [])
+        with self.assertRaises(ValueError):
+            self.index.by_prefix("balance", "1")
+
+    def test_search_combines_fields(self):
+        """search() puts exact full names first, then last name, first name and email prefixes."""
+        self.assertEqual(self.numbers(self.index.search("sid")), [1001, 1002, 2001])
+        self.assertEqual(self.numbers(self.index.search("Marsh, Sid")), [2001])
+        self.assertEqual(self.numbers(self.index.search("amelie sidwell")), [1002])
+        self.assertEqual(self.numbers(self.index.search("200")), [2001])
+        self.assertEqual(self.numbers(self.index.search("sid", limit=2)), [1001, 1002])
+
+    def test_clients_added_after_query_are_merged(self):
+        """Clients added between queries are found, and a replaced client's old keys are dropped."""
+        self.index.search("sid")
+        self.index.add(Client(4004, "Sidney", "Brown", "sb@example.com"))
+        self.index.add(Client(1001, "Lovedeep", "Singh", "lovedeep@pixell-river.com"))
+        self.assertEqual(self.numbers(self.index.by_prefix("first_name", "sid")), [2001, 4004])
+        self.assertEqual(self.numbers(self.index.by_prefix("last_name", "si")), [1002, 1001])
+        self.assertEqual(self.numbers(self.index.by_prefix("email_address", "lovedeep")), [1001])
+        self.assertEqual(len(self.index), 5)
+
+    def test_remove_and_retain(self):
+        self.index.remove(1002)
+        self.index.retain([1001, 2001])
+        self.assertEqual(sorted(self.index.clients), [1001, 2001])
+        self.assertEqual(self.numbers(self.index.search("sid")), [1001, 2001])
+        self.assertEqual(self.index.by_name("Jordan Lee"), [])
+
+    def test_client_with_equal_first_and_last_names(self):
+        """A client named Lee Lee is found once and can be removed."""
+        self.index.add(Client(5005, "Lee", "Lee", "leelee@example.com"))
+        self.assertEqual(self.numbers(self.index.by_name("Lee Lee")), [5005])
+        self.index.remove(5005)
+        self.assertEqual(self.index.by_name("Lee Lee"), [])
+        self.assertEqual(self.numbers(self.index.search("lee lee")), [])
+
+    def test_normalize(self):
+        self.assertEqual(normalize("  Zoë   O'Neil "), "zoe o'neil")
+
+    def test_load_data_builds_and_updates_index(self):
+        """load_data indexes each client and drops clients missing on reload."""
+        index = ClientSearchIndex([Client(9999, "Gone", "Away", "gone@example.com")])
+        with tempfile.TemporaryDirectory() as directory:
+            clients_path = os.path.join(directory, "clients.csv")
+            with open(clients_path, "w") as file:
+                file.write("client_number,first_name,last_name,email_address\n"
+                           "1,Lovedeep,Sidhu,lovedeep@pixell-river.com\n2,Sid,Marsh,smarsh@example.com\n")
+            with patch.object(manage_data, "clients_csv_path", clients_path), \
+                 patch.object(manage_data, "accounts_csv_path", os.path.join(directory, "accounts.csv")):
+                clients, accounts = manage_data.load_data(index)
+        self.assertEqual(sorted(index.clients), [1, 2])
+        self.assertEqual(self.numbers(index.search("sid")), [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Description: Unit tests for the Clock class.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_clock.py
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+from bank_account.investment_account import InvestmentAccount
+from utility.clock import Clock, clock, TEN_YEARS_IN_DAYS
+
+class TestClock(unittest.TestCase):
+
+    def tearDown(self):
+        clock.unfreeze()
+
+    def test_today_follows_real_date(self):
+        """An unfrozen clock reports the real date."""
+        self.assertEqual(Clock().today(), date.today())
+
+    def test_frozen_clock_reports_fixed_moment(self):
+        """A frozen clock always returns the moment it was frozen at."""
+        test_clock = Clock()
+        test_clock.freeze(datetime(2024, 3, 1, 23, 59))
+        self.assertEqual(test_clock.now(), datetime(2024, 3, 1, 23, 59))
+        self.assertEqual(test_clock.today(), date(2024, 3, 1))
+
+    def test_today_and_thresholds_roll_over_at_midnight(self):
+        """Cached dates move to the next day once midnight passes."""
+        test_clock = Clock()
+        test_clock.freeze(datetime(2024, 3, 1, 23, 59))
+        self.assertEqual(test_clock.days_ago(1), date(2024, 2, 29))
+
+        test_clock.advance(minutes=2)
+        self.assertEqual(test_clock.today(), date(2024, 3, 2))
+        self.assertEqual(test_clock.days_ago(1), date(2024, 3, 1))
+
+    def test_advance_requires_frozen_clock(self):
+        with self.assertRaises(ValueError):
+            Clock().advance(days=1)
+
+    def test_management_fee_threshold_follows_shared_clock(self):
+        """The ten year threshold moves with the clock instead of the import date."""
+        account = InvestmentAccount(444444, 1313, 3600.00, date(2014, 6, 1), 3.50)
+        with clock.frozen(datetime(2024, 5, 1, 9, 0)):
+            self.assertEqual(account.get_service_charges(), 13.5)
+        with clock.frozen(datetime(2024, 6, 3, 9, 0)):
+            self.assertEqual(account.TEN_YEARS_AGO, date(2024, 6, 3) - timedelta(days=TEN_YEARS_IN_DAYS))
+            self.assertEqual(account.get_service_charges(), 10.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Description: Unit tests for the buffered email outbox.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_email_outbox.py
+"""
+
+import os
+import csv
+import gzip
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from utility.email_outbox import EmailOutbox
+from utility.file_utils import simulate_send_email
+from utility.clock import clock
+
+class TestEmailOutbox(unittest.TestCase):
+
+    def setUp(self):
+        self.working_dir = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
+        self.path = os.path.join("outbox", "emails.txt")
+
+    def tearDown(self):
+        os.chdir(self.working_dir)
+        self.directory.cleanup()
+
+    def read(self, path: str) -> str:
+        if not os.path.exists(path):
+            return ""
+        with open(path) as file:
+            return file.read()
+
+    def test_format_matches_simulate_send_email(self):
+        """The outbox file is identical to the one simulate_send_email writes."""
+        outbox = EmailOutbox(self.path)
+        for number in range(3):
+            simulate_send_email(f"client{number}@example.com", "ALERT", f"message {number}")
+            outbox.send(f"client{number}@example.com", "ALERT", f"message {number}")
+        outbox.close()
+        with open(self.path, "rb") as outbox_file, open(os.path.join("output", "observer_emails.txt"), "rb") as file:
+            self.assertEqual(outbox_file.read(), file.read())
+
+    def test_messages_buffered_until_size_threshold(self):
+        """Nothing is written until the buffer reaches max_bytes."""
+        outbox = EmailOutbox(self.path, max_bytes=200, max_delay=60)
+        outbox.send("a@example.com", "ALERT", "first")
+        self.assertEqual(self.read(self.path), "")
+        outbox.send("b@example.com", "ALERT", "x" * 200)
+        self.assertEqual(self.read(self.path).count("---\n"), 4)
+        outbox.close()
+
+    def test_messages_written_after_delay(self):
+        """A buffered message is written once max_delay has passed."""
+        outbox = EmailOutbox(self.path, max_delay=0.05)
+        outbox.send("a@example.com", "ALERT", "first")
+        deadline = time.monotonic() + 5
+        while "first" not in self.read(self.path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn("Message: first", self.read(self.path))
+        outbox.close()
+
+    def test_flush_and_reopen_after_close(self):
+        """flush() writes immediately and a closed outbox reopens on send."""
+        outbox = EmailOutbox(self.path, max_delay=60)
+        outbox.send("a@example.com", "ALERT", "first")
+        outbox.flush()
+        self.assertIn("first", self.read(self.path))
+        outbox.close()
+        outbox.send("a@example.com", "ALERT", "second")
+        outbox.close()
+        self.assertIn("second", self.read(self.path))
+
+    def test_rotates_into_numbered_segments_by_size(self):
+        """The active file is renamed to a numbered segment before it passes the cap."""
+        outbox = EmailOutbox(self.path, max_segment_bytes=300)
+        for number in range(6):
+            outbox.send(f"client{number}@example.com", "ALERT", f"message {number}")
+        outbox.close()
+        names = sorted(os.listdir("outbox"))
+        self.assertIn("emails.000001.txt", names)
+        for name in names:
+            if name.endswith(".txt"):
+                self.assertLessEqual(os.path.getsize(os.path.join("outbox", name)), 300)
+        self.assertEqual(outbox.segment, len([name for name in names if name.startswith("emails.0") and name.endswith(".txt")]) + 1)
+
+    def test_history_reads_recipient_messages_across_compressed_segments(self):
+        """history() returns one recipient's messages from plain, gzipped and active segments."""
+        outbox = EmailOutbox(self.path, max_segment_bytes=250, compress=True)
+        for number in range(8):
+            outbox.send(f"client{number % 2}@example.com", "ALERT", f"message {number}")
+        outbox.flush()
+        self.assertTrue(any(name.endswith(".txt.gz") for name in os.listdir("outbox")))
+
+        history = outbox.history("client1@example.com")
+        self.assertEqual([entry.split("Message: ")[1].split("\n")[0] for entry in history],
+                         ["message 1", "message 3", "message 5", "message 7"])
+        self.assertTrue(history[0].startswith("---\nTo: client1@example.com\n"))
+        self.assertEqual(outbox.history("nobody@example.com"), [])
+        outbox.close()
+
+    def test_index_rotates_with_segments(self):
+        """Each closed segment gets its own index, sorted by recipient, and a new outbox reads them."""
+        outbox = EmailOutbox(self.path, max_segment_bytes=250, compress=True)
+        for number in range(8):
+            outbox.send(f"client{number % 2}@example.com", "ALERT", f"message {number}")
+        outbox.close()
+        names = os.listdir("outbox")
+        self.assertIn("emails.000001.index.csv.gz", names)
+        self.assertNotIn("emails.000001.index.csv", names)
+
+        with gzip.open(os.path.join("outbox", "emails.000001.index.csv.gz"), "rt", newline='') as file:
+            recipients = [row["email_address"] for row in csv.DictReader(file)]
+        self.assertEqual(recipients, sorted(recipients))
+
+        reopened = EmailOutbox(self.path, max_segment_bytes=250, compress=True)
+        self.assertEqual(reopened.history("client0@example.com"), outbox.history("client0@example.com"))
+        self.assertEqual(len(reopened.history("client0@example.com")), 4)
+        reopened.send("client0@example.com", "ALERT", "message 8")
+        self.assertEqual(len(reopened.history("client0@example.com")), 5)
+        reopened.close()
+
+    def test_rotates_daily(self):
+        """With rotate_daily a new date starts a new segment."""
+        clock.freeze(datetime(2024, 6, 1, 23, 59))
+        try:
+            outbox = EmailOutbox(self.path, rotate_daily=True, max_segment_bytes=None)
+            outbox.send("a@example.com", "ALERT", "first")
+            outbox.flush()
+            clock.advance(minutes=2)
+            outbox.send("a@example.com", "ALERT", "second")
+            outbox.close()
+        finally:
+            clock.unfreeze()
+        self.assertIn("first", self.read(os.path.join("outbox", "emails.000001.txt")))
+        self.assertNotIn("first", self.read(self.path))
+        self.assertEqual(len(outbox.history("a@example.com")), 2)
+
+    def test_invalid_thresholds(self):
+        """Thresholds must be positive."""
+        with self.assertRaises(ValueError):
+            EmailOutbox(self.path, max_bytes=0)
+
+if __name__ == "__main__":
+    unittest.main()
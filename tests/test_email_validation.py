@@ -0,0 +1,83 @@
+"""
+Description: Unit tests for the memoized, syntax-only email validation.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_email_validation.py
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from email_validator import validate_email
+from client.email_validation import EmailValidationCache
+
+class TestEmailValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.csv")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_syntax_only_validation(self):
+        """Valid addresses are normalized without DNS; invalid ones give None."""
+        cache = EmailValidationCache(self.path)
+        with patch("email_validator.deliverability.validate_email_deliverability") as lookup:
+            self.assertEqual(cache.validate("client@Example.COM"), "client@example.com")
+            self.assertIsNone(cache.validate("not-an-email"))
+        lookup.assert_not_called()
+
+    def test_each_address_validated_once(self):
+        """Repeated addresses reuse the memoized result."""
+        cache = EmailValidationCache(None)
+        with patch("client.email_validation.validate_email", wraps=validate_email) as check:
+            for _ in range(5):
+                cache.validate("client@example.com")
+                cache.validate("not-an-email")
+        self.assertEqual(check.call_count, 2)
+
+    def test_results_persist_across_caches(self):
+        """Saved results are loaded by the next cache without validating again."""
+        cache = EmailValidationCache(self.path)
+        cache.validate("client@example.com")
+        cache.validate("not-an-email")
+        cache.save()
+
+        reloaded = EmailValidationCache(self.path)
+        with patch("client.email_validation.validate_email") as check:
+            self.assertEqual(reloaded.validate("client@example.com"), "client@example.com")
+            self.assertIsNone(reloaded.validate("not-an-email"))
+        check.assert_not_called()
+        self.assertEqual(len(reloaded), 2)
+
+    def test_syntax_results_not_reused_for_deliverability(self):
+        """A cache that checks deliverability validates addresses the syntax cache saved."""
+        cache = EmailValidationCache(self.path)
+        cache.validate("client@example.com")
+        cache.save()
+
+        strict = EmailValidationCache(self.path, check_deliverability=True)
+        with patch("email_validator.deliverability.validate_email_deliverability", return_value={}) as lookup:
+            self.assertEqual(strict.validate("client@example.com"), "client@example.com")
+        lookup.assert_called_once()
+
+    def test_cache_file_without_mode_is_read_as_syntax_results(self):
+        """Rows saved before the mode column existed are syntax results, and the file is upgraded."""
+        with open(self.path, "w", newline='') as file:
+            file.write("email_address,normalized\nclient@example.com,client@example.com\n")
+        cache = EmailValidationCache(self.path)
+        with patch("client.email_validation.validate_email") as check:
+            self.assertEqual(cache.validate("client@example.com"), "client@example.com")
+        check.assert_not_called()
+
+        cache.validate("other@example.com")
+        cache.save()
+        self.assertEqual(len(EmailValidationCache(self.path)), 2)
+        with open(self.path) as file:
+            self.assertEqual(file.readline().strip(), "email_address,mode,normalized")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Description: Unit tests for the EventStore class.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_event_store.py
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from event_sourcing.event_store import EventStore
+from event_sourcing.account_event import DEPOSITED
+from event_sourcing.verify_replay import seed_event_store, verify_replay
+
+class TestEventStore(unittest.TestCase):
+
+    def setUp(self):
+        """Create an empty event store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "account_events.csv")
+        self.snapshot_dir = os.path.join(self.temp_dir.name, "snapshots")
+        self.chequing = ChequingAccount(20001, 1001, 1000.00, date.today(), -50, 0.035)
+        self.savings = SavingsAccount(20002, 1001, 300.00, date.today(), 50)
+        self.accounts = {20001: self.chequing, 20002: self.savings}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def new_store(self, snapshot_interval=1000):
+        return EventStore(self.log_path, self.snapshot_dir, snapshot_interval)
+
+    def test_transactions_update_account_and_log(self):
+        """Deposits, withdrawals and fees change the account and are folded into the store."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        store.deposit(self.chequing, 250.00)
+        store.withdraw(self.savings, 100.00)
+        store.charge_fee(self.chequing, 10.00)
+
+        self.assertEqual(self.chequing.balance, 1240.00)
+        self.assertEqual(store.balance(20001), 1240.00)
+        self.assertEqual(store.balance(20002), 200.00)
+        self.assertEqual(store.last_sequence, 5)
+
+    def test_rebuild_from_new_store_matches_balances(self):
+        """A new store over the same log replays to the same balances."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        store.deposit(self.chequing, 250.00)
+
+        self.assertEqual(self.new_store().balances, {20001: 1250.00, 20002: 300.00})
+
+    def test_rebuild_reads_only_events_after_latest_snapshot(self):
+        """Events before the latest snapshot are not replayed."""
+        store = self.new_store(snapshot_interval=3)
+        seed_event_store(store, self.accounts)
+        store.deposit(self.chequing, 1.00)
+        store.deposit(self.chequing, 2.00)
+
+        rebuilt = self.new_store(snapshot_interval=3)
+        tail = list(rebuilt.events(self._latest_offset()))
+        self.assertEqual([event.event_type for event in tail], [DEPOSITED])
+        self.assertEqual(rebuilt.balance(20001), 1003.00)
+
+    def test_rejected_transaction_is_not_logged(self):
+        """A transaction the account rejects writes no event."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        with self.assertRaises(ValueError):
+            store.withdraw(self.savings, 10000.00)
+        self.assertEqual(store.last_sequence, 2)
+        self.assertEqual(self.savings.balance, 300.00)
+
+    def test_failed_append_leaves_account_unchanged(self):
+        """The account only changes once its event is in the log."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        os.remove(self.log_path)
+        os.mkdir(self.log_path)
+        with self.assertRaises(OSError):
+            store.deposit(self.chequing, 250.00)
+        self.assertEqual(self.chequing.balance, 1000.00)
+
+    def test_append_to_unopened_account_raises(self):
+        """Events for an account that was never opened are rejected."""
+        store = self.new_store()
+        with self.assertRaises(ValueError):
+            store.append(99999, DEPOSITED, 10.00)
+
+    def test_verify_replay_reports_mismatch(self):
+        """Balances that differ from the replay are reported."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        self.assertEqual(verify_replay(store, self.accounts), [])
+
+        self.savings.deposit(5.00)
+        self.assertEqual(verify_replay(store, self.accounts), [(20002, 305.00, 300.00)])
+
+    def test_time_index_follows_appended_events(self):
+        """As-of queries see events appended after the index was first built."""
+        store = self.new_store()
+        seed_event_store(store, self.accounts)
+        self.assertEqual(store.balance_as_of(20001, date.today()), 1000.00)
+
+        store.deposit(self.chequing, 50.00)
+        self.assertEqual(list(store.balances_as_of([20001, 20002], date.today())), [1050.00, 300.00])
+
+    def _latest_offset(self):
+        with open(os.path.join(self.snapshot_dir, "snapshot_index.csv")) as file:
+            return int(file.read().splitlines()[-1].split(",")[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Description: Unit tests for the table-driven fee rules.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_fee_rules.py
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+import numpy as np
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from batch_jobs.service_charge_run import compute_service_charges
+from patterns.strategy.fee_rules import FeeRuleSet, RuleBasedStrategy, load_fee_rules
+from patterns.strategy.overdraft_strategy import OverdraftStrategy
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+from patterns.strategy.strategy_factory import ServiceChargeStrategyFactory
+
+class TestFeeRules(unittest.TestCase):
+
+    def setUp(self):
+        """Create accounts of each type around the thresholds of the shipped rules."""
+        generator = random.Random(7)
+        self.rule_set = load_fee_rules()
+        self.accounts = []
+        for account_number in range(300):
+            balance = round(generator.uniform(-300.00, 300.00), 2)
+            if account_number % 3 == 0:
+                account = ChequingAccount(account_number, 1001, balance, date.today(),
+                                          generator.choice([-50, -100]), generator.choice([0.035, 0.05]))
+            elif account_number % 3 == 1:
+                account = SavingsAccount(account_number, 1001, balance, date.today(), generator.choice([50, 100]))
+            else:
+                created = date.today() - timedelta(days=generator.choice([100, 3651, 3652, 3653, 4000]))
+                account = InvestmentAccount(account_number, 1001, balance, created, 2.55)
+            self.accounts.append(account)
+
+    def test_shipped_rules_match_built_in_strategies(self):
+        """The shipped rules charge exactly what the hand-written strategies charge."""
+        built_in = {
+            ChequingAccount: lambda account: OverdraftStrategy(*account.service_charge_strategy.parameters),
+            SavingsAccount: lambda account: MinimumBalanceStrategy(*account.service_charge_strategy.parameters),
+            InvestmentAccount: lambda account: ManagementFeeStrategy(*account.service_charge_strategy.parameters),
+        }
+        for account in self.accounts:
+            self.assertIsInstance(account.service_charge_strategy, RuleBasedStrategy)
+            expected = built_in[type(account)](account).calculate_service_charges(account)
+            self.assertEqual(account.get_service_charges(), expected)
+
+    def test_bulk_rules_match_scalar_rules(self):
+        """The compiled bulk evaluators give the same charges as the scalar evaluators."""
+        expected = [account.get_service_charges() for account in self.accounts]
+        self.assertEqual(list(compute_service_charges(self.accounts)), expected)
+
+    def test_rules_are_checked_in_order_with_boolean_logic(self):
+        """The first matching rule wins, and 'and', 'or', 'not' and min/max work in both paths."""
+        rule_set = FeeRuleSet({
+            "constants": {"base": 5.0},
+            "parameters": {"SavingsAccount": ["minimum_balance"]},
+            "rules": [
+                {"account_type": "SavingsAccount", "condition": "balance < 0 or not age_days > 30",
+                 "formula": "max(base, -balance / 10)"},
+                {"account_type": "SavingsAccount", "condition": "0 <= balance < minimum_balance and age_days > 30",
+                 "formula": "min(base * 2, minimum_balance - balance)"},
+            ]})
+        cases = [(-200.0, 60), (-10.0, 60), (50.0, 10), (90.0, 60), (20.0, 60), (500.0, 60)]
+        expected = [20.0, 5.0, 5.0, 10.0, 10.0, 0.0]
+
+        actual = [rule_set.evaluate("SavingsAccount", balance, age, (100.0,)) for balance, age in cases]
+        self.assertEqual(actual, expected)
+
+        bulk = rule_set.evaluate_bulk("SavingsAccount", np.array([case[0] for case in cases]),
+                                      np.array([case[1] for case in cases]), [np.full(len(cases), 100.0)])
+        self.assertEqual(list(bulk), expected)
+
+    def test_unknown_name_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FeeRuleSet({"rules": [{"account_type": "SavingsAccount", "formula": "balance * rate"}]})
+
+    def test_unsupported_operation_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FeeRuleSet({"rules": [{"account_type": "SavingsAccount", "formula": "__import__('os')"}]})
+
+    def test_factory_keeps_built_in_strategy_for_uncovered_types(self):
+        """Account types without rules still get the hand-written strategy."""
+        factory = ServiceChargeStrategyFactory()
+        factory.use_fee_rules(FeeRuleSet({"parameters": {"SavingsAccount": ["minimum_balance"]},
+                                          "rules": [{"account_type": "SavingsAccount", "formula": "1.0"}]}))
+        self.assertIsInstance(factory.minimum_balance(50.0), RuleBasedStrategy)
+        self.assertIsInstance(factory.overdraft(-50.0, 0.035), OverdraftStrategy)
+        self.assertIs(factory.minimum_balance(50.0), factory.minimum_balance(50.0))
+
+if __name__ == "__main__":
+    unittest.main()
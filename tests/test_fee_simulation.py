@@ -0,0 +1,90 @@
+"""
+Description: Unit tests for the what-if fee simulation.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_fee_simulation.py
+"""
+
+import csv
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from batch_jobs.fee_simulation import CURRENT_SCENARIO, simulate_fees, summarize, write_simulation_report
+
+class TestFeeSimulation(unittest.TestCase):
+
+    def setUp(self):
+        """Create a mixed population of accounts around each strategy's thresholds."""
+        generator = random.Random(7)
+        self.accounts = {}
+        for account_number in range(120):
+            balance = round(generator.uniform(-500.00, 500.00), 2)
+            kind = account_number % 3
+            if kind == 0:
+                account = ChequingAccount(account_number, 1001, balance, date(2023, 1, 10),
+                                          generator.choice([-50, -100, 0]), generator.choice([0.035, 0.05]))
+            elif kind == 1:
+                account = SavingsAccount(account_number, 1001, balance, date(2023, 1, 15),
+                                         generator.choice([50, 100]))
+            else:
+                created = datetime.now() - timedelta(days=generator.choice([365, 5000]))
+                account = InvestmentAccount(account_number, 1001, balance, created, 2.55)
+            self.accounts[account_number] = account
+
+    def test_current_scenario_matches_live_charges(self):
+        """The current scenario charges each account what get_service_charges() would."""
+        names, account_types, charges = simulate_fees(self.accounts, [])
+        self.assertEqual(names, [CURRENT_SCENARIO])
+        expected = [account.get_service_charges() for account in self.accounts.values()]
+        self.assertEqual([round(charge, 2) for charge in charges[0]], [round(charge, 2) for charge in expected])
+
+    def test_scenario_overrides_parameter_for_all_accounts(self):
+        """A scenario value replaces each account's own parameter."""
+        scenarios = [{"name": "no overdraft", "overdraft_limit": 0, "overdraft_rate": 0.10},
+                     {"name": "high minimum", "minimum_balance": 1000}]
+        names, account_types, charges = simulate_fees(self.accounts, scenarios)
+
+        for column, account in enumerate(self.accounts.values()):
+            if isinstance(account, ChequingAccount):
+                expected = 10.00 + max(-account.balance, 0) * 0.10
+                self.assertAlmostEqual(charges[1, column], expected)
+            if isinstance(account, SavingsAccount):
+                self.assertEqual(charges[2, column], 20.00)
+
+    def test_simulation_does_not_change_balances(self):
+        """Balances are only read."""
+        balances = [account.balance for account in self.accounts.values()]
+        simulate_fees(self.accounts, [{"name": "double rate", "overdraft_rate": 0.10}])
+        self.assertEqual([account.balance for account in self.accounts.values()], balances)
+
+    def test_summary_and_report(self):
+        """The summary has a row per scenario and account type plus an overall row."""
+        rows = summarize(*simulate_fees(self.accounts, [{"name": "no fee", "management_fee": 0}]))
+        self.assertEqual(len(rows), 2 * 4)
+        overall = [row for row in rows if row["account_type"] == "All"]
+        investment = {row["scenario"]: row for row in rows if row["account_type"] == "InvestmentAccount"}
+        self.assertLess(investment["no fee"]["total"], investment[CURRENT_SCENARIO]["total"])
+        self.assertEqual(overall[0]["accounts"], 120)
+
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "report.csv")
+            write_simulation_report(rows, report_path)
+            with open(report_path, newline='') as file:
+                self.assertEqual(len(list(csv.DictReader(file))), len(rows))
+
+    def test_scenario_without_name_is_rejected(self):
+        """Every scenario must be named."""
+        with self.assertRaises(ValueError):
+            simulate_fees(self.accounts, [{"overdraft_rate": 0.10}])
+
+    def test_unknown_parameter_is_rejected(self):
+        """A misspelled parameter is an error rather than a copy of the current scenario."""
+        with self.assertRaises(ValueError):
+            simulate_fees(self.accounts, [{"name": "typo", "overdraft_rte": 0.10}])
+
+if __name__ == "__main__":
+    unittest.main()
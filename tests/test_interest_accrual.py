@@ -0,0 +1,73 @@
+"""
+Description: Unit tests for the batch interest accrual job.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_interest_accrual.py
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from datetime import date
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from batch_jobs.interest_accrual import accrue_interest, compute_interest
+from user_interface import manage_data
+
+class TestInterestAccrual(unittest.TestCase):
+
+    def setUp(self):
+        """Create accounts in each tier and a copy of accounts.csv to update."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.accounts_csv = os.path.join(self.temp_dir.name, "accounts.csv")
+        shutil.copy(manage_data.accounts_csv_path, self.accounts_csv)
+        self.report_path = os.path.join(self.temp_dir.name, "report.csv")
+        self.accounts = {
+            20001: ChequingAccount(20001, 1001, 15300.00, date(2023, 1, 10), -50, 0.035),
+            20002: SavingsAccount(20002, 1001, 1200.00, date(2023, 1, 15), 50),
+            22222: SavingsAccount(22222, 1001, 6000.00, date(2023, 5, 5), 100),
+            20003: InvestmentAccount(20003, 1002, 120000.00, date(2023, 2, 1), 2.55),
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compute_interest_uses_tier_of_balance(self):
+        """Each balance earns the rate of the highest tier it reaches."""
+        rates, interest = compute_interest([1200.00, 6000.00, 120000.00, -20.00],
+                                           ["SavingsAccount", "SavingsAccount",
+                                            "InvestmentAccount", "SavingsAccount"], "monthly")
+        self.assertEqual(list(rates), [0.01, 0.015, 0.035, 0.0])
+        self.assertEqual(list(interest), [1.00, 7.50, 350.00, 0.0])
+
+    def test_compute_interest_invalid_period_raises(self):
+        with self.assertRaises(ValueError):
+            compute_interest([100.00], ["SavingsAccount"], "weekly")
+
+    def test_accrue_interest_posts_only_to_eligible_accounts(self):
+        """Chequing accounts earn no interest; the others are credited."""
+        with patch.object(manage_data, "accounts_csv_path", self.accounts_csv):
+            total = accrue_interest(self.accounts, "monthly", self.report_path)
+
+        self.assertEqual(round(total, 2), 358.50)
+        self.assertEqual(self.accounts[20001].balance, 15300.00)
+        self.assertEqual(self.accounts[22222].balance, 6007.50)
+
+        with open(self.accounts_csv, newline="") as file:
+            balances = {row["account_number"]: row["balance"] for row in csv.DictReader(file)}
+        self.assertEqual(float(balances["22222"]), 6007.50)
+        self.assertEqual(float(balances["20001"]), 15300.00)
+
+    def test_accrue_interest_writes_report(self):
+        """The report has one row per eligible account."""
+        accrue_interest(self.accounts, "daily", self.report_path, persist=False)
+        with open(self.report_path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([row["account_number"] for row in rows], ["20002", "22222", "20003"])
+        self.assertEqual(rows[2]["interest"], "11.51")
+
+if __name__ == "__main__":
+    unittest.main()
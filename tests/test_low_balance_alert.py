@@ -0,0 +1,75 @@
+"""
+Description: Unit tests for the low balance alert filter.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_low_balance_alert.py
+"""
+
+import unittest
+from datetime import date, datetime
+from bank_account.chequing_account import ChequingAccount
+from bank_account.low_balance_alert import LowBalanceAlertFilter, low_balance_alerts
+from tests.observers import RecordingObserver
+from utility.clock import clock
+
+class TestLowBalanceAlert(unittest.TestCase):
+
+    def setUp(self):
+        clock.freeze(datetime(2024, 6, 1, 12, 0))
+        low_balance_alerts.reset()
+        self.account = ChequingAccount(777777, 1313, 100.00, date.today(), -100.00, 0.05)
+        self.observer = RecordingObserver()
+        self.account.attach(self.observer)
+
+    def tearDown(self):
+        clock.unfreeze()
+        low_balance_alerts.reset()
+
+    def low_balance_alerts_sent(self) -> int:
+        return sum(str(message).startswith("Low balance") for message in self.observer.messages)
+
+    def test_alert_once_while_below_level(self):
+        """Transactions below the level only alert on the first crossing."""
+        for _ in range(5):
+            self.account.withdraw(20.00)
+        self.assertEqual(self.low_balance_alerts_sent(), 1)
+
+    def test_alert_again_after_recovery(self):
+        """Recovering to the level re-arms the alert."""
+        self.account.withdraw(60.00)
+        self.account.deposit(100.00)
+        self.account.withdraw(100.00)
+        self.assertEqual(self.low_balance_alerts_sent(), 2)
+
+    def test_recovery_while_unsubscribed_rearms_alert(self):
+        """A balance that recovers while nobody is subscribed alerts again on the next drop."""
+        self.account.withdraw(60.00)
+        self.account.detach(self.observer)
+        self.account.deposit(100.00)
+        self.account.attach(self.observer)
+        self.account.withdraw(100.00)
+        self.assertEqual(self.low_balance_alerts_sent(), 2)
+
+    def test_alert_again_after_cooldown(self):
+        """A balance still below the level alerts again once the cooldown expires."""
+        self.account.withdraw(60.00)
+        clock.advance(seconds=low_balance_alerts.cooldown_seconds)
+        self.account.withdraw(10.00)
+        self.assertEqual(self.low_balance_alerts_sent(), 2)
+
+    def test_state_only_kept_for_accounts_below_level(self):
+        """Accounts above the level hold no filter state."""
+        alert_filter = LowBalanceAlertFilter(cooldown_seconds=60)
+        self.assertTrue(alert_filter.should_alert(1, 10.00, 50.00))
+        self.assertFalse(alert_filter.should_alert(1, 20.00, 50.00))
+        self.assertEqual(len(alert_filter), 1)
+        self.assertFalse(alert_filter.should_alert(1, 60.00, 50.00))
+        self.assertEqual(len(alert_filter), 0)
+
+    def test_negative_cooldown_is_invalid(self):
+        with self.assertRaises(ValueError):
+            LowBalanceAlertFilter(cooldown_seconds=-1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Description: Unit tests for loading the client and account files in stages with progress reports.
+The data loader test is skipped when PySide6 is not installed.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_manage_data.py
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from client.client_search_index import ClientSearchIndex
+from user_interface import manage_data
+
+try:
+    from user_interface.data_loader import DataLoader
+except ImportError:
+    DataLoader = None
+
+class TestLoadStages(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        clients_path = os.path.join(self.directory.name, "clients.csv")
+        accounts_path = os.path.join(self.directory.name, "accounts.csv")
+        with open(clients_path, "w") as file:
+            file.write("client_number,first_name,last_name,email_address\n")
+            file.writelines(f"{number},First{number},Last{number},client{number}@pixell-river.com\n"
+                            for number in range(1, 6))
+        with open(accounts_path, "w") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n")
+            file.writelines(f"{20000 + number},{number % 5 + 1},100.0,2023-01-10,SavingsAccount,Null,Null,50,Null\n"
+                            for number in range(7))
+            # Belongs to no loaded client, so it is skipped
+            file.write("29999,99,100.0,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        self.patches = [patch.object(manage_data, "clients_csv_path", clients_path),
+                        patch.object(manage_data, "accounts_csv_path", accounts_path),
+                        patch.object(manage_data, "PROGRESS_INTERVAL", 3)]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+        self.directory.cleanup()
+
+    def test_load_clients_reports_progress(self):
+        reports = []
+        clients = manage_data.load_clients(progress=reports.append)
+        self.assertEqual(sorted(clients), [1, 2, 3, 4, 5])
+        self.assertEqual(reports, [3, 5])
+
+    def test_load_accounts_hands_over_batches(self):
+        """Each report carries only the accounts loaded since the previous one."""
+        clients = manage_data.load_clients()
+        reports = []
+        accounts = manage_data.load_accounts(clients, lambda rows, batch: reports.append((rows, sorted(batch))))
+        self.assertEqual(reports, [(3, [20000, 20001]), (6, [20002, 20003, 20004]), (8, [20005, 20006])])
+        self.assertEqual(len(accounts), 7)
+
+    def test_progress_can_stop_loading(self):
+        """Stopping returns what was read so far, with no final report."""
+        reports = []
+        accounts = manage_data.load_accounts(manage_data.load_clients(),
+                                             lambda rows, batch: reports.append((rows, sorted(batch))) or False)
+        self.assertEqual(sorted(accounts), [20000, 20001])
+        self.assertEqual(reports, [(3, [20000, 20001])])
+
+    def test_stopped_client_load_keeps_search_index(self):
+        """A stopped client load neither reports again nor removes the unread clients from the index."""
+        search_index = ClientSearchIndex()
+        manage_data.load_clients(search_index)
+        reports = []
+        clients = manage_data.load_clients(search_index, lambda rows: reports.append(rows) or False)
+        self.assertEqual(sorted(clients), [1, 2])
+        self.assertEqual(reports, [3])
+        self.assertEqual(len(search_index), 5)
+
+    def test_load_data_matches_stages(self):
+        clients, accounts = manage_data.load_data()
+        self.assertEqual(sorted(clients), [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(accounts), list(range(20000, 20007)))
+
+    @unittest.skipIf(DataLoader is None, "PySide6 is not installed")
+    def test_data_loader_signals(self):
+        """Run on the calling thread, the loader hands over the clients before any account."""
+        loader = DataLoader()
+        events = []
+        loader.clients_loaded.connect(lambda clients, index: events.append(("clients", sorted(clients), len(index))))
+        loader.accounts_loaded.connect(lambda batch: events.append(("accounts", len(batch))))
+        loader.finished.connect(lambda clients, accounts: events.append(("finished", clients, accounts)))
+        loader.run()
+        self.assertEqual(events, [("clients", [1, 2, 3, 4, 5], 5), ("accounts", 2), ("accounts", 3),
+                                  ("accounts", 2), ("finished", 5, 7)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Description: Unit tests for the multi-process month-end fee pipeline.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_month_end_pipeline.py
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from datetime import date
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from batch_jobs.month_end_pipeline import plan_shards, run_month_end, process_shard, _load_or_save_manifest
+
+class TestMonthEndPipeline(unittest.TestCase):
+
+    def setUp(self):
+        """Create accounts for four clients and a temporary work directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.accounts = {}
+        for account_number in range(20001, 20013):
+            client_number = 1001 + account_number % 4
+            if account_number % 3 == 0:
+                account = ChequingAccount(account_number, client_number, -80.00, date(2023, 1, 10), -50, 0.035)
+            elif account_number % 3 == 1:
+                account = SavingsAccount(account_number, client_number, 40.00, date(2023, 1, 15), 50)
+            else:
+                account = InvestmentAccount(account_number, client_number, 900.00, date(2023, 2, 1), 2.55)
+            self.accounts[account_number] = account
+        self.expected = {number: account.balance - account.get_service_charges()
+                         for number, account in self.accounts.items()}
+        self.expected_total = sum(account.get_service_charges() for account in self.accounts.values())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_plan_shards_keeps_clients_together(self):
+        """Client shards are contiguous client number ranges."""
+        self.assertEqual(plan_shards(self.accounts, 2, "client"), [(1001, 1002), (1003, 1004)])
+        self.assertEqual(len(plan_shards(self.accounts, 10, "account")), 10)
+
+    def test_run_applies_charges_from_every_shard(self):
+        """Every account is charged once and the report covers all accounts."""
+        total = run_month_end(self.accounts, "2024-06", shard_count=3, work_root=self.temp_dir.name,
+                              persist=False, max_workers=2)
+
+        for number, account in self.accounts.items():
+            self.assertEqual(account.balance, self.expected[number])
+        self.assertAlmostEqual(total, self.expected_total, places=2)
+
+        report_path = os.path.join(self.temp_dir.name, "2024-06", "service_charge_report.csv")
+        with open(report_path, newline="") as file:
+            self.assertEqual(len(list(csv.DictReader(file))), 12)
+
+    def test_rerun_after_merge_does_not_charge_twice(self):
+        """A finished run is not applied again."""
+        run_month_end(self.accounts, "2024-06", shard_count=2, work_root=self.temp_dir.name, persist=False)
+        run_month_end(self.accounts, "2024-06", shard_count=2, work_root=self.temp_dir.name, persist=False)
+        for number, account in self.accounts.items():
+            self.assertEqual(account.balance, self.expected[number])
+
+    def test_finished_shards_are_not_recomputed(self):
+        """A shard with a partial result file is reused rather than recomputed."""
+        work_dir = os.path.join(self.temp_dir.name, "2024-06")
+        os.makedirs(work_dir)
+        first_shard = [account for account in self.accounts.values() if account.client_number <= 1002]
+        process_shard(first_shard, os.path.join(work_dir, "shard_0000.csv"))
+
+        # Run in this process, the finished shard has charged the accounts themselves
+        charged_once = {account.account_number: account.balance for account in first_shard}
+
+        run_month_end(self.accounts, "2024-06", shard_count=2, work_root=self.temp_dir.name, persist=False)
+        for account in first_shard:
+            self.assertEqual(account.balance, charged_once[account.account_number])
+            self.assertEqual(account.balance, self.expected[account.account_number])
+
+    def test_accounts_opened_before_resume_are_charged(self):
+        """An account opened after the first attempt gets a new shard rather than a finished one."""
+        work_dir = os.path.join(self.temp_dir.name, "2024-06")
+        os.makedirs(work_dir)
+        _load_or_save_manifest(work_dir, self.accounts, 2, "client")
+        first_shard = [account for account in self.accounts.values() if account.client_number <= 1002]
+        process_shard(first_shard, os.path.join(work_dir, "shard_0000.csv"))
+
+        new_account = SavingsAccount(20099, 1001, 40.00, date(2023, 6, 1), 50)
+        expected_balance = new_account.balance - new_account.get_service_charges()
+        self.accounts[20099] = new_account
+        run_month_end(self.accounts, "2024-06", shard_count=2, work_root=self.temp_dir.name, persist=False)
+
+        self.assertEqual(new_account.balance, expected_balance)
+        self.assertTrue(os.path.exists(os.path.join(work_dir, "shard_0002.csv")))
+
+if __name__ == "__main__":
+    unittest.main()
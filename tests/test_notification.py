@@ -0,0 +1,98 @@
+"""
+Description: Unit tests for topic subscriptions and lazily rendered notifications.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_notification.py
+"""
+
+import unittest
+from datetime import date
+from unittest.mock import patch
+from bank_account.chequing_account import ChequingAccount
+from bank_account.low_balance_alert import low_balance_alerts
+from patterns.observer.observer import Observer
+from tests.observers import RecordingObserver
+from patterns.observer.notification import (Notification, LOW_BALANCE, LARGE_TRANSACTION,
+                                            FEE_CHARGED, OVERDRAFT)
+
+class TestNotification(unittest.TestCase):
+
+    def setUp(self):
+        low_balance_alerts.reset()
+        self.account = ChequingAccount(999999, 1313, 100.00, date.today(), -100.00, 0.05)
+
+    def tearDown(self):
+        low_balance_alerts.reset()
+
+    def test_observer_only_receives_subscribed_topics(self):
+        """A topic subscriber only receives notifications about its topics."""
+        fees = RecordingObserver()
+        everything = RecordingObserver()
+        self.account.attach(fees, [FEE_CHARGED])
+        self.account.attach(everything)
+
+        self.account.deposit(20000.00)
+        self.account.charge_fee(10.00)
+        self.account.update_balance(-20200.00)
+
+        self.assertEqual(fees.topics(), [FEE_CHARGED])
+        self.assertEqual(everything.topics(), [LARGE_TRANSACTION, FEE_CHARGED, OVERDRAFT, LOW_BALANCE])
+
+    def test_notification_fields_and_message(self):
+        """Notifications carry the change and render the same text as before."""
+        observer = RecordingObserver()
+        self.account.attach(observer, [LARGE_TRANSACTION])
+        self.account.deposit(12000.00)
+        notification = observer.messages[0]
+        self.assertEqual((notification.account_number, notification.amount, notification.balance),
+                         (999999, 12000.00, 12100.00))
+        self.assertEqual(str(notification), "Large transaction $12000.00: on account 999999.")
+
+    def test_message_rendered_lazily_once(self):
+        """The message text is built on first use and then reused."""
+        notification = Notification(LOW_BALANCE, 1, -5.00, 20.00)
+        with patch.dict("patterns.observer.notification._TEMPLATES",
+                        {LOW_BALANCE: "Low {balance:.2f} {account_number}"}):
+            self.assertEqual(notification.message, "Low 20.00 1")
+        self.assertEqual(notification.message, "Low 20.00 1")
+
+    def test_no_notifications_without_subscribers(self):
+        """No notification is built for accounts nobody listens to."""
+        with patch("bank_account.bank_account.Notification") as notification:
+            self.account.deposit(20000.00)
+            self.account.update_balance(-20090.00)
+        notification.assert_not_called()
+
+        observer = RecordingObserver()
+        self.account.attach(observer, [OVERDRAFT])
+        with patch("bank_account.bank_account.Notification") as notification:
+            self.account.deposit(20000.00)
+        notification.assert_not_called()
+
+    def test_reattach_changes_topics(self):
+        """Attaching again replaces an observer's topics."""
+        observer = RecordingObserver()
+        self.account.attach(observer, [OVERDRAFT])
+        self.account.attach(observer, [LARGE_TRANSACTION])
+        self.assertFalse(self.account.has_subscribers(OVERDRAFT))
+        self.assertTrue(self.account.has_subscribers(LARGE_TRANSACTION))
+
+    def test_observer_error_is_not_reported_as_invalid_amount(self):
+        """An observer's error propagates as itself, after the balance has changed."""
+        class FailingObserver(Observer):
+            def update(self, message):
+                raise RuntimeError("mail server down")
+
+        observer = FailingObserver()
+        self.account.attach(observer, [LARGE_TRANSACTION])
+        with self.assertRaises(RuntimeError):
+            self.account.update_balance(20000.00)
+        self.assertEqual(self.account.balance, 20100.00)
+
+    def test_unknown_topic(self):
+        with self.assertRaises(ValueError):
+            Notification("birthday", 1, 0.0, 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
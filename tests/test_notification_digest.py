@@ -0,0 +1,102 @@
+"""
+Description: Unit tests for the per-client notification digest.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_notification_digest.py
+"""
+
+import threading
+import unittest
+from datetime import datetime
+from client.client import Client
+from client.notification_digest import NotificationDigest
+from utility.clock import clock
+
+class RecordingOutbox:
+    """An outbox that records the emails sent to it."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, email_address, subject, message):
+        self.sent.append((email_address, subject, message))
+
+class TestNotificationDigest(unittest.TestCase):
+
+    def setUp(self):
+        clock.freeze(datetime(2024, 6, 1, 12, 0))
+        self.outbox = RecordingOutbox()
+        self.digest = NotificationDigest(window_seconds=600, max_messages=3, max_clients=2, outbox=self.outbox)
+        self.clients = [Client(number, "Lovedeep", "Sidhu", "lovedeep@pixell-river.com") for number in (1, 2, 3)]
+        for client in self.clients:
+            client.use_digest(self.digest)
+
+    def tearDown(self):
+        clock.unfreeze()
+
+    def test_alerts_combined_into_one_message_per_window(self):
+        """Alerts within a window are sent together once the window closes."""
+        for number in range(3):
+            self.clients[0].update(f"alert {number}")
+        self.assertEqual(self.outbox.sent, [])
+
+        clock.advance(seconds=600)
+        self.digest.flush_expired()
+        self.assertEqual(len(self.outbox.sent), 1)
+        message = self.outbox.sent[0][2]
+        self.assertTrue(message.startswith("Notification for 1: Lovedeep Sidhu: 3 alerts"))
+        self.assertIn("  alert 2", message)
+
+    def test_messages_per_window_are_bounded(self):
+        """Alerts past max_messages are counted, not kept."""
+        for number in range(10):
+            self.clients[0].update(f"alert {number}")
+        self.digest.flush()
+        message = self.outbox.sent[0][2]
+        self.assertIn("10 alerts", message)
+        self.assertIn("...and 7 more", message)
+        self.assertNotIn("alert 3", message)
+
+    def test_oldest_window_sent_when_too_many_clients(self):
+        """Opening a window past max_clients sends the oldest digest early."""
+        for client in self.clients:
+            client.update("alert")
+            clock.advance(seconds=1)
+        self.assertEqual(len(self.digest), 2)
+        self.assertEqual(len(self.outbox.sent), 1)
+        self.assertTrue(self.outbox.sent[0][2].startswith("Notification for 1:"))
+
+    def test_expired_windows_sent_on_next_alert(self):
+        """A new alert sends any window that has already closed."""
+        self.clients[0].update("first")
+        clock.advance(seconds=601)
+        self.clients[1].update("second")
+        self.assertEqual(len(self.outbox.sent), 1)
+        self.assertEqual(len(self.digest), 1)
+
+    def test_alerts_added_while_a_digest_is_being_sent(self):
+        """The outbox is called without the lock held, so other alerts are not blocked by it."""
+        added = []
+
+        class SlowOutbox(RecordingOutbox):
+            def send(self, email_address, subject, message):
+                client = Client(9, "Jordan", "Lee", "jlee@example.com")
+                worker = threading.Thread(target=lambda: added.append(digest.add(client, "during send")))
+                worker.start()
+                worker.join(5)
+                super().send(email_address, subject, message)
+
+        digest = NotificationDigest(window_seconds=600, outbox=SlowOutbox())
+        self.clients[0].use_digest(digest)
+        self.clients[0].update("first")
+        digest.flush()
+        self.assertEqual(added, [None])
+        self.assertEqual(len(digest), 1)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            NotificationDigest(window_seconds=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Description: Unit tests for the asynchronous notification dispatcher.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_notification_dispatcher.py
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from patterns.observer.observer import Observer
+from tests.observers import RecordingObserver
+from patterns.observer.subject import Subject
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+
+class TestNotificationDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.spill_path = os.path.join(self.directory.name, "spill.txt")
+
+    def tearDown(self):
+        Subject.use_dispatcher(None)
+        self.directory.cleanup()
+
+    def test_messages_delivered_in_order(self):
+        """Every message is delivered, in submission order."""
+        dispatcher = NotificationDispatcher(capacity=10)
+        observer = RecordingObserver()
+        for number in range(50):
+            dispatcher.submit(observer, f"message {number}")
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(observer.messages, [f"message {number}" for number in range(50)])
+        dispatcher.close(5)
+
+    def test_drop_oldest_discards_queued_messages(self):
+        """A full queue discards its oldest message for the newest one."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher(capacity=2, policy="drop_oldest")
+        observer = RecordingObserver(gate)
+        dispatcher.submit(observer, "in flight")
+        observer.started.wait(5)
+        for number in range(4):
+            dispatcher.submit(observer, number)
+        gate.set()
+        dispatcher.flush(5)
+        self.assertEqual(observer.messages, ["in flight", 2, 3])
+        self.assertEqual(dispatcher.dropped, 2)
+        dispatcher.close(5)
+
+    def test_spill_delivers_overflow_after_queue_drains(self):
+        """Overflow goes to the spill file and is delivered later, in order."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher(capacity=2, policy="spill", spill_path=self.spill_path)
+        observer = RecordingObserver(gate)
+        dispatcher.submit(observer, "in flight")
+        observer.started.wait(5)
+        for number in range(6):
+            dispatcher.submit(observer, f"message {number}")
+        self.assertTrue(os.path.exists(self.spill_path))
+        self.assertEqual(dispatcher.spilled, 4)
+
+        gate.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(observer.messages, ["in flight"] + [f"message {number}" for number in range(6)])
+        self.assertFalse(os.path.exists(self.spill_path))
+        dispatcher.close(5)
+
+    def test_spilled_messages_are_the_original_objects(self):
+        """Observers receive the spilled objects themselves, not their text."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher(capacity=1, policy="spill", spill_path=self.spill_path)
+        observer = RecordingObserver(gate)
+        dispatcher.submit(observer, "in flight")
+        observer.started.wait(5)
+        messages = [{"number": number} for number in range(3)]
+        for message in messages:
+            dispatcher.submit(observer, message)
+        gate.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(observer.messages, ["in flight"] + messages)
+        dispatcher.close(5)
+
+    def test_stale_spill_file_is_cleared(self):
+        """A spill file left by an earlier run is emptied and never delivered."""
+        with open(self.spill_path, "w") as file:
+            file.write("12345\tleft over\n")
+        dispatcher = NotificationDispatcher(capacity=1, policy="spill", spill_path=self.spill_path)
+        self.assertFalse(os.path.exists(self.spill_path))
+        observer = RecordingObserver()
+        dispatcher.submit(observer, "new")
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(observer.messages, ["new"])
+        dispatcher.close(5)
+
+    def test_unreadable_spill_does_not_stop_worker(self):
+        """A damaged spill file is logged and discarded, and later notifications still arrive."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher(capacity=1, policy="spill", spill_path=self.spill_path)
+        observer = RecordingObserver(gate)
+        dispatcher.submit(observer, "in flight")
+        observer.started.wait(5)
+        dispatcher.submit(observer, "queued")
+        dispatcher.submit(observer, "spilled")
+        with open(self.spill_path, "wb") as file:
+            file.write(b"not a pickle")
+        with self.assertLogs(level="ERROR"):
+            gate.set()
+            self.assertTrue(dispatcher.flush(5))
+        dispatcher.submit(observer, "after")
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(observer.messages, ["in flight", "queued", "after"])
+        dispatcher.close(5)
+
+    def test_dispatchers_have_their_own_spill_files(self):
+        """Each dispatcher defaults to a different spill file."""
+        self.assertNotEqual(NotificationDispatcher(policy="spill").spill_path,
+                            NotificationDispatcher(policy="spill").spill_path)
+
+    def test_observer_notifying_again_does_not_deadlock(self):
+        """An observer that submits while the queue is full has its notification queued, not blocked."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher(capacity=1)
+        recorder = RecordingObserver()
+
+        class ForwardingObserver(Observer):
+            def update(self, message):
+                gate.wait(5)
+                dispatcher.submit(recorder, f"forwarded {message}")
+
+        forwarder = ForwardingObserver()
+        dispatcher.submit(forwarder, "first")
+        dispatcher.submit(recorder, "queued")
+        gate.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(recorder.messages, ["queued", "forwarded first"])
+        dispatcher.close(5)
+
+    def test_failing_observer_does_not_stop_worker(self):
+        """An error in one observer is counted and later messages still arrive."""
+        class FailingObserver(Observer):
+            def update(self, message):
+                raise RuntimeError("mail server down")
+
+        dispatcher = NotificationDispatcher()
+        observer = RecordingObserver()
+        dispatcher.submit(FailingObserver(), "lost")
+        dispatcher.submit(observer, "delivered")
+        dispatcher.flush(5)
+        self.assertEqual((dispatcher.failed, observer.messages), (1, ["delivered"]))
+        dispatcher.close(5)
+
+    def test_subject_routes_through_dispatcher(self):
+        """A transaction returns before its notification has been delivered."""
+        gate = threading.Event()
+        dispatcher = NotificationDispatcher()
+        Subject.use_dispatcher(dispatcher)
+        observer = RecordingObserver(gate)
+        account = ChequingAccount(555555, 1313, 100.00, date.today(), -100.00, 0.05)
+        account.attach(observer)
+
+        account.deposit(20000.00)
+        self.assertEqual(account.balance, 20100.00)
+        self.assertEqual(observer.messages, [])
+        gate.set()
+        dispatcher.flush(5)
+        self.assertEqual(len(observer.messages), 1)
+        dispatcher.close(5)
+
+    def test_invalid_policy(self):
+        """Only the known backpressure policies are accepted."""
+        with self.assertRaises(ValueError):
+            NotificationDispatcher(policy="retry")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Description: Unit tests for the month-end service charge run.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_service_charge_run.py
+"""
+
+import csv
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from batch_jobs.service_charge_run import compute_service_charges, run_service_charges
+from patterns.strategy.strategy_factory import strategy_factory
+from patterns.strategy.overdraft_strategy import OverdraftStrategy
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+
+class TestServiceChargeRun(unittest.TestCase):
+
+    def setUp(self):
+        self.accounts = self.make_accounts()
+
+    def make_accounts(self) -> list:
+        """Create a mixed population of accounts around each strategy's thresholds."""
+        generator = random.Random(42)
+        accounts = []
+        for account_number in range(300):
+            balance = round(generator.uniform(-500.00, 500.00), 2)
+            kind = account_number % 3
+            if kind == 0:
+                account = ChequingAccount(account_number, 1001, balance, date(2023, 1, 10),
+                                          generator.choice([-50, -100, 0]), generator.choice([0.035, 0.05]))
+            elif kind == 1:
+                account = SavingsAccount(account_number, 1001, balance, date(2023, 1, 15),
+                                         generator.choice([50, 100, balance]))
+            else:
+                created = datetime.now() - timedelta(days=generator.choice([365, 3652, 3653, 5000]))
+                account = InvestmentAccount(account_number, 1001, balance, created, 2.55)
+            accounts.append(account)
+        return accounts
+
+    def test_bulk_charges_equal_scalar_charges(self):
+        """Every bulk charge is exactly the charge of get_service_charges()."""
+        expected = [account.get_service_charges() for account in self.accounts]
+        self.assertEqual(list(compute_service_charges(self.accounts)), expected)
+
+    def test_run_debits_charges_and_writes_report(self):
+        """Each account is debited its charge and reported."""
+        accounts = {account.account_number: account for account in self.accounts[:6]}
+        expected = {number: account.balance - account.get_service_charges()
+                    for number, account in accounts.items()}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "charges.csv")
+            run_service_charges(accounts, report_path, persist=False)
+            with open(report_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+
+        for number, account in accounts.items():
+            self.assertEqual(account.balance, expected[number])
+        # The shipped fee rules cover every account type
+        self.assertEqual([row["strategy"] for row in rows], ["RuleBasedStrategy"] * 6)
+
+    def test_built_in_bulk_formulas_equal_scalar_charges(self):
+        """Without fee rules, each built-in strategy's bulk formula gives the scalar charges."""
+        rule_set = strategy_factory.fee_rules
+        strategy_factory.use_fee_rules(None)
+        try:
+            accounts = self.make_accounts()
+        finally:
+            strategy_factory.use_fee_rules(rule_set)
+
+        self.assertEqual([type(account.service_charge_strategy) for account in accounts[:3]],
+                         [OverdraftStrategy, MinimumBalanceStrategy, ManagementFeeStrategy])
+        expected = [account.get_service_charges() for account in accounts]
+        self.assertEqual(list(compute_service_charges(accounts)), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+Description: Unit tests for the pluggable email backends and the pooled SMTP backend.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_smtp_backend.py
+"""
+
+import smtplib
+import socket
+import threading
+import time
+import unittest
+from client.client import Client
+from utility.email_backend import EmailBackend, get_email_backend, set_email_backend
+from utility.email_outbox import EmailOutbox
+from utility.smtp_backend import SMTPBackend
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.handlers import Sink
+except ImportError:
+    Controller = None
+
+class FakeSMTP:
+    """An SMTP connection that records messages and fails on request."""
+
+    opened = []
+
+    def __init__(self, host, port, timeout=None):
+        self.messages = []
+        self.failures = []
+        self.closed = False
+        self.alive = True
+        FakeSMTP.opened.append(self)
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("connection timed out")
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.messages.append(message)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+class RecordingBackend(EmailBackend):
+    """A backend that records what it is asked to send."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, email_address, subject, message):
+        self.sent.append((email_address, subject, message))
+
+class TestSMTPBackend(unittest.TestCase):
+
+    def setUp(self):
+        FakeSMTP.opened = []
+
+    def tearDown(self):
+        set_email_backend(None)
+
+    def backend(self, **settings) -> SMTPBackend:
+        return SMTPBackend(connection_factory=FakeSMTP, backoff=0, **settings)
+
+    def test_batches_share_one_pooled_connection(self):
+        """Messages go out batch_size at a time over one reused connection."""
+        backend = self.backend(batch_size=3, pool_size=1)
+        for number in range(7):
+            backend.send(f"client{number}@example.com", "ALERT", "message")
+        backend.close()
+        self.assertEqual(backend.sent, 7)
+        self.assertEqual(len(FakeSMTP.opened), 1)
+        self.assertEqual(len(FakeSMTP.opened[0].messages), 7)
+        self.assertEqual(FakeSMTP.opened[0].messages[0]["To"], "client0@example.com")
+        self.assertTrue(FakeSMTP.opened[0].closed)
+
+    def test_retries_unsent_messages_on_new_connection(self):
+        """A dropped connection is replaced and only the unsent messages are resent."""
+        def flaky_factory(host, port, timeout=None):
+            connection = FakeSMTP(host, port, timeout)
+            if len(FakeSMTP.opened) == 1:
+                connection.failures = [smtplib.SMTPServerDisconnected("gone")]
+            return connection
+
+        backend = SMTPBackend(connection_factory=flaky_factory, backoff=0, batch_size=10)
+        for number in range(3):
+            backend.send(f"client{number}@example.com", "ALERT", "message")
+        backend.flush()
+        self.assertEqual((backend.sent, backend.failed), (3, 0))
+        self.assertEqual(len(FakeSMTP.opened), 2)
+        self.assertTrue(FakeSMTP.opened[0].closed)
+
+    def test_gives_up_after_retries(self):
+        """A server that keeps failing costs retries + 1 attempts, then the batch is dropped."""
+        def broken_factory(host, port, timeout=None):
+            raise ConnectionRefusedError("no server")
+
+        backend = SMTPBackend(connection_factory=broken_factory, backoff=0, retries=2)
+        backend.send("client@example.com", "ALERT", "message")
+        with self.assertLogs(level="ERROR"):
+            backend.flush()
+        self.assertEqual((backend.sent, backend.failed), (0, 1))
+
+    def test_refused_recipient_is_not_retried(self):
+        """A refused message is counted as failed and the rest of the batch is sent."""
+        connection = FakeSMTP("localhost", 25)
+        connection.failures = [smtplib.SMTPRecipientsRefused({"bad@example.com": (550, b"no")})]
+        backend = SMTPBackend(connection_factory=lambda *args, **kwargs: connection, backoff=0)
+        backend.send("bad@example.com", "ALERT", "message")
+        backend.send("good@example.com", "ALERT", "message")
+        with self.assertLogs(level="ERROR"):
+            backend.flush()
+        self.assertEqual((backend.sent, backend.failed), (1, 1))
+        self.assertEqual(connection.messages[0]["To"], "good@example.com")
+
+    def test_permanent_error_fails_only_that_message(self):
+        """A 5xx reply fails one message, and the rest of the batch is sent on the same connection."""
+        connection = FakeSMTP("localhost", 25)
+        connection.failures = [smtplib.SMTPDataError(554, b"message rejected")]
+        backend = SMTPBackend(connection_factory=lambda *args, **kwargs: connection, backoff=0)
+        for number in range(3):
+            backend.send(f"client{number}@example.com", "ALERT", "message")
+        with self.assertLogs(level="ERROR"):
+            backend.flush()
+        self.assertEqual((backend.sent, backend.failed), (2, 1))
+        self.assertEqual([message["To"] for message in connection.messages],
+                         ["client1@example.com", "client2@example.com"])
+        self.assertFalse(connection.closed)
+
+    def test_transient_error_retries_the_batch(self):
+        """A 4xx reply drops the connection and the unsent messages are retried."""
+        def busy_factory(host, port, timeout=None):
+            connection = FakeSMTP(host, port, timeout)
+            if len(FakeSMTP.opened) == 1:
+                connection.failures = [smtplib.SMTPDataError(451, b"try again later")]
+            return connection
+
+        backend = SMTPBackend(connection_factory=busy_factory, backoff=0, batch_size=10)
+        for number in range(3):
+            backend.send(f"client{number}@example.com", "ALERT", "message")
+        backend.flush()
+        self.assertEqual((backend.sent, backend.failed), (3, 0))
+        self.assertEqual(len(FakeSMTP.opened), 2)
+
+    def test_partial_batch_sent_after_delay(self):
+        """A batch that never fills is delivered once max_delay has passed."""
+        backend = self.backend(batch_size=10, max_delay=0.05)
+        backend.send("client@example.com", "ALERT", "message")
+        self.assertEqual(backend.sent, 0)
+        deadline = time.monotonic() + 5
+        while backend.sent == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(backend.sent, 1)
+        backend.close()
+
+    def test_stale_pooled_connection_is_replaced(self):
+        """An idle connection that fails NOOP is closed and a new one is opened."""
+        backend = self.backend(batch_size=1, pool_size=1)
+        backend.send("first@example.com", "ALERT", "message")
+        backend.flush()
+        FakeSMTP.opened[0].alive = False
+        backend.send("second@example.com", "ALERT", "message")
+        backend.flush()
+        self.assertEqual(backend.sent, 2)
+        self.assertEqual(len(FakeSMTP.opened), 2)
+        self.assertTrue(FakeSMTP.opened[0].closed)
+        self.assertEqual(FakeSMTP.opened[1].messages[0]["To"], "second@example.com")
+        backend.close()
+
+    def test_send_does_not_wait_for_delivery(self):
+        """A full batch is delivered by a sender thread, so send() returns while the server is slow."""
+        server_ready = threading.Event()
+
+        def slow_factory(host, port, timeout=None):
+            server_ready.wait(5)
+            return FakeSMTP(host, port, timeout)
+
+        backend = SMTPBackend(connection_factory=slow_factory, backoff=0, batch_size=1)
+        backend.send("client@example.com", "ALERT", "message")
+        self.assertEqual(backend.sent, 0)
+        server_ready.set()
+        backend.flush()
+        self.assertEqual(backend.sent, 1)
+        backend.close()
+
+    def test_client_uses_configured_backend(self):
+        """Client notifications go through the configured backend; the file outbox is the default."""
+        self.assertIsInstance(get_email_backend(), EmailOutbox)
+        backend = RecordingBackend()
+        set_email_backend(backend)
+        Client(1, "Lovedeep", "Sidhu", "lovedeep@pixell-river.com").update("Large transaction")
+        self.assertEqual(len(backend.sent), 1)
+        self.assertIn("Large transaction", backend.sent[0][2])
+
+    def test_backend_must_be_email_backend(self):
+        with self.assertRaises(ValueError):
+            set_email_backend(object())
+
+    @unittest.skipIf(Controller is None, "aiosmtpd is not installed")
+    def test_delivers_to_local_smtp_server(self):
+        """Messages reach a real SMTP server running on localhost."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        handler = Sink()
+        controller = Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        try:
+            backend = SMTPBackend("127.0.0.1", port, batch_size=5, backoff=0)
+            for number in range(12):
+                backend.send(f"client{number}@example.com", "ALERT", "message")
+            backend.close()
+            self.assertEqual((backend.sent, backend.failed), (12, 0))
+        finally:
+            controller.stop()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Description: Unit tests for the ServiceChargeStrategyFactory class.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_strategy_factory.py
+"""
+
+import unittest
+from datetime import date, timedelta
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from patterns.strategy.strategy_factory import ServiceChargeStrategyFactory
+from patterns.strategy.overdraft_strategy import OverdraftStrategy
+
+class TestServiceChargeStrategyFactory(unittest.TestCase):
+
+    def test_same_parameters_share_one_strategy(self):
+        """Equal parameters return the same strategy object."""
+        factory = ServiceChargeStrategyFactory()
+        self.assertIs(factory.overdraft(-50, 0.035), factory.overdraft(-50.0, 0.035))
+        self.assertIsNot(factory.overdraft(-50, 0.035), factory.overdraft(-100, 0.035))
+        self.assertEqual(len(factory), 2)
+
+    def test_different_types_are_not_shared(self):
+        """A strategy is keyed by its type as well as its parameters."""
+        factory = ServiceChargeStrategyFactory()
+        self.assertIsNot(factory.minimum_balance(50.0), factory.management_fee(50.0))
+
+    def test_strategies_are_immutable(self):
+        """Shared strategies do not accept new attributes."""
+        strategy = OverdraftStrategy(-50, 0.035)
+        with self.assertRaises(AttributeError):
+            strategy.overdraft_limit = -100
+
+    def test_accounts_share_strategies(self):
+        """Accounts with the same parameters use the same strategy."""
+        first = ChequingAccount(1, 1001, 100.00, date.today(), -50, 0.035)
+        second = ChequingAccount(2, 1002, 900.00, date.today(), -50, 0.035)
+        self.assertIs(first.service_charge_strategy, second.service_charge_strategy)
+
+        first = SavingsAccount(3, 1001, 100.00, date.today(), 50)
+        second = SavingsAccount(4, 1002, 900.00, date.today(), 50)
+        self.assertIs(first.service_charge_strategy, second.service_charge_strategy)
+
+    def test_shared_management_fee_uses_each_account_date(self):
+        """Accounts sharing a management fee strategy keep their own age-based charge."""
+        old = InvestmentAccount(5, 1001, 100.00, date.today() - timedelta(days=11 * 365.25), 3.50)
+        new = InvestmentAccount(6, 1001, 100.00, date.today(), 3.50)
+        self.assertIs(old.service_charge_strategy, new.service_charge_strategy)
+        self.assertEqual(old.get_service_charges(), 10.0)
+        self.assertEqual(new.get_service_charges(), 13.5)
+
+if __name__ == "__main__":
+    unittest.main()
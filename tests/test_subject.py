@@ -0,0 +1,67 @@
+"""
+Description: Unit tests for the Subject observer registry.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_subject.py
+"""
+
+import copy
+import gc
+import pickle
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from tests.observers import RecordingObserver
+from patterns.observer.subject import Subject
+
+class TestSubject(unittest.TestCase):
+
+    def setUp(self):
+        self.subject = Subject()
+        self.observers = [RecordingObserver() for _ in range(3)]
+        for observer in self.observers:
+            self.subject.attach(observer)
+
+    def test_notify_in_attach_order(self):
+        """Observers are notified in the order they were attached, once each."""
+        self.subject.attach(self.observers[0])
+        self.assertEqual(self.subject.observers, self.observers)
+        self.subject.notify("hello")
+        self.assertEqual([observer.messages for observer in self.observers], [["hello"]] * 3)
+
+    def test_detach(self):
+        """A detached observer is no longer notified; detaching twice is harmless."""
+        self.subject.detach(self.observers[1])
+        self.subject.detach(self.observers[1])
+        self.subject.notify("hello")
+        self.assertEqual(self.observers[1].messages, [])
+        self.assertEqual(self.subject.observers, [self.observers[0], self.observers[2]])
+
+    def test_discarded_observer_is_pruned(self):
+        """An observer referenced only by the subject is removed when collected."""
+        del self.observers[1]
+        gc.collect()
+        self.assertEqual(len(self.subject._observers), 2)
+        self.subject.notify("hello")
+
+    def test_copy_has_own_registry(self):
+        """A copied account shares the observers but not the registry."""
+        account = ChequingAccount(888888, 1313, 100.00, date.today(), -100.00, 0.05)
+        account.attach(self.observers[0])
+        clone = copy.copy(account)
+        clone.attach(self.observers[1])
+        self.assertEqual(account.observers, [self.observers[0]])
+        self.assertEqual(clone.observers, [self.observers[0], self.observers[1]])
+        self.assertEqual(clone.balance, account.balance)
+
+    def test_pickle_drops_observers(self):
+        """A pickled account keeps its state but not its observers."""
+        account = ChequingAccount(888888, 1313, 100.00, date.today(), -100.00, 0.05)
+        account.attach(self.observers[0])
+        clone = pickle.loads(pickle.dumps(account))
+        self.assertEqual((clone.account_number, clone.balance), (888888, 100.00))
+        self.assertEqual(clone.observers, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Description: Unit tests for the withdrawal velocity limits.
+Author: Lovedeep Singh Sidhu
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_velocity_limit.py
+"""
+
+import unittest
+from datetime import date, datetime
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.velocity_limit import (VelocityLimit, SlidingWindowCounter, VelocityCounters, VELOCITY_LIMITS,
+                                         ONE_DAY, ONE_HOUR, set_velocity_limits)
+from utility.clock import clock
+
+class TestVelocityLimit(unittest.TestCase):
+
+    def setUp(self):
+        """Use known limits for chequing accounts and a controllable time."""
+        self.saved_limits = dict(VELOCITY_LIMITS)
+        set_velocity_limits("ChequingAccount", [VelocityLimit(ONE_DAY, max_amount=1000.00),
+                                                VelocityLimit(ONE_HOUR, max_count=3)])
+        self.account = ChequingAccount(666666, 1313, 5000.00, date.today(), -100.00, 0.05)
+        clock.freeze(datetime(2024, 6, 1, 12, 0))
+
+    def tearDown(self):
+        clock.unfreeze()
+        VELOCITY_LIMITS.clear()
+        VELOCITY_LIMITS.update(self.saved_limits)
+
+    def test_amount_limit_rejects_withdrawal_over_daily_total(self):
+        """A withdrawal that takes the 24 hour total over the limit is rejected."""
+        self.account.withdraw(600.00)
+        with self.assertRaises(ValueError):
+            self.account.withdraw(500.00)
+        self.assertEqual(self.account.balance, 4400.00)
+
+    def test_amount_limit_resets_after_window(self):
+        """Withdrawals older than the window no longer count."""
+        self.account.withdraw(600.00)
+        clock.advance(seconds=ONE_DAY)
+        self.account.withdraw(500.00)
+        self.assertEqual(self.account.balance, 3900.00)
+
+    def test_count_limit_rejects_extra_withdrawal_within_hour(self):
+        """Only the configured number of withdrawals are allowed per hour."""
+        for _ in range(3):
+            self.account.withdraw(10.00)
+            clock.advance(seconds=60)
+        with self.assertRaises(ValueError):
+            self.account.withdraw(10.00)
+
+        clock.advance(seconds=ONE_HOUR)
+        self.account.withdraw(10.00)
+        self.assertEqual(self.account.balance, 4960.00)
+
+    def test_rejected_withdrawal_is_not_counted(self):
+        """A rejected withdrawal does not use up the limit."""
+        with self.assertRaises(ValueError):
+            self.account.withdraw(1500.00)
+        self.account.withdraw(1000.00)
+        self.assertEqual(self.account.balance, 4000.00)
+
+    def test_account_type_without_limits(self):
+        """An empty set of limits allows any number of withdrawals."""
+        set_velocity_limits("ChequingAccount", [])
+        for _ in range(10):
+            self.account.withdraw(400.00)
+        self.assertEqual(self.account.balance, 1000.00)
+
+    def test_account_types_are_not_limited_by_default(self):
+        """Only configured account types have limits."""
+        savings = SavingsAccount(777777, 1313, 50000.00, date.today(), 50.00)
+        for _ in range(20):
+            savings.withdraw(2000.00)
+        self.assertEqual(savings.balance, 10000.00)
+
+    def test_unused_window_is_dropped_after_it_expires(self):
+        """A counter whose window is no longer limited is kept only while it holds withdrawals."""
+        counters = VelocityCounters()
+        daily, hourly = (VelocityLimit(ONE_DAY, max_amount=1000.00),), (VelocityLimit(ONE_HOUR, max_count=3),)
+        counters.record(daily, 10.00, 0)
+        counters.record(hourly, 10.00, 60)
+        self.assertEqual(len(counters), 2)
+        counters.record(hourly, 10.00, ONE_DAY)
+        self.assertEqual(len(counters), 1)
+
+    def test_counter_expires_lazily(self):
+        """Expired entries are only removed when the counter is used."""
+        counter = SlidingWindowCounter(60)
+        counter.add(0, 100)
+        counter.add(30, 200)
+        counter.expire(75)
+        self.assertEqual((counter.total_cents, counter.count), (200, 1))
+
+    def test_limit_requires_a_maximum(self):
+        """A limit without an amount or a count is invalid."""
+        with self.assertRaises(ValueError):
+            VelocityLimit(ONE_HOUR)
+
+if __name__ == "__main__":
+    unittest.main()
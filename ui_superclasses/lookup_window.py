@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QMainWindow, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QComboBox
+from PySide6.QtWidgets import QMainWindow, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QTableView, QComboBox, QHeaderView
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
@@ -16,8 +16,6 @@ class LookupWindow(QMainWindow):
         """
         super().__init__()
 
-        COLUMN_HEADERS = ["Account Number", "Balance", "Date Created", "Account Type"]
-
         self.setWindowTitle("Client Lookup")
         self.resize(600, 400) 
 
@@ -38,7 +36,7 @@ class LookupWindow(QMainWindow):
         self.lookup_button.setDefault(True)
 
         self.client_info_label = QLabel()
-        self.account_table = QTableWidget()
+        self.account_table = QTableView()
         self.prompt_label.setAlignment(Qt.AlignCenter)
         self.client_number_edit.setAlignment(Qt.AlignCenter)
         self.client_info_label.setAlignment(Qt.AlignCenter)
@@ -47,8 +45,8 @@ class LookupWindow(QMainWindow):
         self.filter_label = QLabel("Data is Not Currently Filtered")
         self.filter_label.setFont(bold_font)
         self.filter_edit = QLineEdit()
+        # Subclasses add the columns of the model they show
         self.filter_combo_box = QComboBox()
-        self.filter_combo_box.addItems(COLUMN_HEADERS)
         self.filter_button = QPushButton("Apply Filter")
 
         # Adjusting layout to make widgets centered in the middle column of a 3-column layout
@@ -71,11 +69,13 @@ class LookupWindow(QMainWindow):
         layout.addWidget(self.filter_edit, 6, 1)
         layout.addWidget(self.filter_button, 6, 2)
 
-        self.account_table.setColumnCount(4)
-        self.account_table.setHorizontalHeaderLabels(COLUMN_HEADERS)                
+        # The table is a view; subclasses give it a model and list its columns in filter_combo_box.
+        # Rows have a fixed height and column widths are measured on the first rows only,
+        # so large models are never walked to lay out the table.
+        self.account_table.setSelectionBehavior(QTableView.SelectRows)
         self.account_table.horizontalHeader().setFont(bold_font)
-        self.account_table.resizeColumnsToContents()
-        self.account_table.resizeRowsToContents()
+        self.account_table.horizontalHeader().setResizeContentsPrecision(100)
+        self.account_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.reset_display()
 
 
@@ -90,11 +90,13 @@ class LookupWindow(QMainWindow):
 
         Note that the function does not return anything.
         """
-        self.account_table.setRowCount(0)
+        if self.account_table.model() is not None:
+            self.account_table.model().clear()
         self.client_number_edit.clear()
         self.client_info_label.setText("")
         self.client_info_label.setFocus()
         self.filter_edit.setText("")
+        self.filter_label.setText("Data is Not Currently Filtered")
         self.filter_combo_box.setCurrentIndex(0)
         self.filter_combo_box.setEnabled(False)
         self.filter_edit.setEnabled(False)
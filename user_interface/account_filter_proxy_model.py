@@ -0,0 +1,204 @@
+"""
+Description: This class defines the AccountFilterProxyModel, a proxy model that filters and sorts
+the rows of an AccountTableModel using per-column keys computed once per client, so filtering and
+sorting stay interactive for clients with very many accounts.
+Author: Lovedeep Singh Sidhu
+"""
+
+from PySide6.QtCore import Qt, QAbstractProxyModel, QModelIndex
+from bank_account.bank_account import BankAccount
+from user_interface.account_table_model import COLUMN_HEADERS
+
+class AccountFilterProxyModel(QAbstractProxyModel):
+    """
+    A proxy model that shows the rows of an account table model whose column
+    contains the filter text, in the sorted order.
+
+    Filtering and sorting are done on lists of per-column keys built the first time
+    the client's accounts are filtered or sorted: filter text (the lower-cased cell
+    text and plain value) and sort keys (numbers for the account number, balance and
+    date, the name for the account type). The visible rows are then computed with
+    one list comprehension or one sorted() call over those lists instead of a Python
+    callback per row or per comparison, which is what a QSortFilterProxyModel would
+    make, and the view is reset once.
+
+    Attributes:
+        filter_column (int): The column being filtered.
+        filter_text (str): The filter text, or "" when the data is not filtered.
+        filter_description (str): A description of the active filter for the window.
+
+    Methods:
+        set_filter(column, text): Shows only the rows whose column contains text.
+        sort(column, order): Orders the rows by a column.
+        clear(): Clears the filter and the source model.
+        account_at(row) -> BankAccount: Returns the account shown in a row.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the proxy without a source model."""
+        super().__init__(parent)
+        self.__rows = []
+        self.__positions = None
+        self.__sort_keys = None
+        self.__filter_keys = None
+        self.__filter_column = 0
+        self.__filter_text = ""
+        self.__sort_column = -1
+        self.__sort_order = Qt.AscendingOrder
+
+    @property
+    def filter_column(self) -> int:
+        """Returns the column being filtered."""
+        return self.__filter_column
+
+    @property
+    def filter_text(self) -> str:
+        """Returns the filter text, or "" when the data is not filtered."""
+        return self.__filter_text
+
+    @property
+    def filter_description(self) -> str:
+        """Returns a description of the active filter."""
+        if not self.__filter_text:
+            return "Data is Not Currently Filtered"
+        return f"Data is Currently Filtered By: {COLUMN_HEADERS[self.__filter_column]} contains '{self.__filter_text}'"
+
+    def setSourceModel(self, model) -> None:
+        """Sets the account table model the proxy reads from."""
+        super().setSourceModel(model)
+        model.modelReset.connect(self.__on_source_reset)
+        model.dataChanged.connect(self.__on_source_data_changed)
+        self.__on_source_reset()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.__rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not 0 <= row < len(self.__rows) or not 0 <= column < len(COLUMN_HEADERS):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.__rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        if self.__positions is None:
+            self.__positions = {source_row: row for row, source_row in enumerate(self.__rows)}
+        row = self.__positions.get(source_index.row())
+        return QModelIndex() if row is None else self.createIndex(row, source_index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Returns the source column headers and row numbers in view order."""
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        if role == Qt.DisplayRole:
+            return section + 1
+        return None
+
+    def set_filter(self, column: int, text: str) -> None:
+        """
+        Shows only the rows whose column contains text, ignoring case. Empty text shows every row.
+
+        Args:
+            column (int): The column to filter.
+            text (str): The text the column must contain.
+
+        Raises:
+            ValueError: If the column does not exist.
+        """
+        if not 0 <= column < len(COLUMN_HEADERS):
+            raise ValueError(f"Not a valid filter column: {column}")
+        self.__filter_column = column
+        self.__filter_text = text.strip()
+        self.__refresh()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Orders the rows by a column; -1 restores the source order."""
+        self.__sort_column = column
+        self.__sort_order = order
+        self.__refresh()
+
+    def clear(self) -> None:
+        """Clears the filter and the source model."""
+        self.__filter_text = ""
+        self.sourceModel().clear()
+
+    def account_at(self, row: int) -> BankAccount:
+        """Returns the account shown in a row."""
+        return self.sourceModel().account_at(self.__rows[row])
+
+    def __refresh(self) -> None:
+        """Recomputes the visible rows from the keys and resets the view."""
+        self.beginResetModel()
+        self.__rows = self.__visible_rows()
+        self.__positions = None
+        self.endResetModel()
+
+    def __visible_rows(self) -> list[int]:
+        """Returns the source rows that pass the filter, in sorted order."""
+        count = self.sourceModel().rowCount()
+        if not self.__filter_text and self.__sort_column < 0:
+            return list(range(count))
+        self.__build_keys()
+
+        if self.__filter_text:
+            text = self.__filter_text.casefold()
+            filter_keys = self.__filter_keys[self.__filter_column]
+            rows = [row for row in range(count) if text in filter_keys[row]]
+        else:
+            rows = list(range(count))
+
+        if self.__sort_column >= 0:
+            rows.sort(key=self.__sort_keys[self.__sort_column].__getitem__,
+                      reverse=self.__sort_order == Qt.DescendingOrder)
+        return rows
+
+    def __build_keys(self) -> None:
+        """Computes the filter and sort keys of every row, once per client."""
+        if self.__sort_keys is not None:
+            return
+        accounts = [self.sourceModel().account_at(row) for row in range(self.sourceModel().rowCount())]
+        self.__sort_keys = [[account.account_number for account in accounts],
+                            [account.balance for account in accounts],
+                            [account.date_created.toordinal() for account in accounts],
+                            [type(account).__name__ for account in accounts]]
+        self.__filter_keys = [[str(account.account_number) for account in accounts],
+                              [f"{account.balance:.2f} ${account.balance:,.2f}" for account in accounts],
+                              [str(account.date_created) for account in accounts],
+                              [type(account).__name__.casefold() for account in accounts]]
+
+    def __on_source_reset(self) -> None:
+        """Drops the keys of the previous client and shows the new one's rows."""
+        self.__sort_keys = None
+        self.__filter_keys = None
+        self.__refresh()
+
+    def __on_source_data_changed(self, first: QModelIndex, last: QModelIndex, roles=()) -> None:
+        """
+        Updates the keys of changed rows. When the rows are filtered or sorted by
+        balance the visible rows are recomputed, since a changed balance may no longer
+        match the filter or be in order; otherwise the rows are repainted where shown.
+        """
+        for source_row in range(first.row(), last.row() + 1):
+            if self.__sort_keys is not None:
+                balance = self.sourceModel().account_at(source_row).balance
+                self.__sort_keys[1][source_row] = balance
+                self.__filter_keys[1][source_row] = f"{balance:.2f} ${balance:,.2f}"
+
+        if (self.__filter_text and self.__filter_column == 1) or self.__sort_column == 1:
+            self.__refresh()
+            return
+        for source_row in range(first.row(), last.row() + 1):
+            proxy_index = self.mapFromSource(self.sourceModel().index(source_row, 0))
+            if proxy_index.isValid():
+                self.dataChanged.emit(proxy_index, self.index(proxy_index.row(), len(COLUMN_HEADERS) - 1))
@@ -0,0 +1,152 @@
+"""
+Description: This class defines the AccountPersister, a worker thread that writes updated account
+balances to the accounts file in the background and reports each write back to the user
+interface with signals.
+Author: Lovedeep Singh Sidhu
+"""
+
+import logging
+import threading
+from PySide6.QtCore import QThread, Signal
+from bank_account.bank_account import BankAccount
+from user_interface.manage_data import update_data_batch
+
+class AccountPersister(QThread):
+    """
+    A thread that saves updated bank accounts to the accounts file.
+
+    save() only records the account and wakes the thread, so the GUI thread never
+    waits on the disk. The thread takes every account saved since its last write
+    and writes them in one pass with update_data_batch. Saves of the same account
+    are keyed by account number, so a newer balance replaces an older one that has
+    not been written yet, and one that arrives during a write is written by the next
+    pass; the file therefore always ends up with each account's latest balance.
+
+    A pass that fails puts its accounts back in the queue, unless a newer save of
+    the same account has arrived, and is retried after retry_delay seconds, doubling
+    with every failure. close() retries at once. After retries failed passes in a
+    row the accounts are given up and reported with the failed signal.
+
+    Signals:
+        saved(list): The accounts written by a pass.
+        failed(list, str): The accounts that could not be written and the reason.
+        pending_changed(): The number of accounts waiting to be written changed.
+            It is emitted from both threads, so receivers read pending_count.
+
+    Attributes:
+        retries (int): The number of retries of a failed pass.
+        retry_delay (float): The wait in seconds before the first retry.
+        pending_count (int): The number of accounts waiting to be written or being written.
+
+    Methods:
+        save(account): Queues an updated account to be written.
+        close(): Writes the queued accounts and ends the thread.
+    """
+    saved = Signal(object)
+    failed = Signal(object, str)
+    pending_changed = Signal()
+
+    def __init__(self, parent=None, retries: int = 3, retry_delay: float = 1.0):
+        """
+        Initializes the persister; the thread starts with the first save.
+
+        Args:
+            parent (QObject): The owner of the thread.
+            retries (int): The number of retries of a failed pass.
+            retry_delay (float): The wait in seconds before the first retry.
+
+        Raises:
+            ValueError: If the retry settings are negative.
+        """
+        super().__init__(parent)
+        if retries < 0 or retry_delay < 0:
+            raise ValueError("Retries and retry delay cannot be negative.")
+        self.__retries = retries
+        self.__retry_delay = retry_delay
+        self.__pending = {}
+        self.__writing = 0
+        self.__closed = False
+        self.__condition = threading.Condition()
+
+    @property
+    def retries(self) -> int:
+        """Returns the number of retries of a failed pass."""
+        return self.__retries
+
+    @property
+    def retry_delay(self) -> float:
+        """Returns the wait in seconds before the first retry."""
+        return self.__retry_delay
+
+    @property
+    def pending_count(self) -> int:
+        """Returns the number of accounts waiting to be written or being written."""
+        with self.__condition:
+            return len(self.__pending) + self.__writing
+
+    def save(self, account: BankAccount) -> None:
+        """
+        Queues an updated account to be written, replacing any unwritten save of the same account.
+
+        Args:
+            account (BankAccount): The updated account.
+
+        Raises:
+            ValueError: If the persister is closed.
+        """
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("The account persister is closed.")
+            self.__pending[account.account_number] = account
+            self.__condition.notify()
+        if not self.isRunning():
+            self.start()
+        self.pending_changed.emit()
+
+    def close(self) -> None:
+        """Writes the queued accounts and waits for the thread to end."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+        if self.isRunning():
+            self.wait()
+
+    def run(self) -> None:
+        """Writes the queued accounts, one pass at a time, until closed."""
+        attempt = 0
+        while True:
+            with self.__condition:
+                while not self.__pending and not self.__closed:
+                    self.__condition.wait()
+                if not self.__pending:
+                    return
+                batch = list(self.__pending.values())
+                self.__pending = {}
+                self.__writing = len(batch)
+
+            try:
+                update_data_batch(batch)
+            except Exception as e:
+                gave_up = attempt >= self.__retries
+                with self.__condition:
+                    self.__writing = 0
+                    if not gave_up:
+                        # A newer save of an account replaces the failed one
+                        for account in batch:
+                            self.__pending.setdefault(account.account_number, account)
+                if gave_up:
+                    logging.error(f"Unable to save {len(batch)} accounts after {attempt + 1} attempts: {e}")
+                    self.failed.emit(batch, str(e))
+                    attempt = 0
+                else:
+                    logging.warning(f"Unable to save {len(batch)} accounts, retrying: {e}")
+                    with self.__condition:
+                        if not self.__closed:
+                            self.__condition.wait(self.__retry_delay * 2 ** attempt)
+                    attempt += 1
+            else:
+                with self.__condition:
+                    self.__writing = 0
+                attempt = 0
+                self.saved.emit(batch)
+            self.pending_changed.emit()
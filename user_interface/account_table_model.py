@@ -0,0 +1,110 @@
+"""
+Description: This class defines the AccountTableModel, a table model that presents a client's bank
+accounts to a QTableView straight from the account store, building each cell's text only when
+the view asks for it.
+Author: Lovedeep Singh Sidhu
+"""
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from bank_account.bank_account import BankAccount
+
+COLUMN_HEADERS = ["Account Number", "Balance", "Date Created", "Account Type"]
+
+# Role that returns the BankAccount of a row
+ACCOUNT_ROLE = Qt.UserRole
+
+class AccountTableModel(QAbstractTableModel):
+    """
+    A table model over a list of bank accounts.
+
+    The model holds a reference to the list it is given rather than copying it, and
+    the view only asks for the cells of visible rows, so showing a client with tens
+    of thousands of accounts costs the same as showing one with a handful.
+
+    Methods:
+        set_accounts(accounts): Shows a new list of accounts.
+        clear(): Shows no accounts.
+        account_at(row) -> BankAccount: Returns the account shown in a row.
+        update_account(account): Replaces an account with its updated copy and repaints its row.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes an empty model."""
+        super().__init__(parent)
+        self.__accounts = []
+        self.__rows = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Returns the number of accounts; table models have no child rows."""
+        return 0 if parent.isValid() else len(self.__accounts)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Returns the number of columns."""
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Returns the text of a cell, or the row's account for ACCOUNT_ROLE."""
+        if not index.isValid():
+            return None
+        account = self.__accounts[index.row()]
+
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return str(account.account_number)
+            if column == 1:
+                return f"${account.balance:,.2f}"
+            if column == 2:
+                return str(account.date_created)
+            return type(account).__name__
+        if role == Qt.TextAlignmentRole and index.column() == 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == ACCOUNT_ROLE:
+            return account
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Returns the column headers."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_accounts(self, accounts: list) -> None:
+        """
+        Shows a new list of accounts. The list is used as is, not copied.
+
+        Args:
+            accounts (list): The bank accounts to show.
+        """
+        self.beginResetModel()
+        self.__accounts = accounts
+        self.__rows = None
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Shows no accounts."""
+        self.set_accounts([])
+
+    def account_at(self, row: int) -> BankAccount:
+        """Returns the account shown in a row."""
+        return self.__accounts[row]
+
+    def update_account(self, account: BankAccount) -> bool:
+        """
+        Replaces the shown account with the same number by an updated copy and repaints its row.
+
+        Args:
+            account (BankAccount): The updated account.
+
+        Returns:
+            bool: True if the account is shown by the model.
+        """
+        if self.__rows is None:
+            # Built on the first update, so showing accounts never walks the whole list
+            self.__rows = {shown.account_number: row for row, shown in enumerate(self.__accounts)}
+        row = self.__rows.get(account.account_number)
+        if row is None:
+            return False
+        self.__accounts[row] = account
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMN_HEADERS) - 1))
+        return True
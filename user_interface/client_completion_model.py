@@ -0,0 +1,106 @@
+"""
+Description: This class defines the ClientCompletionModel, a list model that feeds a QCompleter
+on the client number field with the clients matching what the teller has typed, read a page
+at a time from the client search index.
+Author: Lovedeep Singh Sidhu
+"""
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from client.client import Client
+from client.client_search_index import ClientSearchIndex
+
+# Number of matches fetched at a time
+PAGE_SIZE = 20
+
+class ClientCompletionModel(QAbstractListModel):
+    """
+    A list model of the clients matching a search text.
+
+    The model never holds the client list. set_text() asks the search index for the
+    first PAGE_SIZE matches by client number, name or email prefix, and the view
+    fetches further pages through canFetchMore() and fetchMore() only when the popup
+    is scrolled to them. Each row shows the client's number, name and email address;
+    its edit role is the client number, which is the text the completer inserts
+    into the client number field.
+
+    Attributes:
+        text (str): The search text.
+
+    Methods:
+        set_search_index(search_index): Searches a new index.
+        set_text(text): Shows the first page of clients matching text.
+        client_at(row) -> Client: Returns the client shown in a row.
+    """
+
+    def __init__(self, search_index: ClientSearchIndex = None, parent=None):
+        """
+        Initializes an empty model.
+
+        Args:
+            search_index (ClientSearchIndex): The index to search, or None until the clients are loaded.
+        """
+        super().__init__(parent)
+        self.__search_index = search_index
+        self.__text = ""
+        self.__clients = []
+        self.__exhausted = True
+
+    @property
+    def text(self) -> str:
+        """Returns the search text."""
+        return self.__text
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Returns the number of matches fetched so far; list models have no child rows."""
+        return 0 if parent.isValid() else len(self.__clients)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Returns the description of a client, or its number for the edit role."""
+        if not index.isValid():
+            return None
+        client = self.__clients[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{client.client_number}  {client.first_name} {client.last_name}  <{client.email_address}>"
+        if role == Qt.EditRole:
+            return str(client.client_number)
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Returns whether the last page was full, so more clients may match."""
+        return not parent.isValid() and not self.__exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Appends the next page of matching clients."""
+        if parent.isValid() or self.__exhausted:
+            return
+        count = len(self.__clients)
+        # A search with a larger limit starts with the same matches, so only the tail is new
+        more = self.__search_index.search(self.__text, count + PAGE_SIZE)[count:]
+        self.__exhausted = len(more) < PAGE_SIZE
+        if more:
+            self.beginInsertRows(QModelIndex(), count, count + len(more) - 1)
+            self.__clients.extend(more)
+            self.endInsertRows()
+
+    def set_search_index(self, search_index: ClientSearchIndex) -> None:
+        """Searches a new index and shows its matches for the current text."""
+        self.__search_index = search_index
+        self.set_text(self.__text)
+
+    def set_text(self, text: str) -> None:
+        """
+        Shows the first page of clients matching text.
+
+        Args:
+            text (str): The start of a client number, name or email address.
+        """
+        self.beginResetModel()
+        self.__text = text
+        self.__clients = []
+        self.__exhausted = not text.strip() or self.__search_index is None
+        self.endResetModel()
+        self.fetchMore()
+
+    def client_at(self, row: int) -> Client:
+        """Returns the client shown in a row."""
+        return self.__clients[row]
@@ -4,26 +4,128 @@ Description: This class defines the ClientLookupWindow, a user interface for loo
 Author: Lovedeep Singh Sidhu
 """
 
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
-from PySide6.QtCore import Slot
+from PySide6.QtWidgets import QMessageBox, QLabel, QCompleter
+from PySide6.QtCore import Qt, Slot, QModelIndex
 from ui_superclasses.lookup_window import LookupWindow
 from user_interface.account_details_window import AccountDetailsWindow
-from user_interface.manage_data import load_data, update_data
+from user_interface.account_table_model import AccountTableModel, COLUMN_HEADERS
+from user_interface.account_filter_proxy_model import AccountFilterProxyModel
+from user_interface.account_persister import AccountPersister
+from user_interface.client_completion_model import ClientCompletionModel
+from user_interface.data_loader import DataLoader
 from bank_account.bank_account import BankAccount
 
 class ClientLookupWindow(LookupWindow):
     def __init__(self):
         super().__init__()
-        # Load data for clients and accounts
-        self.client_listing, self.accounts = load_data()
+        # Clients and accounts are filled in by the data loader; the accounts are also
+        # grouped by client as they arrive, so a lookup does not scan every account
+        self.client_listing = {}
+        self.accounts = {}
+        self.accounts_by_client = {}
+        self.search_index = None
+        self.shown_client_number = None
+
+        # The table shows the looked up client's accounts through a filtering and sorting proxy
+        self.account_model = AccountTableModel(self)
+        self.account_proxy = AccountFilterProxyModel(self)
+        self.account_proxy.setSourceModel(self.account_model)
+        self.account_table.setModel(self.account_proxy)
+        self.filter_combo_box.addItems(COLUMN_HEADERS)
+        self.account_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.account_table.setSortingEnabled(True)
 
         # Connect buttons and events
         self.lookup_button.clicked.connect(self.on_lookup_client)
-        self.account_table.cellClicked.connect(self.on_select_account)
+        self.account_table.clicked.connect(self.on_select_account)
+        self.filter_button.clicked.connect(self.on_apply_filter)
+
+        # Suggest clients by number, name or email address as the teller types; the
+        # model searches the client index and the completer inserts the client number
+        self.client_completion_model = ClientCompletionModel(parent=self)
+        self.client_completer = QCompleter(self.client_completion_model, self)
+        self.client_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.client_number_edit.setCompleter(self.client_completer)
+        self.client_number_edit.textEdited.connect(self.on_client_text_edited)
+        self.client_completer.activated.connect(self.on_lookup_client)
+
+        # Load the data on a worker thread; lookups are enabled once the clients are loaded
+        self.client_number_edit.setEnabled(False)
+        self.lookup_button.setEnabled(False)
+        self.data_loader = DataLoader()
+        self.data_loader.progress.connect(self.statusBar().showMessage)
+        self.data_loader.clients_loaded.connect(self.on_clients_loaded)
+        self.data_loader.accounts_loaded.connect(self.on_accounts_loaded)
+        self.data_loader.finished.connect(self.on_loading_finished)
+        self.data_loader.start()
+
+        # Updated balances are written to disk on a worker thread; the status bar shows
+        # how many are still waiting
+        self.pending_label = QLabel()
+        self.statusBar().addPermanentWidget(self.pending_label)
+        self.account_persister = AccountPersister(self)
+        self.account_persister.pending_changed.connect(self.on_pending_changed)
+        self.account_persister.failed.connect(self.on_save_failed)
+
+    @Slot(object, object)
+    def on_clients_loaded(self, client_listing: dict, search_index):
+        """Stores the loaded clients and enables lookups while the accounts keep loading."""
+        self.client_listing = client_listing
+        self.search_index = search_index
+        self.client_completion_model.set_search_index(search_index)
+        self.client_number_edit.setEnabled(True)
+        self.lookup_button.setEnabled(True)
+        self.client_number_edit.setFocus()
+
+    @Slot(str)
+    def on_client_text_edited(self, text: str):
+        """Shows the clients matching the typed text in the completer's popup."""
+        self.client_completion_model.set_text(text)
+        if self.client_completion_model.rowCount():
+            self.client_completer.complete()
+        else:
+            self.client_completer.popup().hide()
+
+    @Slot(object)
+    def on_accounts_loaded(self, batch: dict):
+        """Adds a batch of loaded accounts and shows any that belong to the client on display."""
+        self.accounts.update(batch)
+        shown_client_changed = False
+        for account in batch.values():
+            self.accounts_by_client.setdefault(account.client_number, []).append(account)
+            shown_client_changed |= account.client_number == self.shown_client_number
+        if shown_client_changed:
+            # The model shows the client's list itself; resetting it keeps the filter and sort
+            self.account_model.set_accounts(self.accounts_by_client[self.shown_client_number])
+
+    @Slot(int, int)
+    def on_loading_finished(self, client_count: int, account_count: int):
+        """Reports the loaded data in the status bar."""
+        self.statusBar().showMessage(f"Loaded {client_count:,} clients and {account_count:,} accounts", 5000)
+
+    @Slot()
+    def on_pending_changed(self):
+        """Shows the number of account updates not yet saved."""
+        # Read the count here; the signal is emitted from two threads and may arrive out of order
+        count = self.account_persister.pending_count
+        self.pending_label.setText(f"Saving {count} account update{'s' if count != 1 else ''}..." if count else "")
+
+    @Slot(object, str)
+    def on_save_failed(self, accounts: list, reason: str):
+        """Warns that account updates could not be saved."""
+        numbers = ", ".join(str(account.account_number) for account in accounts)
+        QMessageBox.warning(self, "Save Failed", f"Unable to save bank accounts {numbers}: {reason}")
+
+    def closeEvent(self, event):
+        """Stops the data loader and saves the pending account updates before the window closes."""
+        self.data_loader.stop()
+        self.account_persister.close()
+        super().closeEvent(event)
 
     @Slot()
     def on_lookup_client(self):
         """Handles the lookup button click event to find and display client information."""
+        self.shown_client_number = None
         try:
             # Obtain and validate client number from input
             client_number = int(self.client_number_edit.text().strip())
@@ -41,33 +143,35 @@ class ClientLookupWindow(LookupWindow):
         # Display client information
         client = self.client_listing[client_number]
         self.client_info_label.setText(f"{client.first_name} {client.last_name}")
+        self.shown_client_number = client_number
 
-        # Display associated bank accounts
-        self.account_table.setRowCount(0)  # Clear previous table entries
-        for account in self.accounts.values():
-            if account.client_number == client_number:
-                row_position = self.account_table.rowCount()
-                self.account_table.insertRow(row_position)
+        # Display associated bank accounts; the view only renders the visible rows
+        self.account_proxy.set_filter(0, "")
+        self.account_model.set_accounts(self.accounts_by_client.get(client_number, []))
+        self.account_table.resizeColumnsToContents()
 
-                # Populate table cells with account information
-                self.account_table.setItem(row_position, 0, QTableWidgetItem(str(account.account_number)))
-                self.account_table.setItem(row_position, 1, QTableWidgetItem(f"${account.balance:,.2f}"))
-                self.account_table.setItem(row_position, 2, QTableWidgetItem(str(account.date_created) if hasattr(account, 'date_created') else "N/A"))
-                self.account_table.setItem(row_position, 3, QTableWidgetItem(account.__class__.__name__))
+        # Enable the filter controls
+        self.filter_edit.setText("")
+        self.filter_label.setText(self.account_proxy.filter_description)
+        for widget in (self.filter_combo_box, self.filter_edit, self.filter_button, self.filter_label):
+            widget.setEnabled(True)
 
-        self.account_table.resizeColumnsToContents()
+    @Slot()
+    def on_apply_filter(self):
+        """Handles the filter button click event to filter the client's accounts."""
+        self.account_proxy.set_filter(self.filter_combo_box.currentIndex(), self.filter_edit.text())
+        self.filter_label.setText(self.account_proxy.filter_description)
 
-    @Slot(int, int)
-    def on_select_account(self, row: int, column: int):
+    @Slot(QModelIndex)
+    def on_select_account(self, index: QModelIndex):
         """Handles the cell click event to display account details."""
         # Retrieve the account number from the selected row
-        account_number_item = self.account_table.item(row, 0)
-        if not account_number_item:
+        if not index.isValid():
             QMessageBox.warning(self, "Invalid Selection", "No account selected.")
             return
 
         # Ensure the account number exists in the accounts dictionary
-        account_number = int(account_number_item.text())
+        account_number = self.account_proxy.account_at(index.row()).account_number
         if account_number not in self.accounts:
             QMessageBox.warning(self, "Error", "Bank account does not exist.")
             return
@@ -84,16 +188,10 @@ class ClientLookupWindow(LookupWindow):
     @Slot(BankAccount)
     def update_data(self, account: BankAccount):
         """Updates the account table and data after receiving the balance_updated signal."""
-        # Loop through the rows in the account_table
-        for row in range(self.account_table.rowCount()):
-            account_number_item = self.account_table.item(row, 0)
-            if account_number_item and int(account_number_item.text()) == account.account_number:
-                # Update the balance column with the new balance
-                self.account_table.setItem(row, 1, QTableWidgetItem(f"${account.balance:,.2f}"))
-
-                # Update the account in the dictionary
-                self.accounts[account.account_number] = account
-
-                # Update the data in the manage_data module
-                update_data(account)
-                break
+        # Replace the account in the client's list, which also repaints its row
+        if self.account_model.update_account(account):
+            # Update the account in the dictionary
+            self.accounts[account.account_number] = account
+
+            # Save the account on the persister's thread, so the window never waits on the file
+            self.account_persister.save(account)
@@ -0,0 +1,102 @@
+"""
+Description: This class defines the DataLoader, a worker that loads the client and account files
+on its own thread and reports its progress with signals, so the lookup window can show and
+accept lookups while the data is still being read.
+Author: Lovedeep Singh Sidhu
+"""
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+from client.client_search_index import ClientSearchIndex
+from user_interface.manage_data import load_clients, load_accounts
+
+class DataLoader(QObject):
+    """
+    A worker that loads the clients, then the accounts, on a QThread.
+
+    The clients and the search index are handed over in one clients_loaded signal
+    once the whole clients file is read, so lookups can start while the accounts are
+    still loading. Accounts are handed over in batches of newly created dictionaries,
+    which the receiving thread merges into its own, so no dictionary is ever shared
+    by two threads while it is being written.
+
+    Signals:
+        progress(str): A description of the loading progress for a status bar.
+        clients_loaded(dict, ClientSearchIndex): The clients and their search index.
+        accounts_loaded(dict): A batch of accounts keyed by account number.
+        finished(int, int): The number of clients and accounts loaded.
+
+    Methods:
+        start(): Starts loading on a new thread.
+        stop(): Stops loading and waits for the thread to end.
+        run(): Loads the data on the calling thread.
+    """
+    progress = Signal(str)
+    clients_loaded = Signal(object, object)
+    accounts_loaded = Signal(object)
+    finished = Signal(int, int)
+
+    def __init__(self, search_index: ClientSearchIndex = None):
+        """
+        Initializes the loader.
+
+        Args:
+            search_index (ClientSearchIndex): The index to build while the clients are
+                loaded. A new index is created if none is given.
+        """
+        super().__init__()
+        self.__search_index = search_index if search_index is not None else ClientSearchIndex()
+        self.__thread = None
+        self.__stopped = False
+        self.__accounts_loaded = 0
+
+    @property
+    def search_index(self) -> ClientSearchIndex:
+        """Returns the index built while the clients are loaded."""
+        return self.__search_index
+
+    def start(self) -> None:
+        """Starts loading on a new thread; the signals are delivered to the receivers' threads."""
+        self.__thread = QThread()
+        self.moveToThread(self.__thread)
+        self.__thread.started.connect(self.run)
+        self.finished.connect(self.__thread.quit)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stops loading at the next progress report and waits for the thread to end."""
+        self.__stopped = True
+        if self.__thread is not None:
+            self.__thread.quit()
+            self.__thread.wait()
+
+    @Slot()
+    def run(self) -> None:
+        """Loads the clients, then the accounts, emitting the signals as it goes."""
+        self.progress.emit("Loading clients...")
+        client_listing = load_clients(self.__search_index, self.__on_clients_progress)
+        if self.__stopped:
+            return
+        self.clients_loaded.emit(client_listing, self.__search_index)
+
+        self.progress.emit(f"Loaded {len(client_listing):,} clients. Loading accounts...")
+        load_accounts(client_listing, self.__on_accounts_progress)
+        if self.__stopped:
+            return
+        self.finished.emit(len(client_listing), self.__accounts_loaded)
+
+    def __on_clients_progress(self, rows_read: int) -> bool:
+        """Reports the clients read so far; returns False once the loader is stopped."""
+        if self.__stopped:
+            return False
+        self.progress.emit(f"Loading clients... {rows_read:,} read")
+        return True
+
+    def __on_accounts_progress(self, rows_read: int, batch: dict) -> bool:
+        """Hands over a batch of accounts; returns False once the loader is stopped."""
+        if self.__stopped:
+            return False
+        if batch:
+            self.__accounts_loaded += len(batch)
+            self.accounts_loaded.emit(batch)
+        self.progress.emit(f"Lookup ready. Loading accounts... {rows_read:,} read")
+        return True
@@ -13,6 +13,7 @@ from datetime import datetime
 import logging
 from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount, BankAccount
 from client.client import Client
+from client.client_search_index import ClientSearchIndex
 
 # *******************************************************************************
 # GIVEN LOGGING AND FILE ACCESS CODE
@@ -46,21 +47,50 @@ accounts_csv_path = os.path.join(data_dir, 'accounts.csv')
 # END GIVEN LOGGING AND FILE ACCESS CODE
 # *******************************************************************************
 
-def load_data() -> tuple[dict, dict]:
+# Number of rows read between progress reports
+PROGRESS_INTERVAL = 10000
+
+def load_data(search_index: ClientSearchIndex = None) -> tuple[dict, dict]:
     """
     Populates a client dictionary and an account dictionary with 
     corresponding data from files within the data directory.
+    Args:
+        search_index (ClientSearchIndex): An index to add each client to as it is
+            loaded. Clients no longer in the file are removed from it.
     Returns:
         tuple containing client dictionary and account dictionary.
     """
+    client_listing = load_clients(search_index)
+    accounts = load_accounts(client_listing)
+
+    # RETURN STATEMENT
+    return client_listing, accounts
+
+
+def load_clients(search_index: ClientSearchIndex = None, progress=None) -> dict:
+    """
+    Populates a client dictionary from the clients file within the data directory.
+    Args:
+        search_index (ClientSearchIndex): An index to add each client to as it is
+            loaded. Clients no longer in the file are removed from it.
+        progress (callable): Called with the number of rows read every
+            PROGRESS_INTERVAL rows and once at the end. Returning False stops reading;
+            the clients read so far are returned without the final call, and the
+            index keeps the clients it held.
+    Returns:
+        dict: The clients keyed by client number.
+    """
     client_listing = {}
-    accounts = {}
+    rows_read = 0
 
     # READ CLIENT DATA 
     try:
         with open(clients_csv_path, newline='') as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
+                rows_read += 1
+                if progress is not None and rows_read % PROGRESS_INTERVAL == 0 and progress(rows_read) is False:
+                    return client_listing
                 try:
                     client_number = int(row['client_number'])
                     client = Client(
@@ -70,6 +100,8 @@ def load_data() -> tuple[dict, dict]:
                         email_address=row['email_address']
                     )
                     client_listing[client_number] = client
+                    if search_index is not None:
+                        search_index.add(client)
                 except Exception as e:
                     logging.error(f"Unable to create client: {e}")
     except FileNotFoundError as e:
@@ -77,11 +109,40 @@ def load_data() -> tuple[dict, dict]:
     except Exception as e:
         logging.error(f"Error reading client data: {e}")
 
+    if search_index is not None:
+        search_index.retain(client_listing)
+    if progress is not None:
+        progress(rows_read)
+
+    return client_listing
+
+
+def load_accounts(client_listing: dict, progress=None) -> dict:
+    """
+    Populates an account dictionary from the accounts file within the data directory.
+    Args:
+        client_listing (dict): The loaded clients; accounts of other clients are skipped.
+        progress (callable): Called every PROGRESS_INTERVAL rows and once at the end
+            with the number of rows read and a dictionary of the accounts loaded
+            since the previous call. Returning False stops reading; the accounts
+            read so far are returned without the final call.
+    Returns:
+        dict: The bank accounts keyed by account number.
+    """
+    accounts = {}
+    batch = {}
+    rows_read = 0
+
     # READ ACCOUNT DATA
     try:
         with open(accounts_csv_path, newline='') as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
+                rows_read += 1
+                if progress is not None and rows_read % PROGRESS_INTERVAL == 0:
+                    if progress(rows_read, batch) is False:
+                        return accounts
+                    batch = {}
                 try:
                     account_number = int(row['account_number'])
                     client_number = int(row['client_number'])
@@ -120,6 +181,7 @@ def load_data() -> tuple[dict, dict]:
 
                     if client_number in client_listing:
                         accounts[account_number] = account
+                        batch[account_number] = account
                     else:
                         logging.error(f"Bank Account: {account_number} contains invalid Client Number: {client_number}")
 
@@ -132,8 +194,10 @@ def load_data() -> tuple[dict, dict]:
     except Exception as e:
         logging.error(f"Error reading account data: {e}")
 
-    # RETURN STATEMENT
-    return client_listing, accounts
+    if progress is not None:
+        progress(rows_read, batch)
+
+    return accounts
 
 
 def update_data(updated_account: BankAccount) -> None:
@@ -164,6 +228,46 @@ def update_data(updated_account: BankAccount) -> None:
         writer.writerows(updated_rows)
 
 
+def update_data_batch(updated_accounts) -> int:
+    """
+    A function to update the accounts.csv file with the balances of
+    many bank accounts in a single pass over the file.
+    The file is rewritten through a temporary file so that readers
+    never see a partially written file.
+    Args:
+        updated_accounts: An iterable of bank accounts containing updated balances.
+    Returns:
+        int: The number of rows that were updated.
+    """
+    new_balances = {account.account_number: account.balance for account in updated_accounts}
+    updated_rows = []
+    updated_count = 0
+
+    with open(accounts_csv_path, mode='r', newline='') as file:
+        reader = csv.DictReader(file)
+        fields = reader.fieldnames
+
+        for row in reader:
+            try:
+                account_number = int(row['account_number'])
+            except ValueError:
+                account_number = None
+            if account_number in new_balances:
+                row['balance'] = new_balances[account_number]
+                updated_count += 1
+            updated_rows.append(row)
+
+    # Write the updated data to a temporary file and swap it in
+    temp_path = accounts_csv_path + '.tmp'
+    with open(temp_path, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(updated_rows)
+    os.replace(temp_path, accounts_csv_path)
+
+    return updated_count
+
+
 # GIVEN TESTING SECTION:
 if __name__ == "__main__":
     clients, accounts = load_data()
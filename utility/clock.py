@@ -0,0 +1,136 @@
+"""
+Description: This module defines the Clock class, the shared source of the current date and time
+for fee, account and notification code.
+Author: Lovedeep Singh Sidhu
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+# Number of days treated as ten years by the management fee rules
+TEN_YEARS_IN_DAYS = 10 * 365.25
+
+class Clock:
+    """
+    A class to represent the clock shared by the application.
+
+    The current date is cached and only recomputed once the clock passes midnight,
+    and date thresholds derived from it (such as "ten years ago") are cached until
+    the date changes. The clock can be frozen at a fixed moment for deterministic
+    tests and benchmarks.
+
+    Methods:
+        now(self) -> datetime:
+            Returns the current date and time.
+        time(self) -> float:
+            Returns the current time in seconds since the epoch.
+        today(self) -> date:
+            Returns the current date.
+        days_ago(self, days) -> date:
+            Returns the date the given number of days before today.
+        freeze(self, moment=None) -> None:
+            Stops the clock at a moment.
+        advance(self, **delta) -> None:
+            Moves a frozen clock forward.
+        unfreeze(self) -> None:
+            Lets the clock follow real time again.
+    """
+
+    def __init__(self):
+        """Initializes the Clock following real time."""
+        self.__frozen_at = None
+        self.__today = None
+        self.__next_midnight = 0.0
+        self.__thresholds = {}
+
+    @property
+    def is_frozen(self) -> bool:
+        """Returns True if the clock is stopped at a fixed moment."""
+        return self.__frozen_at is not None
+
+    def now(self) -> datetime:
+        """Returns the current date and time."""
+        if self.__frozen_at is not None:
+            return self.__frozen_at
+        return datetime.now()
+
+    def time(self) -> float:
+        """Returns the current time in seconds since the epoch."""
+        if self.__frozen_at is not None:
+            return self.__frozen_at.timestamp()
+        return time.time()
+
+    def today(self) -> date:
+        """Returns the current date, recomputed only when midnight has passed."""
+        if self.__frozen_at is None and time.time() < self.__next_midnight:
+            return self.__today
+
+        current = self.now()
+        today = current.date()
+        if today != self.__today:
+            self.__today = today
+            self.__thresholds = {}
+        if self.__frozen_at is None:
+            self.__next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return today
+
+    def days_ago(self, days: float) -> date:
+        """
+        Returns the date the given number of days before today.
+
+        Args:
+            days (float): Number of days; fractions of a day are ignored as in date arithmetic.
+
+        Returns:
+            date: The date, cached until the current date changes.
+        """
+        today = self.today()
+        threshold = self.__thresholds.get(days)
+        if threshold is None:
+            threshold = self.__thresholds[days] = today - timedelta(days=days)
+        return threshold
+
+    def freeze(self, moment: datetime = None) -> None:
+        """
+        Stops the clock at a moment.
+
+        Args:
+            moment (datetime): The moment to stop at. Defaults to the current moment.
+
+        Raises:
+            ValueError: If the moment is not a datetime.
+        """
+        moment = moment or datetime.now()
+        if not isinstance(moment, datetime):
+            raise ValueError("Clock can only be frozen at a datetime.")
+        self.__frozen_at = moment
+        self.__next_midnight = 0.0
+
+    def advance(self, **delta) -> None:
+        """
+        Moves a frozen clock forward by a timedelta given as keyword arguments.
+
+        Raises:
+            ValueError: If the clock is not frozen.
+        """
+        if self.__frozen_at is None:
+            raise ValueError("Only a frozen clock can be advanced.")
+        self.__frozen_at += timedelta(**delta)
+
+    def unfreeze(self) -> None:
+        """Lets the clock follow real time again."""
+        self.__frozen_at = None
+        self.__next_midnight = 0.0
+
+    @contextmanager
+    def frozen(self, moment: datetime = None):
+        """Freezes the clock for the duration of a with block."""
+        self.freeze(moment)
+        try:
+            yield self
+        finally:
+            self.unfreeze()
+
+# Clock shared by the whole application
+clock = Clock()
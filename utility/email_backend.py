@@ -0,0 +1,66 @@
+"""
+Description: This module defines the EmailBackend interface that client notifications are
+delivered through, and the functions that choose the backend in use. The file outbox is the
+default backend.
+Author: Lovedeep Singh Sidhu
+"""
+
+from abc import ABC, abstractmethod
+
+class EmailBackend(ABC):
+    """
+    This is the EmailBackend interface, outlining how notification emails are
+    delivered. Backends may buffer messages; flush() delivers everything sent so far
+    and close() also releases the backend's files or connections.
+    """
+
+    @abstractmethod
+    def send(self, email_address: str, subject: str, message: str) -> None:
+        """
+        Delivers, or queues for delivery, one email.
+
+        Args:
+            email_address (str): The recipient.
+            subject (str): The subject line.
+            message (str): The message body.
+        """
+        pass
+
+    def flush(self) -> None:
+        """Delivers any buffered messages."""
+        pass
+
+    def close(self) -> None:
+        """Delivers any buffered messages and releases the backend's resources."""
+        self.flush()
+
+# The backend in use; None until first use, meaning the shared file outbox
+_backend = None
+
+def get_email_backend() -> EmailBackend:
+    """
+    Returns the backend client notifications are delivered through.
+
+    Returns:
+        EmailBackend: The backend set with set_email_backend(), or the shared file outbox.
+    """
+    if _backend is None:
+        # Imported here because the outbox module depends on this one
+        from utility.email_outbox import outbox
+        return outbox
+    return _backend
+
+def set_email_backend(backend: EmailBackend) -> None:
+    """
+    Sets the backend client notifications are delivered through.
+
+    Args:
+        backend (EmailBackend): The backend, or None for the shared file outbox.
+
+    Raises:
+        ValueError: If backend is not an EmailBackend.
+    """
+    global _backend
+    if backend is not None and not isinstance(backend, EmailBackend):
+        raise ValueError("Email backend must be an EmailBackend.")
+    _backend = backend
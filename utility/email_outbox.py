@@ -0,0 +1,365 @@
+"""
+Description: This module defines the EmailOutbox class, a long-lived writer for the simulated
+email outbox that keeps the file open, writes messages in buffered batches, rotates the file into
+numbered segments and keeps an index of each recipient's messages.
+Author: Lovedeep Singh Sidhu
+"""
+
+import os
+import re
+import csv
+import gzip
+import atexit
+import locale
+import shutil
+import threading
+from datetime import date
+from utility.clock import clock
+from utility.email_backend import EmailBackend
+
+INDEX_FIELDS = ["email_address", "segment", "offset", "length"]
+
+class EmailOutbox(EmailBackend):
+    """
+    A class to represent the simulated email outbox, the default email backend.
+
+    Messages are written in the same format as simulate_send_email, but the outbox
+    file is opened once and messages are buffered in memory. The buffer is written
+    when it reaches max_bytes, when the oldest buffered message is max_delay seconds
+    old, on flush(), and on close(), which also runs when the program exits.
+
+    The outbox file is the active segment. When it would grow past max_segment_bytes,
+    or when the date changes if rotate_daily is set, it is closed and renamed to a
+    numbered segment (observer_emails.000001.txt, ...), which is gzipped if compress
+    is set. A side index records the segment, byte offset and length of every
+    message by recipient, so history() reads one client's messages directly. The
+    index rotates with the segments: when a segment is closed its rows are sorted
+    by recipient into an index file of its own (observer_emails.000001.index.csv),
+    gzipped along with the segment. history() reads the index files once and then
+    keeps the locations in memory as messages are written.
+
+    Attributes:
+        path (str): The active outbox file.
+        max_bytes (int): The buffer size that triggers a write.
+        max_delay (float): The longest time in seconds a message stays buffered.
+        max_segment_bytes (int): The size at which the active segment is rotated, or None.
+        rotate_daily (bool): Whether the active segment is rotated when the date changes.
+        compress (bool): Whether closed segments are gzipped.
+        segment (int): The number the active segment will have once it is closed.
+
+    Methods:
+        send(self, email_address, subject, message):
+            Adds a 'simulated' email to the outbox.
+        flush(self):
+            Writes the buffered messages to the outbox file.
+        close(self):
+            Flushes the outbox and closes the file.
+        rotate(self):
+            Closes the active segment and starts a new one.
+        history(self, email_address) -> list[str]:
+            Returns the messages sent to a recipient, oldest first.
+    """
+
+    def __init__(self, path: str = os.path.join("output", "observer_emails.txt"),
+                 max_bytes: int = 64 * 1024, max_delay: float = 1.0,
+                 max_segment_bytes: int = 64 * 1024 * 1024, rotate_daily: bool = False, compress: bool = False):
+        """
+        Initializes the outbox. The file is opened when the first message is sent.
+
+        Args:
+            path (str): The active outbox file.
+            max_bytes (int): The buffer size that triggers a write.
+            max_delay (float): The longest time in seconds a message stays buffered.
+            max_segment_bytes (int): The size at which the active segment is rotated, or None.
+            rotate_daily (bool): Whether the active segment is rotated when the date changes.
+            compress (bool): Whether closed segments are gzipped.
+
+        Raises:
+            ValueError: If a threshold is not positive.
+        """
+        if max_bytes <= 0 or max_delay <= 0 or (max_segment_bytes is not None and max_segment_bytes <= 0):
+            raise ValueError("Outbox thresholds must be positive.")
+
+        self.__path = path
+        self.__max_bytes = max_bytes
+        self.__max_delay = max_delay
+        self.__max_segment_bytes = max_segment_bytes
+        self.__rotate_daily = rotate_daily
+        self.__compress = compress
+
+        stem, extension = os.path.splitext(path)
+        self.__stem = stem
+        self.__extension = extension
+        self.__index_path = f"{stem}.index.csv"
+        self.__segment = None
+        self.__segment_date = None
+        self.__locations = None
+
+        self.__file = None
+        self.__index_file = None
+        self.__encoding = locale.getpreferredencoding(False)
+        self.__buffer = []
+        self.__buffered_bytes = 0
+        self.__timer = None
+        self.__lock = threading.Lock()
+        atexit.register(self.close)
+
+    @property
+    def path(self) -> str:
+        """Returns the active outbox file."""
+        return self.__path
+
+    @property
+    def max_bytes(self) -> int:
+        """Returns the buffer size that triggers a write."""
+        return self.__max_bytes
+
+    @property
+    def max_delay(self) -> float:
+        """Returns the longest time in seconds a message stays buffered."""
+        return self.__max_delay
+
+    @property
+    def max_segment_bytes(self) -> int:
+        """Returns the size at which the active segment is rotated, or None."""
+        return self.__max_segment_bytes
+
+    @property
+    def rotate_daily(self) -> bool:
+        """Returns whether the active segment is rotated when the date changes."""
+        return self.__rotate_daily
+
+    @property
+    def compress(self) -> bool:
+        """Returns whether closed segments are gzipped."""
+        return self.__compress
+
+    @property
+    def segment(self) -> int:
+        """Returns the number the active segment will have once it is closed."""
+        with self.__lock:
+            return self.__active_segment()
+
+    def send(self, email_address: str, subject: str, message: str) -> None:
+        """
+        Adds a 'simulated' email to the outbox.
+
+        Args:
+            email_address (str): The email address to which the 'simulated' message is sent.
+            subject (str): The subject line for the 'simulated' message.
+            message (str): The message body for the 'simulated' message.
+        """
+        entry = f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n"
+        with self.__lock:
+            self.__buffer.append((email_address, entry))
+            self.__buffered_bytes += len(entry)
+            if self.__buffered_bytes >= self.__max_bytes:
+                self.__write()
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__max_delay, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def flush(self) -> None:
+        """Writes the buffered messages to the outbox file."""
+        with self.__lock:
+            self.__write()
+
+    def close(self) -> None:
+        """Flushes the outbox and closes the file. A later send() reopens it."""
+        with self.__lock:
+            self.__write()
+            self.__close_files()
+
+    def rotate(self) -> None:
+        """Writes the buffered messages, then closes the active segment and starts a new one."""
+        with self.__lock:
+            self.__write()
+            self.__rotate()
+
+    def history(self, email_address: str) -> list[str]:
+        """
+        Returns the messages sent to a recipient, oldest first, using the index.
+
+        Args:
+            email_address (str): The recipient.
+
+        Returns:
+            list[str]: Each message in the outbox format.
+        """
+        with self.__lock:
+            self.__write()
+            if self.__locations is None:
+                self.__locations = self.__load_locations()
+
+            locations = {}
+            for segment, offset, length in self.__locations.get(email_address, []):
+                locations.setdefault(segment, []).append((offset, length))
+
+            active = self.__active_segment()
+            messages = []
+            for segment in sorted(locations):
+                with self.__open_segment(segment, active) as file:
+                    for offset, length in locations[segment]:
+                        file.seek(offset)
+                        # Segments hold the platform's line endings, as simulate_send_email writes them
+                        messages.append(file.read(length).decode(self.__encoding).replace(os.linesep, "\n"))
+            return messages
+
+    def __write(self) -> None:
+        """Writes the buffer to the active segment and the index. Called with the lock held."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.__buffer:
+            return
+
+        self.__open_files()
+        if self.__rotate_daily and self.__segment_date != clock.today():
+            self.__rotate()
+            self.__open_files()
+
+        chunk = []
+        rows = []
+        offset = os.path.getsize(self.__path)
+        for email_address, entry in self.__buffer:
+            entry = entry.replace("\n", os.linesep)
+            length = len(entry.encode(self.__encoding))
+            if self.__max_segment_bytes is not None and offset and offset + length > self.__max_segment_bytes:
+                self.__write_chunk(chunk, rows)
+                chunk, rows = [], []
+                self.__rotate()
+                self.__open_files()
+                offset = 0
+            chunk.append(entry)
+            rows.append((email_address, self.__segment, offset, length))
+            offset += length
+        self.__write_chunk(chunk, rows)
+
+        self.__buffer.clear()
+        self.__buffered_bytes = 0
+
+    def __write_chunk(self, chunk: list, rows: list) -> None:
+        """Writes messages and their index rows. Called with the lock held."""
+        if not chunk:
+            return
+        self.__file.write("".join(chunk))
+        self.__file.flush()
+        csv.writer(self.__index_file).writerows(rows)
+        self.__index_file.flush()
+        if self.__locations is not None:
+            for email_address, segment, offset, length in rows:
+                self.__locations.setdefault(email_address, []).append((segment, offset, length))
+
+    def __open_files(self) -> None:
+        """Opens the active segment and the index if they are closed. Called with the lock held."""
+        if self.__file is not None:
+            return
+        os.makedirs(os.path.dirname(self.__path) or ".", exist_ok=True)
+        self.__active_segment()
+        if self.__segment_date is None:
+            # An active segment left by an earlier run belongs to the day it was last written
+            self.__segment_date = (date.fromtimestamp(os.path.getmtime(self.__path))
+                                   if os.path.exists(self.__path) else clock.today())
+        # Line endings are written by send() so that byte offsets can be counted exactly
+        self.__file = open(self.__path, "a", newline='')
+        self.__encoding = self.__file.encoding
+
+        new_index = not os.path.exists(self.__index_path)
+        self.__index_file = open(self.__index_path, "a", newline='')
+        if new_index:
+            csv.writer(self.__index_file).writerow(INDEX_FIELDS)
+
+    def __close_files(self) -> None:
+        """Closes the active segment and the index. Called with the lock held."""
+        for file in (self.__file, self.__index_file):
+            if file is not None:
+                file.close()
+        self.__file = None
+        self.__index_file = None
+
+    def __rotate(self) -> None:
+        """Renames the active segment to its number and starts the next one. Called with the lock held."""
+        self.__close_files()
+        segment = self.__active_segment()
+        if os.path.exists(self.__path) and os.path.getsize(self.__path):
+            closed_path = self.__segment_path(segment)
+            os.replace(self.__path, closed_path)
+            closed_index_path = self.__compact_index(segment)
+            if self.__compress:
+                for path in (closed_path, closed_index_path):
+                    with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                        shutil.copyfileobj(source, target)
+                    os.remove(path)
+            self.__segment = segment + 1
+        self.__segment_date = clock.today()
+
+    def __active_segment(self) -> int:
+        """Returns the number of the active segment, found from the closed segments on first use."""
+        if self.__segment is None:
+            pattern = re.compile(re.escape(os.path.basename(self.__stem)) + r"\.(\d+)" + re.escape(self.__extension))
+            directory = os.path.dirname(self.__path) or "."
+            numbers = [int(match.group(1)) for match in
+                       (pattern.match(name) for name in (os.listdir(directory) if os.path.isdir(directory) else []))
+                       if match]
+            self.__segment = max(numbers, default=0) + 1
+        return self.__segment
+
+    def __compact_index(self, segment: int) -> str:
+        """Moves the active index to the closed segment's index, sorted by recipient. Called with the lock held."""
+        rows = []
+        if os.path.exists(self.__index_path):
+            with open(self.__index_path, newline='') as file:
+                rows = list(csv.DictReader(file))
+        # The sort is stable, so each recipient's messages stay oldest first
+        rows.sort(key=lambda row: row["email_address"])
+
+        closed_index_path = self.__segment_index_path(segment)
+        with open(closed_index_path, "w", newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=INDEX_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        if os.path.exists(self.__index_path):
+            os.remove(self.__index_path)
+        return closed_index_path
+
+    def __load_locations(self) -> dict:
+        """Reads every index file into a map of recipient to message locations. Called with the lock held."""
+        pattern = re.compile(re.escape(os.path.basename(self.__stem)) + r"\.(\d+)\.index\.csv(\.gz)?$")
+        directory = os.path.dirname(self.__path) or "."
+        names = sorted(name for name in (os.listdir(directory) if os.path.isdir(directory) else [])
+                       if pattern.match(name))
+        paths = [os.path.join(directory, name) for name in names]
+        if os.path.exists(self.__index_path):
+            paths.append(self.__index_path)
+
+        locations = {}
+        for path in paths:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rt", newline='') as file:
+                for row in csv.DictReader(file):
+                    locations.setdefault(row["email_address"], []).append(
+                        (int(row["segment"]), int(row["offset"]), int(row["length"])))
+        for entries in locations.values():
+            entries.sort()
+        return locations
+
+    def __segment_path(self, segment: int) -> str:
+        """Returns the path of a closed segment before compression."""
+        return f"{self.__stem}.{segment:06d}{self.__extension}"
+
+    def __segment_index_path(self, segment: int) -> str:
+        """Returns the path of a closed segment's index before compression."""
+        return f"{self.__stem}.{segment:06d}.index.csv"
+
+    def __open_segment(self, segment: int, active: int):
+        """Opens a segment for reading, whether active, plain or gzipped."""
+        if segment == active:
+            return open(self.__path, "rb")
+        closed_path = self.__segment_path(segment)
+        if os.path.exists(closed_path):
+            return open(closed_path, "rb")
+        return gzip.open(closed_path + ".gz", "rb")
+
+# The outbox shared by all clients
+outbox = EmailOutbox()
@@ -0,0 +1,328 @@
+"""
+Description: This module defines the SMTPBackend class, an email backend that delivers client
+notifications to an SMTP server over a pool of persistent connections, in batches, retrying
+failed batches with exponential backoff.
+Author: Lovedeep Singh Sidhu
+"""
+
+import atexit
+import logging
+import queue
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from utility.email_backend import EmailBackend
+
+class SMTPBackend(EmailBackend):
+    """
+    A class to represent delivery of notification emails over SMTP.
+
+    Messages are buffered and delivered batch_size at a time, or once the oldest
+    buffered message is max_delay seconds old. send() only queues the message: full
+    batches are handed to up to pool_size background sender threads, so the thread
+    of the transaction that sent the email never waits on the network or on a
+    retry. Each sender delivers a batch over one connection taken from a pool of
+    persistent connections, so a batch costs one SMTP session instead of one per
+    message. An idle connection is checked with NOOP before it
+    is reused. If a batch fails part way the connection is dropped and the unsent
+    messages are retried on a new connection after a backoff that doubles with
+    every attempt. Messages the server refuses outright, with a 5xx reply, are
+    counted as failed and the rest of the batch is sent.
+
+    Attributes:
+        host (str): The SMTP server.
+        port (int): The SMTP port.
+        sender (str): The From address.
+        batch_size (int): The number of messages delivered together.
+        max_delay (float): The longest time in seconds a message stays buffered.
+        pool_size (int): The number of sender threads, and so the largest number of open connections.
+        retries (int): The number of retries of a failed batch.
+        backoff (float): The wait in seconds before the first retry.
+        sent (int): The number of messages delivered.
+        failed (int): The number of messages given up on.
+
+    Methods:
+        send(self, email_address, subject, message):
+            Queues an email, delivering a batch when the buffer is full.
+        flush(self):
+            Delivers every buffered message and waits until it has been sent.
+        close(self):
+            Delivers every buffered message and closes the connections.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 25, sender: str = "alerts@pixell-river.com",
+                 batch_size: int = 50, max_delay: float = 1.0, pool_size: int = 4, retries: int = 3,
+                 backoff: float = 0.5, timeout: float = 10.0, username: str = None, password: str = None,
+                 starttls: bool = False, connection_factory=None):
+        """
+        Initializes the backend. Connections are opened when the first batch is delivered.
+
+        Args:
+            host (str): The SMTP server.
+            port (int): The SMTP port.
+            sender (str): The From address.
+            batch_size (int): The number of messages delivered together.
+            max_delay (float): The longest time in seconds a message stays buffered.
+            pool_size (int): The number of sender threads, and so the largest number of open connections.
+            retries (int): The number of retries of a failed batch.
+            backoff (float): The wait in seconds before the first retry.
+            timeout (float): The socket timeout of each connection.
+            username (str): The login user, or None to skip authentication.
+            password (str): The login password.
+            starttls (bool): Whether to upgrade connections with STARTTLS.
+            connection_factory (callable): Opens a connection given host, port and timeout.
+                Defaults to smtplib.SMTP.
+
+        Raises:
+            ValueError: If a size or the retry settings are invalid.
+        """
+        if batch_size < 1 or pool_size < 1:
+            raise ValueError("Batch and pool sizes must be positive.")
+        if max_delay <= 0:
+            raise ValueError("Maximum delay must be positive.")
+        if retries < 0 or backoff < 0:
+            raise ValueError("Retries and backoff cannot be negative.")
+
+        self.__host = host
+        self.__port = port
+        self.__sender = sender
+        self.__batch_size = batch_size
+        self.__max_delay = max_delay
+        self.__pool_size = pool_size
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__timeout = timeout
+        self.__username = username
+        self.__password = password
+        self.__starttls = starttls
+        self.__connection_factory = connection_factory or smtplib.SMTP
+
+        self.__buffer = []
+        self.__buffer_lock = threading.Lock()
+        self.__timer = None
+        self.__idle = queue.LifoQueue()
+        self.__batches = queue.Queue()
+        self.__senders = []
+        self.__count_lock = threading.Lock()
+        self.__sent = 0
+        self.__failed = 0
+        atexit.register(self.close)
+
+    @property
+    def host(self) -> str:
+        """Returns the SMTP server."""
+        return self.__host
+
+    @property
+    def port(self) -> int:
+        """Returns the SMTP port."""
+        return self.__port
+
+    @property
+    def sender(self) -> str:
+        """Returns the From address."""
+        return self.__sender
+
+    @property
+    def batch_size(self) -> int:
+        """Returns the number of messages delivered together."""
+        return self.__batch_size
+
+    @property
+    def max_delay(self) -> float:
+        """Returns the longest time in seconds a message stays buffered."""
+        return self.__max_delay
+
+    @property
+    def pool_size(self) -> int:
+        """Returns the number of sender threads, and so the largest number of open connections."""
+        return self.__pool_size
+
+    @property
+    def retries(self) -> int:
+        """Returns the number of retries of a failed batch."""
+        return self.__retries
+
+    @property
+    def backoff(self) -> float:
+        """Returns the wait in seconds before the first retry."""
+        return self.__backoff
+
+    @property
+    def sent(self) -> int:
+        """Returns the number of messages delivered."""
+        return self.__sent
+
+    @property
+    def failed(self) -> int:
+        """Returns the number of messages given up on."""
+        return self.__failed
+
+    def send(self, email_address: str, subject: str, message: str) -> None:
+        """
+        Queues an email, handing a batch to the senders when batch_size messages are waiting.
+
+        Args:
+            email_address (str): The recipient.
+            subject (str): The subject line.
+            message (str): The message body.
+        """
+        email = EmailMessage()
+        email["From"] = self.__sender
+        email["To"] = email_address
+        email["Subject"] = subject
+        email.set_content(message)
+
+        with self.__buffer_lock:
+            self.__buffer.append(email)
+            if len(self.__buffer) < self.__batch_size:
+                if self.__timer is None:
+                    self.__timer = threading.Timer(self.__max_delay, self.__on_timer)
+                    self.__timer.daemon = True
+                    self.__timer.start()
+                return
+            self.__enqueue(self.__take_buffer())
+
+    def flush(self) -> None:
+        """Delivers every buffered message, batch_size at a time, and waits until all have been sent."""
+        with self.__buffer_lock:
+            pending = self.__take_buffer()
+            for start in range(0, len(pending), self.__batch_size):
+                self.__enqueue(pending[start:start + self.__batch_size])
+        self.__batches.join()
+
+    def close(self) -> None:
+        """Delivers every buffered message, stops the senders and closes the pooled connections."""
+        self.flush()
+        with self.__buffer_lock:
+            senders = self.__senders
+            self.__senders = []
+            for _ in senders:
+                self.__batches.put(None)
+        for sender in senders:
+            sender.join()
+        while True:
+            try:
+                connection = self.__idle.get_nowait()
+            except queue.Empty:
+                break
+            self.__disconnect(connection)
+
+    def __take_buffer(self) -> list:
+        """Empties the buffer and stops its timer. Called with the buffer lock held."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        batch = self.__buffer
+        self.__buffer = []
+        return batch
+
+    def __on_timer(self) -> None:
+        """Hands the buffered messages to the senders once the oldest is max_delay seconds old."""
+        with self.__buffer_lock:
+            self.__timer = None
+            pending = self.__take_buffer()
+            for start in range(0, len(pending), self.__batch_size):
+                self.__enqueue(pending[start:start + self.__batch_size])
+
+    def __enqueue(self, batch: list) -> None:
+        """Hands a batch to the senders, starting them on first use. Called with the buffer lock held."""
+        if not batch:
+            return
+        if not self.__senders:
+            for number in range(self.__pool_size):
+                sender = threading.Thread(target=self.__run_sender, name=f"smtp-sender-{number}", daemon=True)
+                sender.start()
+                self.__senders.append(sender)
+        self.__batches.put(batch)
+
+    def __run_sender(self) -> None:
+        """Delivers queued batches until it takes the stop marker."""
+        while True:
+            batch = self.__batches.get()
+            try:
+                if batch is None:
+                    return
+                self.__deliver(batch)
+            except Exception as e:
+                # A sender must outlive any one batch
+                logging.error(f"Unable to deliver {len(batch)} emails: {e}")
+            finally:
+                self.__batches.task_done()
+
+    def __deliver(self, batch: list) -> None:
+        """Sends a batch over one pooled connection, retrying the unsent part with backoff."""
+        position = 0
+        attempt = 0
+        connection = None
+        while position < len(batch):
+            try:
+                if connection is None:
+                    connection = self.__acquire()
+                while position < len(batch):
+                    try:
+                        connection.send_message(batch[position])
+                        self.__count(sent=1)
+                    except smtplib.SMTPRecipientsRefused as e:
+                        # The server will not take this message however often it is sent
+                        logging.error(f"Email to {batch[position]['To']} refused: {e}")
+                        self.__count(failed=1)
+                    except smtplib.SMTPResponseException as e:
+                        if e.smtp_code < 500:
+                            raise
+                        # A permanent error rejects this message; the session is still usable
+                        logging.error(f"Email to {batch[position]['To']} rejected: {e}")
+                        self.__count(failed=1)
+                    position += 1
+            except (smtplib.SMTPException, OSError) as e:
+                self.__disconnect(connection)
+                connection = None
+                unsent = len(batch) - position
+                if attempt >= self.__retries:
+                    logging.error(f"Giving up on {unsent} emails after {attempt + 1} attempts: {e}")
+                    self.__count(failed=unsent)
+                    return
+                time.sleep(self.__backoff * 2 ** attempt)
+                attempt += 1
+        if connection is not None:
+            self.__idle.put(connection)
+
+    def __acquire(self):
+        """Returns an idle pooled connection that still answers NOOP, or opens a new one."""
+        while True:
+            try:
+                connection = self.__idle.get_nowait()
+            except queue.Empty:
+                break
+            if self.__is_alive(connection):
+                return connection
+            self.__disconnect(connection)
+        connection = self.__connection_factory(self.__host, self.__port, timeout=self.__timeout)
+        if self.__starttls:
+            connection.starttls()
+        if self.__username is not None:
+            connection.login(self.__username, self.__password)
+        return connection
+
+    def __is_alive(self, connection) -> bool:
+        """Returns whether an idle connection still answers NOOP."""
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def __disconnect(self, connection) -> None:
+        """Closes a connection, ignoring errors from one that is already broken."""
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def __count(self, sent: int = 0, failed: int = 0) -> None:
+        """Adds to the delivery counters."""
+        with self.__count_lock:
+            self.__sent += sent
+            self.__failed += failed